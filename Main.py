@@ -17,13 +17,24 @@ from laser import Laser
 from checkpoint import Beacon
 from avalanche import Avalanche
 from video_player import VideoPlayer
-from explosion import Explosion
+from explosion import Explosion, prebake_atlas
 from debris_effect import DebrisEffect
 from portal import Portal
 from ceiling_decoration import CeilingDecoration
 from hanging_light import HangingLight
 from boulder import Boulder
 from hud import HUD
+import stamp_cache
+import rotation_cache
+import text_cache
+import fog
+from blit_batch import BlitBatch
+import collision
+import pool
+import benchmark
+import profiler
+import quality
+from particles import ParticleEmitter
 
 print("--- Main.py: Starting execution ---")
 
@@ -225,7 +236,7 @@ except Exception as e:
 
 menu_bg_frames = []
 menu_frame_idx = 0
-menu_frame_timer = pygame.time.get_ticks()
+menu_frame_timer = int(gs.sim_time_ms)
 menu_gif_path = os.path.join(base_dir, "assets", "MenuBackground.gif")
 gif_frame_duration = 100
 
@@ -544,66 +555,9 @@ avalanche_obj = Avalanche(sound_effect=avalanche_rumble_sound)
 fog_layers = []
 if config.ENABLE_FOG_EFFECT:
     print("Creating procedural fog layers...")
-    for layer_conf in config.PROCEDURAL_FOG_LAYERS_CONFIG:
-        try:
-            fog_surface_width = int(config.WIDTH * 1.5)
-            fog_surface_height = layer_conf["height_on_screen"]
-            if fog_surface_width <= 0 or fog_surface_height <= 0: continue
-            layer_surface = pygame.Surface((fog_surface_width, fog_surface_height), pygame.SRCALPHA)
-            layer_surface.fill((0, 0, 0, 0))
-
-            for _ in range(layer_conf["num_main_puffs"]):
-                main_puff_center_x = random.randint(0, fog_surface_width)
-                main_puff_center_y = random.randint(int(fog_surface_height * 0.2), int(fog_surface_height * 0.8))
-                main_puff_base_radius = random.randint(layer_conf["puff_base_radius_min"],
-                                                       layer_conf["puff_base_radius_max"])
-
-                for _ in range(layer_conf["puff_sub_puffs"]):
-                    offset_x = random.randint(-main_puff_base_radius // 2, main_puff_base_radius // 2)
-                    offset_y = random.randint(-main_puff_base_radius // 3, main_puff_base_radius // 3)
-                    sub_puff_x = main_puff_center_x + offset_x
-                    sub_puff_y = main_puff_center_y + offset_y
-                    sub_puff_radius = int(
-                        main_puff_base_radius * layer_conf["puff_sub_radius_factor"] * random.uniform(0.6, 1.4))
-                    if sub_puff_radius <= 0: continue
-                    sub_puff_alpha = random.randint(layer_conf["puff_alpha_min"], layer_conf["puff_alpha_max"])
-                    puff_color_rgb = layer_conf["color"]
-
-                    ellipse_width = int(sub_puff_radius * random.uniform(1.2, 2.8))
-                    ellipse_height = int(sub_puff_radius * random.uniform(0.7, 1.7))
-                    ellipse_width = max(3, ellipse_width)
-                    ellipse_height = max(3, ellipse_height)
-
-                    temp_ellipse_surf = pygame.Surface((ellipse_width, ellipse_height), pygame.SRCALPHA)
-                    temp_ellipse_surf.fill((0, 0, 0, 0))
-                    pygame.draw.ellipse(temp_ellipse_surf, (*puff_color_rgb, sub_puff_alpha),
-                                        (0, 0, ellipse_width, ellipse_height))
-                    layer_surface.blit(temp_ellipse_surf,
-                                       (sub_puff_x - ellipse_width // 2, sub_puff_y - ellipse_height // 2))
-
-            alpha_gradient_surf = pygame.Surface((1, fog_surface_height), pygame.SRCALPHA)
-            for y_grad in range(fog_surface_height):
-                middle_band_ratio = 0.7
-                fade_pixels = (fog_surface_height * (1.0 - middle_band_ratio)) / 2.0
-                alpha_val = 255
-                if fade_pixels > 0:
-                    if y_grad < fade_pixels:
-                        alpha_val = int(255 * (y_grad / fade_pixels))
-                    elif y_grad > fog_surface_height - fade_pixels:
-                        alpha_val = int(255 * ((fog_surface_height - y_grad) / fade_pixels))
-                alpha_gradient_surf.set_at((0, y_grad), (255, 255, 255, max(0, min(255, alpha_val))))
-
-            alpha_gradient_surf = pygame.transform.scale(alpha_gradient_surf, (fog_surface_width, fog_surface_height))
-            layer_surface.blit(alpha_gradient_surf, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-
-            fog_layers.append({
-                "surface": layer_surface,
-                "y_offset_from_bottom": layer_conf["y_offset_from_bottom"],
-                "scroll_factor": layer_conf["scroll_factor"],
-                "x_pos": 0.0
-            })
-        except Exception as e:
-            print(f"Error creating procedural organic fog layer: {e}")
+    fog_layers = fog.build_fog_layers(base_dir)
+
+prebake_atlas()
 
 player_obj = None
 terrain_obj = None
@@ -761,11 +715,11 @@ def setup_tutorial_state():
         hud_manager.health_change_flash_timer = 0
 
     gs.waiting_for_death_anim_to_finish = False
-    obstacles_group.empty()
-    lasers_group.empty()
+    pool.release_group(obstacles_group)
+    pool.release_group(lasers_group)
     beacons_group.empty()
-    explosions_group.empty()
-    debris_effects_group.empty()
+    pool.release_group(explosions_group)
+    pool.release_group(debris_effects_group)
     portal_group.empty()
     ceiling_decorations_group.empty()
     hanging_lights_group.empty()
@@ -774,11 +728,11 @@ def setup_tutorial_state():
     tut_obstacle_type = IceFormation
     tut_obstacle_spawn_x = config.PLAYER_SCREEN_X + config.WIDTH // 2.5
     if tut_obstacle_type == BrokenSatellite:
-        tut_obstacle = tut_obstacle_type(tut_obstacle_spawn_x, terrain_obj, is_tutorial_obstacle=True,
-                                         crash_sound_obj=satellite_falling_sound_asset,
-                                         impact_sound_obj=satellite_impact_sound_asset)
+        tut_obstacle = pool.acquire(tut_obstacle_type, tut_obstacle_spawn_x, terrain_obj, is_tutorial_obstacle=True,
+                                    crash_sound_obj=satellite_falling_sound_asset,
+                                    impact_sound_obj=satellite_impact_sound_asset)
     else:
-        tut_obstacle = tut_obstacle_type(tut_obstacle_spawn_x, terrain_obj, is_tutorial_obstacle=True)
+        tut_obstacle = pool.acquire(tut_obstacle_type, tut_obstacle_spawn_x, terrain_obj, is_tutorial_obstacle=True)
 
     obstacles_group.add(tut_obstacle)
     tutorial_obstacle_was_present = len(obstacles_group) > 0
@@ -855,7 +809,7 @@ def reset_game_state_vars(start_playing=True, is_simple_level_setup=False):
     global final_cutscene_video_player, final_cutscene_audio_channel
     global boulder_sound_effect_channel 
 
-    current_ticks_for_reset = pygame.time.get_ticks()
+    current_ticks_for_reset = int(gs.sim_time_ms)
 
  
     if boulder_sound_effect_channel and boulder_sound_effect_channel.get_busy():
@@ -896,7 +850,9 @@ def reset_game_state_vars(start_playing=True, is_simple_level_setup=False):
         if gs.is_level_2_simple_mode:
             if level1_video_player: level1_video_player.release(); level1_video_player = None
             if level2_video_player is None and os.path.exists(video_path_level2):
-                level2_video_player = VideoPlayer(video_path_level2, (config.WIDTH, config.HEIGHT))
+                level2_video_player = VideoPlayer(video_path_level2, (config.WIDTH, config.HEIGHT),
+                                                  decode_ahead=config.VIDEO_DECODE_AHEAD_ENABLED,
+                                                  frame_cache=config.VIDEO_FRAME_CACHE_ENABLED)
 
             if level2_video_player and not level2_video_player.is_valid():
                 level2_video_player = None
@@ -906,7 +862,9 @@ def reset_game_state_vars(start_playing=True, is_simple_level_setup=False):
         else:
             if level2_video_player: level2_video_player.release(); level2_video_player = None
             if level1_video_player is None and os.path.exists(video_path_level1):
-                level1_video_player = VideoPlayer(video_path_level1, (config.WIDTH, config.HEIGHT))
+                level1_video_player = VideoPlayer(video_path_level1, (config.WIDTH, config.HEIGHT),
+                                                  decode_ahead=config.VIDEO_DECODE_AHEAD_ENABLED,
+                                                  frame_cache=config.VIDEO_FRAME_CACHE_ENABLED)
 
             if level1_video_player and not level1_video_player.is_valid():
                 level1_video_player = None
@@ -943,11 +901,11 @@ def reset_game_state_vars(start_playing=True, is_simple_level_setup=False):
         hud_manager.health_change_flash_timer = 0
 
     gs.waiting_for_death_anim_to_finish = False
-    obstacles_group.empty()
-    lasers_group.empty()
+    pool.release_group(obstacles_group)
+    pool.release_group(lasers_group)
     beacons_group.empty()
-    explosions_group.empty()
-    debris_effects_group.empty()
+    pool.release_group(explosions_group)
+    pool.release_group(debris_effects_group)
     portal_group.empty()
     ceiling_decorations_group.empty()
     hanging_lights_group.empty()
@@ -1082,33 +1040,7 @@ def reset_game_state_vars(start_playing=True, is_simple_level_setup=False):
 
 
 def wrap_text(text, font_obj, max_width):
-    words = text.split(' ')
-    lines = []
-    current_line = ""
-    if not words or words == ['']: return [""]
-
-    for word in words:
-        potential_line = current_line + (" " if current_line else "") + word
-        if font_obj.size(potential_line)[0] <= max_width:
-            current_line = potential_line
-        else:
-            if current_line:
-                lines.append(current_line)
-            current_line = word
-            if font_obj.size(current_line)[0] > max_width:
-                temp_word = ""
-                for char_idx in range(len(current_line)):
-                    if font_obj.size(temp_word + current_line[char_idx] + "..")[0] <= max_width:
-                        temp_word += current_line[char_idx]
-                    else:
-                        break
-                lines.append(temp_word + ".." if temp_word else current_line[:1] + "..")
-                current_line = ""
-
-    if current_line:
-        lines.append(current_line)
-
-    return lines if lines else [""]
+    return text_cache.wrap(text, font_obj, max_width)
 
 
 print("--- Initializing game objects and setting initial state to MENU ---")
@@ -1122,264 +1054,17 @@ last_video_frame_time_level1 = 0
 last_video_frame_time_level2 = 0
 
 world_render_surface = pygame.Surface((config.WIDTH, config.HEIGHT), pygame.SRCALPHA)
+world_blit_batch = BlitBatch()
+collision_world = collision.CollisionWorld()
 
-while running:
-    current_time_ticks = pygame.time.get_ticks()
-    dt_raw_ms = clock.tick(config.FPS)
-    time_delta_seconds = dt_raw_ms / 1000.0
-    keys_pressed = pygame.key.get_pressed()
-    if time_delta_seconds <= 0: time_delta_seconds = 1 / config.FPS
-
-    current_gs_logic = gs.get_state()
-
-    current_screen_offset_x, current_screen_offset_y = 0, 0
-    if gs.screen_shake_magnitude > 0 and gs.screen_shake_duration > 0:
-        gs.screen_shake_timer += time_delta_seconds
-        if gs.screen_shake_timer < gs.screen_shake_duration:
-            current_screen_offset_x = random.randint(-gs.screen_shake_magnitude, gs.screen_shake_magnitude)
-            current_screen_offset_y = random.randint(-gs.screen_shake_magnitude, gs.screen_shake_magnitude)
-        else:
-            gs.screen_shake_magnitude = 0
-            gs.screen_shake_duration = 0.0
-            gs.screen_shake_timer = 0.0
-
-    if current_gs_logic == gs.PLAYING and avalanche_obj and avalanche_obj.continuous_shake_magnitude > 0:
-        magnitude = int(avalanche_obj.continuous_shake_magnitude)
-        current_screen_offset_x += random.randint(-magnitude, magnitude)
-        current_screen_offset_y += random.randint(-magnitude, magnitude)
-
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT: running = False
-        current_gs_event = gs.get_state()
-
-        if current_gs_event == gs.MENU:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP: gs.menu_idx = (gs.menu_idx - 1 + len(gs.menu_options)) % len(
-                    gs.menu_options)
-                if event.key == pygame.K_DOWN: gs.menu_idx = (gs.menu_idx + 1) % len(gs.menu_options)
-                if event.key == pygame.K_RETURN:
-                    selected_option = gs.menu_options[gs.menu_idx]
-                    if selected_option == 'Start Level 1':
-                        if pygame.mixer.get_init() and pygame.mixer.music.get_busy():
-                            pygame.mixer.music.stop()
-
-                        prologue_video_file_path = os.path.join(base_dir, "assets", "Prologue.mp4")
-                        if os.path.exists(prologue_video_file_path):
-                            actual_prologue_fps = 30.0
-                            prologue_video_player = VideoPlayer(prologue_video_file_path,
-                                                                (config.WIDTH, config.HEIGHT),
-                                                                forced_fps=actual_prologue_fps)
-                            if prologue_video_player and prologue_video_player.is_valid():
-                                if prologue_audio_sound:
-                                    try:
-                                        prologue_audio_channel = prologue_audio_sound.play()
-                                    except pygame.error as e:
-                                        print(f"Could not play prologue audio: {e}")
-                                        prologue_audio_channel = None
-                                set_current_game_state(gs.PROLOGUE)
-                            else:
-                                if prologue_video_player: prologue_video_player.release()
-                                prologue_video_player = None
-                                print(f"Error loading Prologue.mp4. Skipping to tutorial.")
-                                setup_tutorial_state()
-                        else:
-                            print(f"Prologue.mp4 not found. Skipping to tutorial.")
-                            setup_tutorial_state()
-
-                    elif selected_option == 'Start Level 2':
-                        if pygame.mixer.get_init() and pygame.mixer.music.get_busy():
-                            pygame.mixer.music.stop()
-                        reset_game_state_vars(start_playing=True, is_simple_level_setup=True)
-                        print("Starting Level 2 (Simple Mode) directly.")
-                    elif selected_option == 'Controls':
-                        gs.previous_game_state_before_options = gs.MENU
-                        set_current_game_state(gs.CONTROLS)
-                    elif selected_option == 'Settings':
-                        gs.previous_game_state_before_options = gs.MENU
-                        set_current_game_state(gs.SETTINGS)
-                    elif selected_option == 'Quit':
-                        running = False
-        elif current_gs_event == gs.PROLOGUE:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_RETURN or event.key == pygame.K_ESCAPE:
-                    if hasattr(gs, 'prologue_start_time_ticks'): del gs.prologue_start_time_ticks
-                    if prologue_video_player:
-                        prologue_video_player.release()
-                        prologue_video_player = None
-                    if prologue_audio_channel and prologue_audio_channel.get_busy():
-                        prologue_audio_channel.stop()
-                    prologue_audio_channel = None
-                    setup_tutorial_state()
-
-        elif current_gs_event == gs.MID_CUTSCENE:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_RETURN or event.key == pygame.K_ESCAPE:
-                    if middle_cutscene_video_player:
-                        middle_cutscene_video_player.release()
-                        middle_cutscene_video_player = None
-                    if middle_cutscene_audio_channel and middle_cutscene_audio_channel.get_busy():
-                        middle_cutscene_audio_channel.stop()
-                    middle_cutscene_audio_channel = None
-                    reset_game_state_vars(start_playing=True, is_simple_level_setup=True)
-        elif current_gs_event == gs.WIN_CUTSCENE:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_RETURN or event.key == pygame.K_ESCAPE:
-                    if final_cutscene_video_player:
-                        final_cutscene_video_player.release()
-                        final_cutscene_video_player = None
-                    if final_cutscene_audio_channel and final_cutscene_audio_channel.get_busy():
-                        final_cutscene_audio_channel.stop()
-                    final_cutscene_audio_channel = None
-
-                    set_current_game_state(gs.CREDITS)
-                    gs.credits_scroll_y = 0.0
-                    if pygame.mixer.get_init() and soundtrack_loaded:
-                        if not pygame.mixer.music.get_busy():
-                            pygame.mixer.music.play(-1)
-                        elif pygame.mixer.music.get_volume() < gs.music_volume:
-                            pygame.mixer.music.set_volume(gs.music_volume)
-        elif current_gs_event == gs.CREDITS:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_RETURN or event.key == pygame.K_ESCAPE:
-                    reset_game_state_vars(start_playing=False)
-                    set_current_game_state(gs.MENU)
-                    if pygame.mixer.get_init() and soundtrack_loaded and not pygame.mixer.music.get_busy():
-                        pygame.mixer.music.play(-1)
-        elif current_gs_event == gs.TUTORIAL:
-            if player_obj and event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
-                    if player_obj.perform_jump():
-                        if jump_sound: jump_sound.play()
-                    gs.tutorial_jump_done = True
-                if event.key == pygame.K_f:
-                    if player_obj.bullets_remaining > 0 and current_time_ticks - gs.last_shot_time > 200 and not player_obj.is_dying_animating:
-                        to = next(iter(obstacles_group), None)
-                        if player_obj.rect:
-                            lasers_group.add(Laser(player_obj.rect.centerx, player_obj.rect.centery, to))
-                            player_obj.bullets_remaining -= 1
-                            gs.last_shot_time = current_time_ticks
-                            player_obj.start_shooting_animation()
-                        if laser_sound: laser_sound.play()
-        elif current_gs_event == gs.PLAYING:
-            if player_obj and player_obj.is_active and not gs.portal_reached and \
-                    not gs.waiting_for_death_anim_to_finish and not gs.boulder_death_sequence_active and \
-                    not gs.level2_win_sequence_active and not gs.level2_stairs_visible:
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        paused_game_surface_local = screen.copy()
-                        set_current_game_state(gs.PAUSED)
-                        for obs in obstacles_group:
-                            if isinstance(obs, BrokenSatellite):
-                                obs.pause_falling_sound()
-                     
-                        if gs.is_level_2_simple_mode and boulder_sound_effect_channel and boulder_sound_effect_channel.get_busy():
-                            print("Boulder sound: Pausing due to game pause.")
-                            boulder_sound_effect_channel.pause()
-
-                    if event.key == pygame.K_SPACE:
-                        if player_obj.perform_jump():
-                            if jump_sound: jump_sound.play()
-                    if event.key == pygame.K_f:
-                        if player_obj.bullets_remaining > 0 and current_time_ticks - gs.last_shot_time > 200 and not player_obj.is_dying_animating:
-                            to = None
-                            mds = float('inf')
-                            if player_obj.rect:
-                                if not gs.is_level_2_simple_mode or \
-                                        (gs.is_level_2_simple_mode and any(
-                                            isinstance(o, BugObstacle) for o in obstacles_group)):
-                                    eo = [o for o in obstacles_group if
-                                          o.rect.centerx > player_obj.rect.centerx + 5 and abs(
-                                              o.rect.centery - player_obj.rect.centery) < config.HEIGHT / 2]
-                                    for ospr in eo:
-                                        ds = (ospr.rect.centerx - player_obj.rect.centerx) ** 2 + (
-                                                ospr.rect.centery - player_obj.rect.centery) ** 2
-                                        if ds < mds: mds = ds; to = ospr
-                                lasers_group.add(Laser(player_obj.rect.centerx, player_obj.rect.centery, to))
-                                player_obj.bullets_remaining -= 1
-                                gs.last_shot_time = current_time_ticks
-                                player_obj.start_shooting_animation()
-                            if laser_sound: laser_sound.play()
-        elif current_gs_event == gs.PAUSED:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    set_current_game_state(gs.PLAYING)
-                    for obs in obstacles_group:
-                        if isinstance(obs, BrokenSatellite):
-                            obs.resume_falling_sound()
-                
-                    if gs.is_level_2_simple_mode and boulder_sound_effect_channel and not boulder_sound_effect_channel.get_busy():
-                
-                        should_boulder_sound_be_playing_on_resume = (
-                                gs.boulder_is_visible and
-                                not gs.level2_win_sequence_active and
-                                not gs.boulder_death_sequence_active and
-                                (player_obj and player_obj.is_active and gs.player_health > 0)
-                        )
-                        if should_boulder_sound_be_playing_on_resume:
-                            print("Boulder sound: Resuming due to game unpause.")
-                            boulder_sound_effect_channel.unpause()
-
-                elif event.key == pygame.K_UP:
-                    gs.pause_menu_idx = (gs.pause_menu_idx - 1 + len(gs.pause_menu_options)) % len(
-                        gs.pause_menu_options)
-                elif event.key == pygame.K_DOWN:
-                    gs.pause_menu_idx = (gs.pause_menu_idx + 1) % len(gs.pause_menu_options)
-                elif event.key == pygame.K_RETURN:
-                    so = gs.pause_menu_options[gs.pause_menu_idx]
-                    if so == 'Resume':
-                        set_current_game_state(gs.PLAYING)
-                        for obs in obstacles_group:
-                            if isinstance(obs, BrokenSatellite):
-                                obs.resume_falling_sound()
-                     
-                        if gs.is_level_2_simple_mode and boulder_sound_effect_channel and not boulder_sound_effect_channel.get_busy():
-                            should_boulder_sound_be_playing_on_resume = (
-                                    gs.boulder_is_visible and
-                                    not gs.level2_win_sequence_active and
-                                    not gs.boulder_death_sequence_active and
-                                    (player_obj and player_obj.is_active and gs.player_health > 0)
-                            )
-                            if should_boulder_sound_be_playing_on_resume:
-                                print("Boulder sound: Resuming due to game unpause (select).")
-                                boulder_sound_effect_channel.unpause()
-                    elif so == 'Restart Level':
-                        reset_game_state_vars(start_playing=True, is_simple_level_setup=gs.is_level_2_simple_mode)
-                    elif so == 'Controls':
-                        gs.previous_game_state_before_options = gs.PAUSED
-                        set_current_game_state(gs.CONTROLS)
-                    elif so == 'Settings':
-                        gs.previous_game_state_before_options = gs.PAUSED
-                        set_current_game_state(gs.SETTINGS)
-                    elif so == 'Quit to Main Menu':
-                        reset_game_state_vars(start_playing=False)
-                        set_current_game_state(gs.MENU)
-                        if pygame.mixer.get_init() and soundtrack_loaded and not pygame.mixer.music.get_busy():
-                            pygame.mixer.music.play(-1)
-        elif current_gs_event == gs.FAILED:
-            if event.type == pygame.KEYDOWN and (event.key == pygame.K_RETURN or event.key == pygame.K_q):
-                if event.key == pygame.K_RETURN:
-                    reset_game_state_vars(start_playing=True, is_simple_level_setup=gs.is_level_2_simple_mode)
-                if event.key == pygame.K_q:
-                    reset_game_state_vars(start_playing=False)
-                    set_current_game_state(gs.MENU)
-                    if pygame.mixer.get_init() and soundtrack_loaded and not pygame.mixer.music.get_busy():
-                        pygame.mixer.music.play(-1)
-        elif current_gs_event == gs.CONTROLS or current_gs_event == gs.SETTINGS:
-            if event.type == pygame.KEYDOWN and (event.key == pygame.K_RETURN or event.key == pygame.K_ESCAPE):
-                prev_state_local = gs.previous_game_state_before_options if gs.previous_game_state_before_options else gs.MENU
-                set_current_game_state(prev_state_local)
-                gs.previous_game_state_before_options = None
-                if prev_state_local == gs.MENU and pygame.mixer.get_init() and soundtrack_loaded and not pygame.mixer.music.get_busy():
-                    pygame.mixer.music.play(-1)
-
-        if current_gs_event == gs.SETTINGS:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_LEFT or event.key == pygame.K_RIGHT:
-                    if pygame.mixer.get_init():
-                        if event.key == pygame.K_LEFT: gs.music_volume = max(0, gs.music_volume - .1)
-                        if event.key == pygame.K_RIGHT: gs.music_volume = min(1, gs.music_volume + .1)
-                        update_sound_effect_volumes()
+def update_simulation_step():
+    global cam_y_offset, planet_x, planet2_x, is_gusting, gust_end_time, next_gust_time, current_gust_x_strength, current_gust_y_factor, next_meteor_spawn_time, menu_frame_idx, menu_frame_timer, last_video_frame_time_level1, last_video_frame_time_level2
+    global prologue_video_player, prologue_audio_channel, middle_cutscene_video_player, middle_cutscene_audio_channel, final_cutscene_video_player, final_cutscene_audio_channel, boulder_sound_effect_channel
+    global last_ceiling_decoration_spawn_world_x, next_ceiling_decoration_spawn_target_x, last_hanging_light_spawn_world_x, next_hanging_light_spawn_target_x
+    global current_time_ticks
 
+    gs.sim_time_ms += SIMULATION_STEP_SECONDS * 1000.0
+    current_time_ticks = int(gs.sim_time_ms)
     world_scroll_this_frame = 0.0
 
     if gs.colony_saved_message_active and current_time_ticks >= gs.colony_saved_message_timer_end: gs.colony_saved_message_active = False
@@ -1583,24 +1268,27 @@ while running:
         else:
             cam_y_offset = 0
         if terrain_obj:
-            lasers_group.update(cam_y_offset)
+            lasers_group.update(cam_y_offset, time_delta_seconds)
         else:
-            lasers_group.update(cam_y_offset)
+            lasers_group.update(cam_y_offset, time_delta_seconds)
 
         for obs in obstacles_group:
             obs.update(0.0, current_gs_logic, time_delta_seconds, player_obj, debris_effects_group)
             if isinstance(obs, IceFormation) and obs.is_erupting and obs.spawn_debris_on_eruption:
-                debris_effects_group.add(DebrisEffect(obs.rect.centerx, obs.rect.bottom, "snow_puff", intensity=0.8))
+                debris_effects_group.add(pool.acquire(DebrisEffect, obs.rect.centerx, obs.rect.bottom, "snow_puff",
+                                                      intensity=0.8))
                 obs.spawn_debris_on_eruption = False
-        hit_obstacle_dict_tutorial = pygame.sprite.groupcollide(lasers_group, obstacles_group, True, True)
+        collision_world.rebuild({"obstacles": obstacles_group})
+        hit_obstacle_dict_tutorial = collision.resolve_kills(
+            collision_world.collide(lasers_group, "obstacles", precise=True), kill_a=True, kill_b=True)
         if hit_obstacle_dict_tutorial:
             for obs_hit_list in hit_obstacle_dict_tutorial.values():
                 for obs_hit in obs_hit_list:
                     mat, cx, cy, obs_type = obs_hit.on_destroy()
-                    debris_effects_group.add(DebrisEffect(cx, cy, mat))
+                    debris_effects_group.add(pool.acquire(DebrisEffect, cx, cy, mat))
                     if obs_type == "satellite_debris":
                         if explosion_sound: explosion_sound.play()
-                        explosions_group.add(Explosion(cx, cy))
+                        explosions_group.add(pool.acquire(Explosion, cx, cy))
                     elif obs_type == "ice_formation":
                         if spike_breaking_sound: spike_breaking_sound.play()
                     elif obs_hit.destructible:
@@ -1610,7 +1298,8 @@ while running:
         if not tutorial_obstacle_was_present and not gs.tutorial_shoot_done: gs.tutorial_shoot_done = True
 
         if player_obj and avalanche_obj and player_obj.is_active and player_obj.rect:
-            avalanche_obj.update(player_obj.rect.centerx, False, current_gs_logic, set_current_game_state)
+            avalanche_obj.update(player_obj.rect.centerx, False, current_gs_logic, set_current_game_state,
+                                 time_delta_seconds)
             if avalanche_obj.request_rumble_effect_flag:
                 gs.screen_shake_magnitude = config.AVALANCHE_SHAKE_MAGNITUDE
                 gs.screen_shake_duration = config.AVALANCHE_SHAKE_DURATION
@@ -1789,7 +1478,7 @@ while running:
                 player_obj.update(terrain_obj, current_ramp_obj, current_gs_logic, time_delta_seconds,
                                   world_scroll_this_frame)
             if boulder_obj:
-                boulder_obj.update(False, config.PLAYER_SCREEN_X)
+                boulder_obj.update(False, config.PLAYER_SCREEN_X, time_delta_seconds)
             if player_obj and player_obj.rect:
                 cam_y_offset = (player_obj.y_world - player_obj.rect.height / 2.0) - config.PLAYER_TARGET_SCREEN_Y
             else:
@@ -1868,7 +1557,7 @@ while running:
                 player_obj.update(terrain_obj, current_ramp_obj, current_gs_logic, time_delta_seconds,
                                   world_scroll_this_frame)
             if boulder_obj:
-                boulder_obj.update(False, config.PLAYER_SCREEN_X)
+                boulder_obj.update(False, config.PLAYER_SCREEN_X, time_delta_seconds)
 
             if player_obj and player_obj.rect:
                 cam_y_offset = (player_obj.y_world - player_obj.rect.height / 2.0) - config.PLAYER_TARGET_SCREEN_Y
@@ -1949,15 +1638,17 @@ while running:
                         effective_player_speed *= config.SLOWDOWN_FACTOR
                     else:
                         gs.is_slowed_down = False
-                scroll_for_player_and_world = effective_player_speed
+                scroll_for_player_and_world = effective_player_speed * SIMULATION_FRAME_STEPS
             elif gs.level2_stairs_visible and not gs.level2_player_reached_stairs:
-                scroll_for_player_and_world = config.PLAYER_DOWNHILL_SPEED
+                scroll_for_player_and_world = config.PLAYER_DOWNHILL_SPEED * SIMULATION_FRAME_STEPS
 
             world_scroll_this_frame = scroll_for_player_and_world
+            profiler.mark("logic_setup")
 
             if player_obj and terrain_obj:
                 player_obj.update(terrain_obj, current_ramp_obj, current_gs_logic, time_delta_seconds,
                                   scroll_for_player_and_world)
+            profiler.mark("player_update")
 
             if player_obj and player_obj.rect:
                 cam_y_offset = (player_obj.y_world - player_obj.rect.height / 2.0) - config.PLAYER_TARGET_SCREEN_Y
@@ -2005,6 +1696,7 @@ while running:
                     planet2_x -= planet_speed
                     if planet2_image.get_width() > 0 and planet2_x + planet2_image.get_width() < 0: planet2_x = config.WIDTH + random.randint(
                         250, 450)
+            profiler.mark("video_fetch")
 
             if not gs.is_level_2_simple_mode:
                 if is_gusting:
@@ -2021,7 +1713,7 @@ while running:
                                                            config.WIND_GUST_STRENGTH_Y_FACTOR)
 
                 if config.ENABLE_METEOR_EFFECT:
-                    if current_time_ticks >= next_meteor_spawn_time and len(meteors_list) < config.METEOR_MAX_COUNT:
+                    if current_time_ticks >= next_meteor_spawn_time and len(meteors_list) < quality.budget("meteors", config.METEOR_MAX_COUNT):
                         angle_deg = random.uniform(config.METEOR_ANGLE_MIN_DEG, config.METEOR_ANGLE_MAX_DEG)
                         angle_rad = math.radians(angle_deg)
                         start_x = random.uniform(-.1 * config.WIDTH, 1.1 * config.WIDTH)
@@ -2051,7 +1743,7 @@ while running:
 
                 for l_idx, l_flakes in enumerate(snowflakes_by_layer):
                     l_conf = config.SNOW_LAYERS[l_idx]
-                    for i_flake in range(len(l_flakes) - 1, -1, -1):
+                    for i_flake in range(quality.budget("snow", len(l_flakes)) - 1, -1, -1):
                         f = l_flakes[i_flake]
                         effective_vx = f[2]
                         if is_gusting: effective_vx += current_gust_x_strength * f[6]
@@ -2072,9 +1764,11 @@ while running:
                             f[0] = -flake_size_radius - random.randint(0, 20)
                             f[1] = random.randint(-config.HEIGHT // 2, config.HEIGHT // 2)
 
+            profiler.mark("weather_update")
             if not gs.waiting_for_death_anim_to_finish and not gs.boulder_death_sequence_active:
                 gs.world_distance_scrolled += world_scroll_this_frame / config.CHUNK
-                if terrain_obj: terrain_obj.update(world_scroll_this_frame)
+                if terrain_obj: terrain_obj.update(world_scroll_this_frame, time_delta_seconds)
+                profiler.mark("terrain_update")
 
                 if not gs.is_level_2_simple_mode:
                     all_checkpoints_done_for_level = gs.checkpoint_idx >= len(config.CHECKPOINT_DISTANCES)
@@ -2089,12 +1783,12 @@ while running:
                         choice = random.choices(["ice_formation", "broken_satellite"], weights=[0.6, 0.4], k=1)[0]
                         new_obs_l1 = None
                         if choice == "ice_formation":
-                            new_obs_l1 = IceFormation(spawn_x_generic, terrain_obj)
+                            new_obs_l1 = pool.acquire(IceFormation, spawn_x_generic, terrain_obj)
                         elif choice == "broken_satellite":
-                            new_obs_l1 = BrokenSatellite(config.WIDTH + random.randint(400, 600), terrain_obj,
-                                                         image_asset_path_name="satellite.png",
-                                                         crash_sound_obj=satellite_falling_sound_asset,
-                                                         impact_sound_obj=satellite_impact_sound_asset)
+                            new_obs_l1 = pool.acquire(BrokenSatellite, config.WIDTH + random.randint(400, 600), terrain_obj,
+                                                      image_asset_path_name="satellite.png",
+                                                      crash_sound_obj=satellite_falling_sound_asset,
+                                                      impact_sound_obj=satellite_impact_sound_asset)
                         if new_obs_l1: obstacles_group.add(new_obs_l1)
                         gs.last_obstacle_spawn_time = current_time_ticks
                         gs.next_obstacle_spawn_delay = random.randint(config.OBSTACLE_SPAWN_INTERVAL_MIN,
@@ -2117,9 +1811,9 @@ while running:
 
                             if chosen_obstacle_type_l2 == "bug":
                                 spawn_x_bug = config.WIDTH + random.randint(70, 200)
-                                new_obstacle_l2 = BugObstacle(spawn_x_bug, terrain_obj,
-                                                              spawn_sound=bug_spawn_sound_effect,
-                                                              die_sound=bug_die_sound_effect)
+                                new_obstacle_l2 = pool.acquire(BugObstacle, spawn_x_bug, terrain_obj,
+                                                               spawn_sound=bug_spawn_sound_effect,
+                                                               die_sound=bug_die_sound_effect)
                                 spawn_delay_min = config.BUG_SPAWN_INTERVAL_MIN_L2
                                 spawn_delay_max = config.BUG_SPAWN_INTERVAL_MAX_L2
                             elif chosen_obstacle_type_l2 == "crystal":
@@ -2127,9 +1821,9 @@ while running:
                                 crystal_ground_impact_sound = sound_effects.get(config.CRYSTAL_GROUND_IMPACT_SOUND_KEY)
                                 crystal_destruction_sound = sound_effects.get(config.CRYSTAL_DESTRUCTION_SOUND_KEY)
 
-                                new_obstacle_l2 = CrystalObstacle(spawn_x_crystal, terrain_obj,
-                                                                  impact_sound_obj=crystal_ground_impact_sound,
-                                                                  destruction_sound_obj=crystal_destruction_sound)
+                                new_obstacle_l2 = pool.acquire(CrystalObstacle, spawn_x_crystal, terrain_obj,
+                                                               impact_sound_obj=crystal_ground_impact_sound,
+                                                               destruction_sound_obj=crystal_destruction_sound)
                                 spawn_delay_min = config.CRYSTAL_SPAWN_INTERVAL_MIN_L2
                                 spawn_delay_max = config.CRYSTAL_SPAWN_INTERVAL_MAX_L2
 
@@ -2141,10 +1835,12 @@ while running:
                                 else:
                                     gs.next_obstacle_spawn_delay = spawn_delay_min
 
+                profiler.mark("spawning")
                 obstacles_group.update(world_scroll_this_frame, current_gs_logic, time_delta_seconds, player_obj,
                                        debris_effects_group)
                 ceiling_decorations_group.update(world_scroll_this_frame)
-                hanging_lights_group.update(world_scroll_this_frame)
+                hanging_lights_group.update(world_scroll_this_frame, time_delta_seconds)
+                profiler.mark("obstacles_update")
 
                 if not gs.is_level_2_simple_mode:
                     beacons_group.update(world_scroll_this_frame, time_delta_seconds)
@@ -2157,7 +1853,8 @@ while running:
                             elif fl["x_pos"] > 0:
                                 fl["x_pos"] -= fl["surface"].get_width()
                     if player_obj and avalanche_obj and player_obj.is_active and player_obj.rect:
-                        avalanche_obj.update(player_obj.rect.centerx, False, current_gs_logic, set_current_game_state)
+                        avalanche_obj.update(player_obj.rect.centerx, False, current_gs_logic, set_current_game_state,
+                                             time_delta_seconds)
                         if gs.get_state() == gs.FAILED:
                             if pygame.mixer.get_init() and pygame.mixer.music.get_busy(): pygame.mixer.music.stop()
                         if avalanche_obj.request_rumble_effect_flag:
@@ -2248,14 +1945,15 @@ while running:
                                                                     )
                     if gs.is_level_2_simple_mode and boulder_obj and player_obj and player_obj.rect and \
                             not gs.level2_win_sequence_active:
-                        boulder_obj.update(gs.boulder_catch_up_active, config.PLAYER_SCREEN_X)
+                        boulder_obj.update(gs.boulder_catch_up_active, config.PLAYER_SCREEN_X, time_delta_seconds)
 
                         if gs.boulder_is_visible and player_obj.is_active:
                             effective_boulder_collision_rect = boulder_obj.rect.inflate(
                                 -2 * config.BOULDER_COLLISION_HORIZONTAL_INSET,
                                 -2 * config.BOULDER_COLLISION_VERTICAL_INSET
                             )
-                            if effective_boulder_collision_rect.colliderect(player_obj.rect):
+                            if effective_boulder_collision_rect.colliderect(player_obj.rect) and \
+                                    collision.sprites_overlap(boulder_obj, player_obj):
                                 print("Boulder collided with player (Main.py rect collision)!")
                                 if gs.player_health > 0:
                                     gs.player_health = 0
@@ -2267,13 +1965,23 @@ while running:
                                     gs.boulder_death_sequence_active = True
                                     gs.boulder_death_sequence_end_time = current_time_ticks + config.BOULDER_DEATH_SCREEN_DELAY_MS
 
+                profiler.mark("hazards_update")
                 if terrain_obj:
-                    lasers_group.update(cam_y_offset)
+                    lasers_group.update(cam_y_offset, time_delta_seconds)
                 else:
-                    lasers_group.update(cam_y_offset)
+                    lasers_group.update(cam_y_offset, time_delta_seconds)
                 if current_ramp_obj: current_ramp_obj.update(world_scroll_this_frame)
-
-                hit_obstacle_dict = pygame.sprite.groupcollide(lasers_group, obstacles_group, True, True)
+                profiler.mark("lasers_update")
+
+                collision_world.rebuild({"obstacles": obstacles_group, "beacons": beacons_group, "portals": portal_group})
+                frame_hits = collision_world.frame_hits({
+                    "laser_obstacle": (lasers_group, "obstacles", True),
+                    "player_obstacle": ([player_obj], "obstacles", True),
+                    "player_beacon": ([player_obj], "beacons", False),
+                    "player_portal": ([player_obj], "portals", False),
+                })
+                hit_obstacle_dict = collision.resolve_kills(frame_hits["laser_obstacle"], kill_a=True, kill_b=True)
+                profiler.mark("collisions")
                 if hit_obstacle_dict:
                     if gs.is_level_2_simple_mode:
                         gs.consecutive_obstacle_hits = 0
@@ -2282,9 +1990,9 @@ while running:
                     for obs_hit_list in hit_obstacle_dict.values():
                         for obs_hit in obs_hit_list:
                             mat, cx, cy, obs_type = obs_hit.on_destroy()
-                            debris_effects_group.add(DebrisEffect(cx, cy, mat, intensity=1.5))
+                            debris_effects_group.add(pool.acquire(DebrisEffect, cx, cy, mat, intensity=1.5))
                             if obs_type == "satellite_debris":
-                                if explosion_sound: explosion_sound.play(); explosions_group.add(Explosion(cx, cy))
+                                if explosion_sound: explosion_sound.play(); explosions_group.add(pool.acquire(Explosion, cx, cy))
                             elif obs_type == "ice_formation":
                                 if spike_breaking_sound: spike_breaking_sound.play()
                             elif obs_type == "bug":
@@ -2293,7 +2001,8 @@ while running:
                                 if explosion_sound: explosion_sound.play()
 
                 if player_obj and player_obj.is_active:
-                    collided_obs_player = pygame.sprite.spritecollide(player_obj, obstacles_group, True)
+                    collided_obs_player = collision.resolve_kills(frame_hits["player_obstacle"], kill_b=True).get(
+                        player_obj, [])
                     if collided_obs_player:
                         for obs_hit in collided_obs_player:
                             gs.player_health -= obs_hit.damage_value
@@ -2301,7 +2010,7 @@ while running:
                             player_obj.start_dying_animation(is_fatal_hit=is_fatal)
                             if hit_sound: hit_sound.play()
                             mat, cx, cy, obs_type = obs_hit.on_destroy()
-                            debris_effects_group.add(DebrisEffect(cx, cy, mat, intensity=1.8))
+                            debris_effects_group.add(pool.acquire(DebrisEffect, cx, cy, mat, intensity=1.8))
 
                             if gs.is_level_2_simple_mode:
                                 gs.consecutive_obstacle_hits += 1
@@ -2315,7 +2024,7 @@ while running:
                                     print(f"Boulder catch-up mode ACTIVATED. Hits: {gs.consecutive_obstacle_hits}")
 
                             if obs_type == "satellite_debris":
-                                if explosion_sound: explosion_sound.play(); explosions_group.add(Explosion(cx, cy))
+                                if explosion_sound: explosion_sound.play(); explosions_group.add(pool.acquire(Explosion, cx, cy))
                             elif obs_type == "ice_formation":
                                 if spike_breaking_sound: spike_breaking_sound.play()
                             elif obs_type == "bug":
@@ -2332,7 +2041,7 @@ while running:
 
                 if not gs.is_level_2_simple_mode:
                     if player_obj and player_obj.is_active:
-                        coll_beacons = pygame.sprite.spritecollide(player_obj, beacons_group, False)
+                        coll_beacons = [bcn for _, bcn in frame_hits["player_beacon"]]
                         for bhit in coll_beacons:
                             if not bhit.is_collected:
                                 if bhit.collect():
@@ -2370,7 +2079,7 @@ while running:
                                         gs.portal_spawn_pending = True
                                         print("Portal Spawn Pending set to True")
                     if player_obj and player_obj.is_active:
-                        collided_portal = pygame.sprite.spritecollideany(player_obj, portal_group)
+                        collided_portal = frame_hits["player_portal"][0][1] if frame_hits["player_portal"] else None
                         if collided_portal:
                             print("Player reached Portal!")
                             player_obj.is_active = False
@@ -2384,9 +2093,11 @@ while running:
                         gs.checkpoint_idx]:
                         beacons_group.add(Beacon(config.WIDTH + 50, terrain_obj))
                         gs.checkpoint_idx += 1
+                profiler.mark("collision_response")
 
             explosions_group.update(time_delta_seconds, world_scroll_this_frame)
             debris_effects_group.update(time_delta_seconds, world_scroll_this_frame)
+            profiler.mark("effects_update")
 
        
             if gs.is_level_2_simple_mode and boulder_obj and boulder_sound_effect and pygame.mixer.get_init():
@@ -2424,7 +2135,338 @@ while running:
                     boulder_sound_effect_channel.stop()
 
 
+if benchmark.active_run:
+    benchmark.active_run.start_level(setup_tutorial_state, reset_game_state_vars, (gs.PLAYING, gs.TUTORIAL))
+
+
+def interpolated_sprites():
+    if player_obj and player_obj.rect: yield player_obj
+    for group in (obstacles_group, lasers_group, beacons_group, portal_group, ceiling_decorations_group,
+                  hanging_lights_group):
+        for sprite in group:
+            if sprite.rect: yield sprite
+
+
+def capture_render_positions():
+    return {sprite: (sprite.rect.center, getattr(sprite, 'pool_generation', 0)) for sprite in interpolated_sprites()}
+
+
+def apply_render_interpolation(previous_positions, alpha):
+    moved_sprites = []
+    max_jump = config.SIMULATION_INTERPOLATION_MAX_JUMP_PX
+    for sprite in interpolated_sprites():
+        previous = previous_positions.get(sprite)
+        if previous is None or previous[1] != getattr(sprite, 'pool_generation', 0): continue
+        (prev_x, prev_y), _ = previous
+        cur_x, cur_y = sprite.rect.center
+        if (prev_x, prev_y) == (cur_x, cur_y) or abs(cur_x - prev_x) > max_jump or abs(cur_y - prev_y) > max_jump:
+            continue
+        moved_sprites.append((sprite, sprite.rect.topleft))
+        sprite.rect.center = (round(prev_x + (cur_x - prev_x) * alpha), round(prev_y + (cur_y - prev_y) * alpha))
+    return moved_sprites
+
+
+def restore_render_interpolation(moved_sprites):
+    for sprite, topleft in moved_sprites:
+        sprite.rect.topleft = topleft
+
+
+SIMULATION_STEP_SECONDS = 1.0 / config.SIMULATION_HZ
+SIMULATION_FRAME_STEPS = SIMULATION_STEP_SECONDS * config.FPS
+time_delta_seconds = SIMULATION_STEP_SECONDS
+sim_accumulator_seconds = 0.0
+previous_cam_y_offset = cam_y_offset
+render_cam_y_offset = cam_y_offset
+previous_world_distance_scrolled = gs.world_distance_scrolled
+previous_render_positions = {}
+render_scroll_lag = 0.0
+
+while running:
+    current_time_ticks = int(gs.sim_time_ms)
+    dt_raw_ms = clock.tick(0 if benchmark.active_run else config.RENDER_FPS_CAP)
+    profiler.begin_frame()
+    quality.observe(clock.get_rawtime(), pygame.time.get_ticks())
+    frame_delta_seconds = dt_raw_ms / 1000.0
+    keys_pressed = pygame.key.get_pressed()
+    if frame_delta_seconds <= 0: frame_delta_seconds = 1 / config.FPS
+    if abs(frame_delta_seconds - SIMULATION_STEP_SECONDS) < config.SIMULATION_SNAP_SECONDS:
+        frame_delta_seconds = SIMULATION_STEP_SECONDS
+    if benchmark.active_run:
+        frame_delta_seconds = 1.0 / config.FPS
+        benchmark.active_run.begin_frame(gs.get_state())
+    sim_accumulator_seconds += min(frame_delta_seconds, config.SIMULATION_MAX_FRAME_SECONDS)
+
+    current_gs_logic = gs.get_state()
+
+    current_screen_offset_x, current_screen_offset_y = 0, 0
+    if gs.screen_shake_magnitude > 0 and gs.screen_shake_duration > 0:
+        gs.screen_shake_timer += frame_delta_seconds
+        if gs.screen_shake_timer < gs.screen_shake_duration:
+            current_screen_offset_x = random.randint(-gs.screen_shake_magnitude, gs.screen_shake_magnitude)
+            current_screen_offset_y = random.randint(-gs.screen_shake_magnitude, gs.screen_shake_magnitude)
+        else:
+            gs.screen_shake_magnitude = 0
+            gs.screen_shake_duration = 0.0
+            gs.screen_shake_timer = 0.0
+
+    if current_gs_logic == gs.PLAYING and avalanche_obj and avalanche_obj.continuous_shake_magnitude > 0:
+        magnitude = int(avalanche_obj.continuous_shake_magnitude)
+        current_screen_offset_x += random.randint(-magnitude, magnitude)
+        current_screen_offset_y += random.randint(-magnitude, magnitude)
+
+    for event in pygame.event.get():
+        if event.type == pygame.QUIT: running = False
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3: profiler.toggle(base_dir)
+        current_gs_event = gs.get_state()
+
+        if current_gs_event == gs.MENU:
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_UP: gs.menu_idx = (gs.menu_idx - 1 + len(gs.menu_options)) % len(
+                    gs.menu_options)
+                if event.key == pygame.K_DOWN: gs.menu_idx = (gs.menu_idx + 1) % len(gs.menu_options)
+                if event.key == pygame.K_RETURN:
+                    selected_option = gs.menu_options[gs.menu_idx]
+                    if selected_option == 'Start Level 1':
+                        if pygame.mixer.get_init() and pygame.mixer.music.get_busy():
+                            pygame.mixer.music.stop()
+
+                        prologue_video_file_path = os.path.join(base_dir, "assets", "Prologue.mp4")
+                        if os.path.exists(prologue_video_file_path):
+                            actual_prologue_fps = 30.0
+                            prologue_video_player = VideoPlayer(prologue_video_file_path,
+                                                                (config.WIDTH, config.HEIGHT),
+                                                                forced_fps=actual_prologue_fps)
+                            if prologue_video_player and prologue_video_player.is_valid():
+                                if prologue_audio_sound:
+                                    try:
+                                        prologue_audio_channel = prologue_audio_sound.play()
+                                    except pygame.error as e:
+                                        print(f"Could not play prologue audio: {e}")
+                                        prologue_audio_channel = None
+                                set_current_game_state(gs.PROLOGUE)
+                            else:
+                                if prologue_video_player: prologue_video_player.release()
+                                prologue_video_player = None
+                                print(f"Error loading Prologue.mp4. Skipping to tutorial.")
+                                setup_tutorial_state()
+                        else:
+                            print(f"Prologue.mp4 not found. Skipping to tutorial.")
+                            setup_tutorial_state()
+
+                    elif selected_option == 'Start Level 2':
+                        if pygame.mixer.get_init() and pygame.mixer.music.get_busy():
+                            pygame.mixer.music.stop()
+                        reset_game_state_vars(start_playing=True, is_simple_level_setup=True)
+                        print("Starting Level 2 (Simple Mode) directly.")
+                    elif selected_option == 'Controls':
+                        gs.previous_game_state_before_options = gs.MENU
+                        set_current_game_state(gs.CONTROLS)
+                    elif selected_option == 'Settings':
+                        gs.previous_game_state_before_options = gs.MENU
+                        set_current_game_state(gs.SETTINGS)
+                    elif selected_option == 'Quit':
+                        running = False
+        elif current_gs_event == gs.PROLOGUE:
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_RETURN or event.key == pygame.K_ESCAPE:
+                    if hasattr(gs, 'prologue_start_time_ticks'): del gs.prologue_start_time_ticks
+                    if prologue_video_player:
+                        prologue_video_player.release()
+                        prologue_video_player = None
+                    if prologue_audio_channel and prologue_audio_channel.get_busy():
+                        prologue_audio_channel.stop()
+                    prologue_audio_channel = None
+                    setup_tutorial_state()
+
+        elif current_gs_event == gs.MID_CUTSCENE:
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_RETURN or event.key == pygame.K_ESCAPE:
+                    if middle_cutscene_video_player:
+                        middle_cutscene_video_player.release()
+                        middle_cutscene_video_player = None
+                    if middle_cutscene_audio_channel and middle_cutscene_audio_channel.get_busy():
+                        middle_cutscene_audio_channel.stop()
+                    middle_cutscene_audio_channel = None
+                    reset_game_state_vars(start_playing=True, is_simple_level_setup=True)
+        elif current_gs_event == gs.WIN_CUTSCENE:
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_RETURN or event.key == pygame.K_ESCAPE:
+                    if final_cutscene_video_player:
+                        final_cutscene_video_player.release()
+                        final_cutscene_video_player = None
+                    if final_cutscene_audio_channel and final_cutscene_audio_channel.get_busy():
+                        final_cutscene_audio_channel.stop()
+                    final_cutscene_audio_channel = None
+
+                    set_current_game_state(gs.CREDITS)
+                    gs.credits_scroll_y = 0.0
+                    if pygame.mixer.get_init() and soundtrack_loaded:
+                        if not pygame.mixer.music.get_busy():
+                            pygame.mixer.music.play(-1)
+                        elif pygame.mixer.music.get_volume() < gs.music_volume:
+                            pygame.mixer.music.set_volume(gs.music_volume)
+        elif current_gs_event == gs.CREDITS:
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_RETURN or event.key == pygame.K_ESCAPE:
+                    reset_game_state_vars(start_playing=False)
+                    set_current_game_state(gs.MENU)
+                    if pygame.mixer.get_init() and soundtrack_loaded and not pygame.mixer.music.get_busy():
+                        pygame.mixer.music.play(-1)
+        elif current_gs_event == gs.TUTORIAL:
+            if player_obj and event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE:
+                    if player_obj.perform_jump():
+                        if jump_sound: jump_sound.play()
+                    gs.tutorial_jump_done = True
+                if event.key == pygame.K_f:
+                    if player_obj.bullets_remaining > 0 and current_time_ticks - gs.last_shot_time > 200 and not player_obj.is_dying_animating:
+                        to = next(iter(obstacles_group), None)
+                        if player_obj.rect:
+                            lasers_group.add(pool.acquire(Laser, player_obj.rect.centerx, player_obj.rect.centery, to))
+                            player_obj.bullets_remaining -= 1
+                            gs.last_shot_time = current_time_ticks
+                            player_obj.start_shooting_animation()
+                        if laser_sound: laser_sound.play()
+        elif current_gs_event == gs.PLAYING:
+            if player_obj and player_obj.is_active and not gs.portal_reached and \
+                    not gs.waiting_for_death_anim_to_finish and not gs.boulder_death_sequence_active and \
+                    not gs.level2_win_sequence_active and not gs.level2_stairs_visible:
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        paused_game_surface_local = screen.copy()
+                        set_current_game_state(gs.PAUSED)
+                        for obs in obstacles_group:
+                            if isinstance(obs, BrokenSatellite):
+                                obs.pause_falling_sound()
+                     
+                        if gs.is_level_2_simple_mode and boulder_sound_effect_channel and boulder_sound_effect_channel.get_busy():
+                            print("Boulder sound: Pausing due to game pause.")
+                            boulder_sound_effect_channel.pause()
+
+                    if event.key == pygame.K_SPACE:
+                        if player_obj.perform_jump():
+                            if jump_sound: jump_sound.play()
+                    if event.key == pygame.K_f:
+                        if player_obj.bullets_remaining > 0 and current_time_ticks - gs.last_shot_time > 200 and not player_obj.is_dying_animating:
+                            to = None
+                            mds = float('inf')
+                            if player_obj.rect:
+                                if not gs.is_level_2_simple_mode or \
+                                        (gs.is_level_2_simple_mode and any(
+                                            isinstance(o, BugObstacle) for o in obstacles_group)):
+                                    eo = [o for o in obstacles_group if
+                                          o.rect.centerx > player_obj.rect.centerx + 5 and abs(
+                                              o.rect.centery - player_obj.rect.centery) < config.HEIGHT / 2]
+                                    for ospr in eo:
+                                        ds = (ospr.rect.centerx - player_obj.rect.centerx) ** 2 + (
+                                                ospr.rect.centery - player_obj.rect.centery) ** 2
+                                        if ds < mds: mds = ds; to = ospr
+                                lasers_group.add(pool.acquire(Laser, player_obj.rect.centerx, player_obj.rect.centery, to))
+                                player_obj.bullets_remaining -= 1
+                                gs.last_shot_time = current_time_ticks
+                                player_obj.start_shooting_animation()
+                            if laser_sound: laser_sound.play()
+        elif current_gs_event == gs.PAUSED:
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    set_current_game_state(gs.PLAYING)
+                    for obs in obstacles_group:
+                        if isinstance(obs, BrokenSatellite):
+                            obs.resume_falling_sound()
+                
+                    if gs.is_level_2_simple_mode and boulder_sound_effect_channel and not boulder_sound_effect_channel.get_busy():
+                
+                        should_boulder_sound_be_playing_on_resume = (
+                                gs.boulder_is_visible and
+                                not gs.level2_win_sequence_active and
+                                not gs.boulder_death_sequence_active and
+                                (player_obj and player_obj.is_active and gs.player_health > 0)
+                        )
+                        if should_boulder_sound_be_playing_on_resume:
+                            print("Boulder sound: Resuming due to game unpause.")
+                            boulder_sound_effect_channel.unpause()
+
+                elif event.key == pygame.K_UP:
+                    gs.pause_menu_idx = (gs.pause_menu_idx - 1 + len(gs.pause_menu_options)) % len(
+                        gs.pause_menu_options)
+                elif event.key == pygame.K_DOWN:
+                    gs.pause_menu_idx = (gs.pause_menu_idx + 1) % len(gs.pause_menu_options)
+                elif event.key == pygame.K_RETURN:
+                    so = gs.pause_menu_options[gs.pause_menu_idx]
+                    if so == 'Resume':
+                        set_current_game_state(gs.PLAYING)
+                        for obs in obstacles_group:
+                            if isinstance(obs, BrokenSatellite):
+                                obs.resume_falling_sound()
+                     
+                        if gs.is_level_2_simple_mode and boulder_sound_effect_channel and not boulder_sound_effect_channel.get_busy():
+                            should_boulder_sound_be_playing_on_resume = (
+                                    gs.boulder_is_visible and
+                                    not gs.level2_win_sequence_active and
+                                    not gs.boulder_death_sequence_active and
+                                    (player_obj and player_obj.is_active and gs.player_health > 0)
+                            )
+                            if should_boulder_sound_be_playing_on_resume:
+                                print("Boulder sound: Resuming due to game unpause (select).")
+                                boulder_sound_effect_channel.unpause()
+                    elif so == 'Restart Level':
+                        reset_game_state_vars(start_playing=True, is_simple_level_setup=gs.is_level_2_simple_mode)
+                    elif so == 'Controls':
+                        gs.previous_game_state_before_options = gs.PAUSED
+                        set_current_game_state(gs.CONTROLS)
+                    elif so == 'Settings':
+                        gs.previous_game_state_before_options = gs.PAUSED
+                        set_current_game_state(gs.SETTINGS)
+                    elif so == 'Quit to Main Menu':
+                        reset_game_state_vars(start_playing=False)
+                        set_current_game_state(gs.MENU)
+                        if pygame.mixer.get_init() and soundtrack_loaded and not pygame.mixer.music.get_busy():
+                            pygame.mixer.music.play(-1)
+        elif current_gs_event == gs.FAILED:
+            if event.type == pygame.KEYDOWN and (event.key == pygame.K_RETURN or event.key == pygame.K_q):
+                if event.key == pygame.K_RETURN:
+                    reset_game_state_vars(start_playing=True, is_simple_level_setup=gs.is_level_2_simple_mode)
+                if event.key == pygame.K_q:
+                    reset_game_state_vars(start_playing=False)
+                    set_current_game_state(gs.MENU)
+                    if pygame.mixer.get_init() and soundtrack_loaded and not pygame.mixer.music.get_busy():
+                        pygame.mixer.music.play(-1)
+        elif current_gs_event == gs.CONTROLS or current_gs_event == gs.SETTINGS:
+            if event.type == pygame.KEYDOWN and (event.key == pygame.K_RETURN or event.key == pygame.K_ESCAPE):
+                prev_state_local = gs.previous_game_state_before_options if gs.previous_game_state_before_options else gs.MENU
+                set_current_game_state(prev_state_local)
+                gs.previous_game_state_before_options = None
+                if prev_state_local == gs.MENU and pygame.mixer.get_init() and soundtrack_loaded and not pygame.mixer.music.get_busy():
+                    pygame.mixer.music.play(-1)
+
+        if current_gs_event == gs.SETTINGS:
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_LEFT or event.key == pygame.K_RIGHT:
+                    if pygame.mixer.get_init():
+                        if event.key == pygame.K_LEFT: gs.music_volume = max(0, gs.music_volume - .1)
+                        if event.key == pygame.K_RIGHT: gs.music_volume = min(1, gs.music_volume + .1)
+                        update_sound_effect_volumes()
 
+    profiler.mark("events")
+    sim_steps_this_frame = 0
+    while sim_accumulator_seconds >= SIMULATION_STEP_SECONDS and sim_steps_this_frame < config.SIMULATION_MAX_STEPS_PER_FRAME:
+        previous_cam_y_offset = cam_y_offset
+        previous_world_distance_scrolled = gs.world_distance_scrolled
+        previous_render_positions = capture_render_positions()
+        current_gs_logic = gs.get_state()
+        update_simulation_step()
+        sim_accumulator_seconds -= SIMULATION_STEP_SECONDS
+        sim_steps_this_frame += 1
+    if sim_accumulator_seconds >= SIMULATION_STEP_SECONDS:
+        sim_accumulator_seconds %= SIMULATION_STEP_SECONDS
+    sim_interpolation_alpha = sim_accumulator_seconds / SIMULATION_STEP_SECONDS
+    render_cam_y_offset = previous_cam_y_offset + (cam_y_offset - previous_cam_y_offset) * sim_interpolation_alpha
+    render_scroll_lag = (gs.world_distance_scrolled - previous_world_distance_scrolled) * config.CHUNK * (
+            1.0 - sim_interpolation_alpha)
+    if not 0.0 < render_scroll_lag <= config.SIMULATION_INTERPOLATION_MAX_JUMP_PX: render_scroll_lag = 0.0
+
+    profiler.mark("logic_other")
+    if benchmark.active_run: benchmark.active_run.begin_draw()
     current_gs_draw = gs.get_state()
 
     if current_gs_draw == gs.MENU:
@@ -2451,7 +2493,7 @@ while running:
             frame_surface = middle_cutscene_video_player.get_current_surface()
             if frame_surface:
                 screen.blit(frame_surface, (0, 0))
-        skip_text_mid = font.render("Press Enter or Esc to Skip", True, (200, 200, 200))
+        skip_text_mid = text_cache.render(font, "Press Enter or Esc to Skip", (200, 200, 200))
         screen.blit(skip_text_mid, (config.WIDTH - skip_text_mid.get_width() - 20,
                                     config.HEIGHT - skip_text_mid.get_height() - 35))
         pygame.display.flip()
@@ -2463,7 +2505,7 @@ while running:
             frame_surface = final_cutscene_video_player.get_current_surface()
             if frame_surface:
                 screen.blit(frame_surface, (0, 0))
-        skip_text_win = font.render("Press Enter or Esc to Skip", True, (200, 200, 200))
+        skip_text_win = text_cache.render(font, "Press Enter or Esc to Skip", (200, 200, 200))
         screen.blit(skip_text_win, (config.WIDTH - skip_text_win.get_width() - 20,
                                     config.HEIGHT - skip_text_win.get_height() - 35))
         pygame.display.flip()
@@ -2476,20 +2518,22 @@ while running:
 
     elif current_gs_draw in [gs.PLAYING, gs.TUTORIAL]:
         world_render_surface.fill((0, 0, 0, 0))
+        interpolated_moves = apply_render_interpolation(previous_render_positions, sim_interpolation_alpha)
+        if terrain_obj: terrain_obj.render_scroll_lag = render_scroll_lag
 
         if current_gs_draw == gs.TUTORIAL:
             world_render_surface.fill((50, 50, 80))
             if terrain_obj:
-                terrain_obj.draw_background_elements(world_render_surface, cam_y_offset)
-                terrain_obj.draw_tutorial_snow_platform(world_render_surface, cam_y_offset)
+                terrain_obj.draw_background_elements(world_render_surface, render_cam_y_offset)
+                terrain_obj.draw_tutorial_snow_platform(world_render_surface, render_cam_y_offset)
             if player_obj and not player_obj.is_hidden:
-                player_obj.draw_splash_particles(world_render_surface, cam_y_offset)
-                player_obj.draw(world_render_surface, cam_y_offset)
-            for obs_sprite in obstacles_group: obs_sprite.draw(world_render_surface, cam_y_offset)
+                player_obj.draw_splash_particles(world_render_surface, render_cam_y_offset)
+                player_obj.draw(world_render_surface, render_cam_y_offset)
+            for obs_sprite in obstacles_group: obs_sprite.draw(world_render_surface, render_cam_y_offset)
             for lsr_sprite in lasers_group: world_render_surface.blit(lsr_sprite.image, (lsr_sprite.rect.x,
-                                                                                         lsr_sprite.rect.y - cam_y_offset))
-            for exp in explosions_group: exp.draw(world_render_surface, cam_y_offset)
-            for deb_fx in debris_effects_group: deb_fx.draw(world_render_surface, cam_y_offset)
+                                                                                         lsr_sprite.rect.y - render_cam_y_offset))
+            for exp in explosions_group: exp.draw(world_render_surface, render_cam_y_offset)
+            for deb_fx in debris_effects_group: deb_fx.draw(world_render_surface, render_cam_y_offset)
 
         elif current_gs_draw == gs.PLAYING:
             video_frame = None
@@ -2502,6 +2546,7 @@ while running:
             else:
                 fill_color = (30, 30, 50) if not gs.is_level_2_simple_mode else (20, 15, 10)
                 world_render_surface.fill(fill_color)
+            profiler.mark("video_draw")
 
             if not gs.is_level_2_simple_mode:
                 if planet_image: world_render_surface.blit(planet_image, (int(planet_x), planet_y))
@@ -2537,71 +2582,80 @@ while running:
                         except:
                             pass
 
-            if terrain_obj: terrain_obj.draw_background_elements(world_render_surface, cam_y_offset)
+            if terrain_obj: terrain_obj.draw_background_elements(world_render_surface, render_cam_y_offset)
+            profiler.mark("background_draw")
             if player_obj and player_obj.rect and (
                     player_obj.y_world - player_obj.rect.height / 2.0) < config.GROUND_Y - 100:
                 if not gs.is_level_2_simple_mode:
-                    if cloud_image_2: world_render_surface.blit(cloud_image_2, (0, cloud_y_2_draw - cam_y_offset))
-                    if cloud_image_1: world_render_surface.blit(cloud_image_1, (0, cloud_y_1_draw - cam_y_offset))
+                    if cloud_image_2: world_render_surface.blit(cloud_image_2, (0, cloud_y_2_draw - render_cam_y_offset))
+                    if cloud_image_1: world_render_surface.blit(cloud_image_1, (0, cloud_y_1_draw - render_cam_y_offset))
 
             if not gs.is_level_2_simple_mode and avalanche_obj and not (
                     gs.waiting_for_death_anim_to_finish or gs.boulder_death_sequence_active or gs.level2_win_sequence_active):
-                avalanche_obj.draw(world_render_surface, current_gs_draw, terrain_obj, cam_y_offset, avalanche_image)
+                avalanche_obj.draw(world_render_surface, current_gs_draw, terrain_obj, render_cam_y_offset, avalanche_image)
 
             if gs.is_level_2_simple_mode and boulder_obj and not (
                     gs.waiting_for_death_anim_to_finish or gs.level2_win_sequence_active):
-                boulder_obj.draw(world_render_surface, cam_y_offset)
+                boulder_obj.draw(world_render_surface, render_cam_y_offset)
 
             if not gs.is_level_2_simple_mode and config.ENABLE_FOG_EFFECT:
-                for fog_layer in fog_layers:
+                for fog_layer in fog_layers[:quality.budget("fog_layers", len(fog_layers))]:
                     if fog_layer["surface"]:
                         fog_y = config.HEIGHT - fog_layer["surface"].get_height() - fog_layer["y_offset_from_bottom"]
-                        world_render_surface.blit(fog_layer["surface"], (fog_layer["x_pos"], fog_y))
+                        fog_x = fog_layer["x_pos"] + render_scroll_lag * fog_layer["scroll_factor"]
+                        if fog_x > 0: fog_x -= fog_layer["surface"].get_width()
+                        world_render_surface.blit(fog_layer["surface"], (fog_x, fog_y))
                         world_render_surface.blit(fog_layer["surface"],
-                                                  (fog_layer["x_pos"] + fog_layer["surface"].get_width(), fog_y))
+                                                  (fog_x + fog_layer["surface"].get_width(), fog_y))
 
-            if terrain_obj: terrain_obj.draw_snow_platform_and_clumps(world_render_surface, cam_y_offset)
+            profiler.mark("hazards_fog_draw")
+            if terrain_obj: terrain_obj.draw_snow_platform_and_clumps(world_render_surface, render_cam_y_offset)
+            profiler.mark("terrain_draw")
 
             if gs.is_level_2_simple_mode:
                 if config.L2_CEILING_DECORATION_ENABLED:
-                    for deco in ceiling_decorations_group: deco.draw(world_render_surface, cam_y_offset)
+                    world_blit_batch.draw_sprites(world_render_surface, ceiling_decorations_group, render_cam_y_offset)
                 if config.L2_HANGING_LIGHTS_ENABLED:
-                    for light in hanging_lights_group: light.draw(world_render_surface, cam_y_offset)
+                    for light in hanging_lights_group: light.draw(world_render_surface, render_cam_y_offset)
 
                 if gs.level2_stairs_visible and not gs.level2_player_reached_stairs and \
                         stairs_image_asset and gs.level2_stairs_rect_world and terrain_obj and player_obj:
-                    total_world_scroll_pixels = gs.world_distance_scrolled * config.CHUNK
+                    total_world_scroll_pixels = gs.world_distance_scrolled * config.CHUNK - render_scroll_lag
                     stairs_draw_x_on_world_surface = gs.level2_stairs_rect_world.left - total_world_scroll_pixels
                     stairs_bottom_world_y = gs.level2_stairs_rect_world.bottom
                     stairs_draw_y_on_world_surface = (
-                                                             stairs_bottom_world_y - gs.level2_stairs_rect_world.height) - cam_y_offset
+                                                             stairs_bottom_world_y - gs.level2_stairs_rect_world.height) - render_cam_y_offset
                     world_render_surface.blit(stairs_image_asset,
                                               (stairs_draw_x_on_world_surface, stairs_draw_y_on_world_surface))
 
+            profiler.mark("decorations_draw")
             if player_obj and not player_obj.is_hidden:
-                player_obj.draw_trails(world_render_surface, cam_y_offset)
-                player_obj.draw_splash_particles(world_render_surface, cam_y_offset)
+                player_obj.draw_trails(world_render_surface, render_cam_y_offset)
+                player_obj.draw_splash_particles(world_render_surface, render_cam_y_offset)
+            profiler.mark("trails_draw")
 
             if not gs.is_level_2_simple_mode:
                 for layer_flakes_list in snowflakes_by_layer:
-                    for flk in layer_flakes_list:
-                        diameter = flk[4] * 2
-                        if diameter > 0:
-                            flake_surf = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
-                            pygame.draw.circle(flake_surf, (255, 255, 255, flk[5]), (flk[4], flk[4]), flk[4])
-                            world_render_surface.blit(flake_surf, (int(flk[0] - flk[4]), int(flk[1] - flk[4])))
-                for bcn in beacons_group: bcn.draw(world_render_surface, cam_y_offset)
-                for portal_sprite in portal_group: portal_sprite.draw(world_render_surface, cam_y_offset)
-
-            for obs in obstacles_group: obs.draw(world_render_surface, cam_y_offset)
-            for exp in explosions_group: exp.draw(world_render_surface, cam_y_offset)
-            for deb_fx in debris_effects_group: deb_fx.draw(world_render_surface, cam_y_offset)
-            if current_ramp_obj: current_ramp_obj.draw(world_render_surface, cam_y_offset)
+                    for flk in layer_flakes_list[:quality.budget("snow", len(layer_flakes_list))]:
+                        if flk[4] > 0:
+                            flake_stamp = stamp_cache.get_circle(flk[4], (255, 255, 255, flk[5]))
+                            if flake_stamp:
+                                world_blit_batch.add(flake_stamp, (int(flk[0] - flk[4]), int(flk[1] - flk[4])))
+                    world_blit_batch.flush(world_render_surface)
+                for bcn in beacons_group: bcn.draw(world_render_surface, render_cam_y_offset)
+                for portal_sprite in portal_group: portal_sprite.draw(world_render_surface, render_cam_y_offset)
+            profiler.mark("snow_beacons_draw")
+
+            world_blit_batch.draw_sprites(world_render_surface, obstacles_group, render_cam_y_offset)
+            for exp in explosions_group: exp.draw(world_render_surface, render_cam_y_offset)
+            for deb_fx in debris_effects_group: deb_fx.draw(world_render_surface, render_cam_y_offset)
+            if current_ramp_obj: current_ramp_obj.draw(world_render_surface, render_cam_y_offset)
 
             if player_obj and not player_obj.is_hidden:
-                player_obj.draw(world_render_surface, cam_y_offset)
+                player_obj.draw(world_render_surface, render_cam_y_offset)
 
-            for lsr in lasers_group: world_render_surface.blit(lsr.image, (lsr.rect.x, lsr.rect.y - cam_y_offset))
+            world_blit_batch.draw_sprites(world_render_surface, lasers_group, render_cam_y_offset)
+            profiler.mark("sprites_draw")
 
             if current_gs_draw == gs.PLAYING and gs.is_level_2_simple_mode and \
                     gs.level2_win_sequence_active and gs.level2_player_reached_stairs:
@@ -2618,7 +2672,9 @@ while running:
                 flash_surface_overlay.fill((255, 255, 255, alpha))
                 world_render_surface.blit(flash_surface_overlay, (0, 0))
 
+        restore_render_interpolation(interpolated_moves)
         screen.blit(world_render_surface, (current_screen_offset_x, current_screen_offset_y))
+        profiler.mark("world_blit")
 
         if current_gs_draw == gs.TUTORIAL:
             ui.draw_tutorial_ui_elements(screen, tutorial_font, font, player_obj, gs.tutorial_jump_done,
@@ -2626,7 +2682,7 @@ while running:
         elif current_gs_draw == gs.PLAYING:
             if player_obj and (
                     player_obj.is_active or not gs.portal_reached) and not gs.level2_player_hidden_after_stairs:
-                hud_manager.draw(screen, gs, player_obj, config, time_delta_seconds)
+                hud_manager.draw(screen, gs, player_obj, config, frame_delta_seconds)
 
             if gs.ariel_display_active and ariel_image_scaled and ariel_font:
                 ariel_draw_x_base = gs.ariel_current_x
@@ -2651,7 +2707,7 @@ while running:
                                                   num_lines - 1) * ariel_font.get_linesize() + ariel_font.get_height() if num_lines > 0 else 0
                 line_y_start = text_box_draw_y + (current_text_box_height - total_text_block_height) / 2
                 for i, line_text in enumerate(gs.ariel_current_message_lines):
-                    text_surface = ariel_font.render(line_text, True, config.ARIEL_TEXT_COLOR)
+                    text_surface = text_cache.render(ariel_font, line_text, config.ARIEL_TEXT_COLOR)
                     text_rect = text_surface.get_rect(centerx=text_box_draw_x + text_box_width / 2,
                                                       top=line_y_start + i * ariel_font.get_linesize())
                     screen.blit(text_surface, text_rect)
@@ -2670,15 +2726,17 @@ while running:
                 shadow_color = (30, 100, 30)
                 text_color = (100, 255, 100)
                 msg_center_x, msg_center_y = config.WIDTH // 2 + current_screen_offset_x, config.HEIGHT // 3 + current_screen_offset_y
-                msg_surf_shadow = message_font.render(gs.colony_saved_message_text, True, shadow_color)
+                msg_surf_shadow = text_cache.render(message_font, gs.colony_saved_message_text, shadow_color).copy()
                 msg_surf_shadow.set_alpha(int(alpha * 0.7))
                 msg_rect_shadow = msg_surf_shadow.get_rect(
                     center=(msg_center_x + shadow_offset, msg_center_y + shadow_offset))
                 screen.blit(msg_surf_shadow, msg_rect_shadow)
-                msg_surf_main = message_font.render(gs.colony_saved_message_text, True, text_color)
+                msg_surf_main = text_cache.render(message_font, gs.colony_saved_message_text, text_color).copy()
                 msg_surf_main.set_alpha(alpha)
                 msg_rect_main = msg_surf_main.get_rect(center=(msg_center_x, msg_center_y))
                 screen.blit(msg_surf_main, msg_rect_main)
+        profiler.mark("hud_draw")
+        profiler.draw_overlay(screen)
         pygame.display.flip()
 
     elif current_gs_draw == gs.PAUSED:
@@ -2702,6 +2760,23 @@ while running:
         vol_str = "N/A" if not pygame.mixer.get_init() else f"{int(gs.music_volume * 100)}%"
         ui.draw_settings(screen, font, vol_str, config.WIDTH, config.HEIGHT)
         pygame.display.flip()
+    profiler.mark("present")
+    profiler.end_frame(current_gs_draw)
+
+    if benchmark.active_run:
+        benchmark_counts = {
+            "obstacles": len(obstacles_group), "lasers": len(lasers_group),
+            "explosions": len(explosions_group), "debris_effects": len(debris_effects_group),
+            "beacons": len(beacons_group), "meteors": len(meteors_list),
+            "snowflakes": sum(len(layer) for layer in snowflakes_by_layer),
+        }
+        if terrain_obj:
+            benchmark_counts["terrain_particles"] = sum(
+                len(emitter) for emitter in vars(terrain_obj).values() if isinstance(emitter, ParticleEmitter))
+        if player_obj:
+            benchmark_counts["player_particles"] = sum(
+                len(emitter) for emitter in vars(player_obj).values() if isinstance(emitter, ParticleEmitter))
+        if not benchmark.active_run.end_frame(benchmark_counts): running = False
 
 pygame.quit()
 if level1_video_player: level1_video_player.release()
@@ -2728,4 +2803,9 @@ for obs in obstacles_group:
 if boulder_sound_effect_channel and boulder_sound_effect_channel.get_busy():
     print("Boulder sound: Stopping due to game exit.")
     boulder_sound_effect_channel.stop()
+stamp_cache.report()
+rotation_cache.report()
+text_cache.report()
+pool.report()
+if profiler.enabled: profiler.stop()
 sys.exit()
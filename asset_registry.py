@@ -0,0 +1,78 @@
+# asset_registry.py
+import pygame
+import os
+import sys
+
+CONVERT_ALPHA = "alpha"
+CONVERT_OPAQUE = "opaque"
+CONVERT_NONE = "none"
+
+_image_cache = {}
+_built_cache = {}
+_assets_dir = None
+
+
+def get_assets_dir():
+    global _assets_dir
+    if _assets_dir is None:
+        main_script_dir = os.path.dirname(
+            os.path.abspath(sys.argv[0] if hasattr(sys, 'argv') and sys.argv else __file__))
+        candidates = [os.path.join(main_script_dir, "assets"),
+                      os.path.join(os.path.dirname(main_script_dir), "assets"),
+                      os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")]
+        _assets_dir = candidates[0]
+        for candidate in candidates:
+            if os.path.isdir(candidate):
+                _assets_dir = candidate
+                break
+    return _assets_dir
+
+
+def get_asset_path(filename):
+    return os.path.join(get_assets_dir(), filename)
+
+
+def get_image(filename, size=None, convert_mode=CONVERT_ALPHA):
+    key = (filename, tuple(size) if size else None, convert_mode)
+    if key in _image_cache:
+        return _image_cache[key]
+
+    image = None
+    path = get_asset_path(filename)
+    try:
+        if os.path.exists(path):
+            image = pygame.image.load(path)
+            if convert_mode == CONVERT_ALPHA:
+                image = image.convert_alpha()
+            elif convert_mode == CONVERT_OPAQUE:
+                image = image.convert()
+            if size:
+                image = pygame.transform.smoothscale(image, (int(size[0]), int(size[1])))
+        else:
+            print(f"Asset registry: image '{filename}' not found at {path}")
+    except Exception as e:
+        print(f"Asset registry: error loading image '{filename}': {e}")
+        image = None
+
+    _image_cache[key] = image
+    return image
+
+
+def get_frames(filename_pattern, indices, size=None, convert_mode=CONVERT_ALPHA):
+    frames = []
+    for i in indices:
+        frame = get_image(filename_pattern.format(i), size, convert_mode)
+        if frame:
+            frames.append(frame)
+    return frames
+
+
+def get_built(key, build_func):
+    if key not in _built_cache:
+        _built_cache[key] = build_func()
+    return _built_cache[key]
+
+
+def clear():
+    _image_cache.clear()
+    _built_cache.clear()
@@ -1,7 +1,8 @@
 # avalanche.py
 import pygame
-from config import WIDTH, HEIGHT, AVALANCHE_SPEED, CHECKPOINT_DISTANCES, PLAYER_SCREEN_X 
+from config import WIDTH, HEIGHT, AVALANCHE_SPEED, CHECKPOINT_DISTANCES, PLAYER_SCREEN_X, FPS
 import game_state as gs 
+import numpy as np
 
 AVALANCHE_ENDGAME_CATCHUP_SLOW_FACTOR = 0.4 
 MAX_CONTINUOUS_AVALANCHE_SHAKE = 7  
@@ -17,6 +18,8 @@ class Avalanche:
         self.sound_channel = None
         self.is_sound_looping = False
         self.continuous_shake_magnitude = 0
+        self.scratch_surface = None
+        self.fallback_surface = None
 
     def reset(self, initial_offset_val):
         self.offset = initial_offset_val
@@ -30,7 +33,7 @@ class Avalanche:
         self.is_sound_looping = False
 
     def update(self, player_screen_x_pos, _player_is_in_cloud_jump_unused, current_game_state,
-               set_game_state_func):  
+               set_game_state_func, time_delta_seconds=None):  
         
         if current_game_state == 'tutorial':
             if self.is_sound_looping and self.sound_channel:  
@@ -52,6 +55,8 @@ class Avalanche:
             if 0 < distance_avalanche_to_player < catch_up_threshold:
                 current_applied_avalanche_speed = AVALANCHE_SPEED * AVALANCHE_ENDGAME_CATCHUP_SLOW_FACTOR
 
+        if time_delta_seconds is not None:
+            current_applied_avalanche_speed *= time_delta_seconds * FPS
         self.offset += current_applied_avalanche_speed
 
      
@@ -139,36 +144,36 @@ class Avalanche:
             draw_width_from_image = min(avalanche_visible_width_on_screen, img_total_width)
 
             if draw_width_from_image > 0:
+                if self.scratch_surface is None or self.scratch_surface.get_size() != (img_total_width, img_height):
+                    self.scratch_surface = pygame.Surface((img_total_width, img_height), pygame.SRCALPHA)
+                scratch = self.scratch_surface
                 source_rect_x_on_main_image = img_total_width - draw_width_from_image
-                source_rect = pygame.Rect(source_rect_x_on_main_image, 0, draw_width_from_image, img_height)
-                blit_target_pos = (0, 0)
-                per_frame_avalanche_draw_surface = pygame.Surface((draw_width_from_image, img_height), pygame.SRCALPHA)
-                per_frame_avalanche_draw_surface.fill((0, 0, 0, 0))
-                per_frame_avalanche_draw_surface.blit(avalanche_image_surface, (0, 0), area=source_rect)
+                visible_height = img_height
 
                 if terrain_obj:
-                    mask_polygon_points = []
-                    terrain_check_step = 5
-                    for x_on_temp_surf in range(0, draw_width_from_image, terrain_check_step):
-                        terrain_world_y = terrain_obj.height_at(x_on_temp_surf)
-                        terrain_y_on_temp_surf = terrain_world_y - camera_y_offset
-                        mask_polygon_points.append((x_on_temp_surf, terrain_y_on_temp_surf))
-
-                    if not mask_polygon_points or mask_polygon_points[-1][0] < draw_width_from_image - 1:
-                        x_on_temp_surf = draw_width_from_image - 1
-                        terrain_world_y = terrain_obj.height_at(x_on_temp_surf)
-                        terrain_y_on_temp_surf = terrain_world_y - camera_y_offset
-                        mask_polygon_points.append((x_on_temp_surf, terrain_y_on_temp_surf))
-
-                    if len(mask_polygon_points) >= 2:
-                        mask_polygon_points.append((draw_width_from_image - 1, img_height))
-                        mask_polygon_points.append((0, img_height))
-                        try:
-                            pygame.draw.polygon(per_frame_avalanche_draw_surface, (0, 0, 0, 0), mask_polygon_points)
-                        except Exception as e:
-                            pass
-                surface.blit(per_frame_avalanche_draw_surface, blit_target_pos)
+                    cut_ys = terrain_obj.heights_at(np.arange(draw_width_from_image, dtype=np.float64)) - camera_y_offset
+                    cut_ys = np.clip(np.ceil(cut_ys), 0, img_height).astype(np.int32)
+                    band_top = int(cut_ys.min())
+                    visible_height = int(cut_ys.max())
+                    if visible_height <= 0:
+                        return
+                    scratch.fill((0, 0, 0, 0), (0, 0, draw_width_from_image, visible_height))
+                    scratch.blit(avalanche_image_surface, (0, 0),
+                                 area=pygame.Rect(source_rect_x_on_main_image, 0, draw_width_from_image, visible_height))
+                    if visible_height > band_top:
+                        alpha = pygame.surfarray.pixels_alpha(scratch)
+                        band = alpha[:draw_width_from_image, band_top:visible_height]
+                        rows = np.arange(band_top, visible_height, dtype=np.int32)
+                        band[rows[None, :] >= cut_ys[:, None]] = 0
+                        del band, alpha
+                else:
+                    scratch.fill((0, 0, 0, 0), (0, 0, draw_width_from_image, visible_height))
+                    scratch.blit(avalanche_image_surface, (0, 0),
+                                 area=pygame.Rect(source_rect_x_on_main_image, 0, draw_width_from_image, visible_height))
+                surface.blit(scratch, (0, 0), area=pygame.Rect(0, 0, draw_width_from_image, visible_height))
         else:
-            fallback_surface = pygame.Surface((avalanche_visible_width_on_screen, HEIGHT), pygame.SRCALPHA)
-            fallback_surface.fill((220, 220, 230, 100))
-            surface.blit(fallback_surface, (0, 0))
+            if self.fallback_surface is None:
+                self.fallback_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+                self.fallback_surface.fill((220, 220, 230, 100))
+            surface.blit(self.fallback_surface, (0, 0),
+                         area=pygame.Rect(0, 0, min(avalanche_visible_width_on_screen, WIDTH), HEIGHT))
@@ -0,0 +1,196 @@
+# benchmark.py
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import contextlib
+import numpy as np
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+import quality
+import pool
+import rotation_cache
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+LEVEL_TUTORIAL = "tutorial"
+LEVEL_1 = "1"
+LEVEL_2 = "2"
+ACTION_KEYS = {"jump": pygame.K_SPACE, "shoot": pygame.K_f}
+
+active_run = None
+
+
+def default_script(seconds, jump_every=1.1, shoot_every=0.9):
+    script = []
+    t = 0.5
+    while t < seconds:
+        script.append({"time": round(t, 3), "action": "jump"})
+        t += jump_every
+    t = 0.8
+    while t < seconds:
+        script.append({"time": round(t, 3), "action": "shoot"})
+        t += shoot_every
+    return sorted(script, key=lambda entry: entry["time"])
+
+
+def _percentiles(samples):
+    if not samples:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    values = np.asarray(samples, dtype=np.float64)
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {"mean": round(float(values.mean()), 3), "p50": round(float(p50), 3), "p95": round(float(p95), 3),
+            "p99": round(float(p99), 3), "max": round(float(values.max()), 3)}
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024.0 * 1024.0) if sys.platform == "darwin" else peak / 1024.0, 1)
+
+
+class BenchmarkRun:
+    def __init__(self, level, seconds, seed, script, warmup_seconds=1.0, fps=60):
+        self.level = level
+        self.seed = seed
+        self.fps = fps
+        self.total_frames = int(seconds * fps)
+        self.warmup_frames = int(warmup_seconds * fps)
+        self.script = sorted(script, key=lambda entry: entry["time"])
+        self.script_pos = 0
+        self.frame_index = 0
+        self.restarts = 0
+        self.start_level_func = None
+        self.active_states = ()
+        self.update_ms = []
+        self.draw_ms = []
+        self.frame_ms = []
+        self.entity_samples = {}
+        self.frame_start = 0.0
+        self.draw_start = 0.0
+        self.wall_start = 0.0
+
+    def start_level(self, setup_tutorial_state, reset_game_state_vars, active_states):
+        def start():
+            if self.level == LEVEL_TUTORIAL:
+                setup_tutorial_state()
+            else:
+                reset_game_state_vars(start_playing=True, is_simple_level_setup=(self.level == LEVEL_2))
+        self.start_level_func = start
+        self.active_states = tuple(active_states)
+        start()
+        self.wall_start = time.perf_counter()
+
+    def begin_frame(self, current_state):
+        if current_state not in self.active_states and self.start_level_func:
+            self.restarts += 1
+            self.start_level_func()
+        game_time = self.frame_index / float(self.fps)
+        while self.script_pos < len(self.script) and self.script[self.script_pos]["time"] <= game_time:
+            key = ACTION_KEYS.get(self.script[self.script_pos]["action"])
+            if key is not None:
+                pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode=""))
+            self.script_pos += 1
+        self.frame_start = time.perf_counter()
+
+    def game_ticks(self):
+        return int(self.frame_index * 1000 / self.fps)
+
+    def begin_draw(self):
+        self.draw_start = time.perf_counter()
+
+    def end_frame(self, entity_counts):
+        now = time.perf_counter()
+        if self.frame_index >= self.warmup_frames:
+            self.update_ms.append((self.draw_start - self.frame_start) * 1000.0)
+            self.draw_ms.append((now - self.draw_start) * 1000.0)
+            self.frame_ms.append((now - self.frame_start) * 1000.0)
+            for name, count in entity_counts.items():
+                self.entity_samples.setdefault(name, []).append(count)
+        self.frame_index += 1
+        return self.frame_index < self.total_frames
+
+    def report(self):
+        entities = {}
+        for name, counts in self.entity_samples.items():
+            entities[name] = {"mean": round(float(np.mean(counts)), 1), "max": int(np.max(counts))}
+        measured_frames = len(self.frame_ms)
+        wall_seconds = time.perf_counter() - self.wall_start
+        return {
+            "level": self.level,
+            "seed": self.seed,
+            "frames": self.frame_index,
+            "measured_frames": measured_frames,
+            "wall_seconds": round(wall_seconds, 3),
+            "avg_fps": round(self.frame_index / wall_seconds, 1) if wall_seconds > 0 else 0.0,
+            "restarts": self.restarts,
+            "update_ms": _percentiles(self.update_ms),
+            "draw_ms": _percentiles(self.draw_ms),
+            "frame_ms": _percentiles(self.frame_ms),
+            "entities": entities,
+            "peak_rss_mb": _peak_rss_mb(),
+            "quality": quality.stats(),
+            "pools": pool.stats(),
+            "rotation_cache": rotation_cache.stats(),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a headless, scripted benchmark of Zephyr Odyssey.")
+    parser.add_argument("--level", choices=[LEVEL_TUTORIAL, LEVEL_1, LEVEL_2], default=LEVEL_1)
+    parser.add_argument("--seconds", type=float, default=30.0, help="game time to simulate (frames = seconds * FPS)")
+    parser.add_argument("--warmup", type=float, default=1.0, help="game seconds excluded from the statistics")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--script", help="JSON list of {\"time\": seconds, \"action\": \"jump\"|\"shoot\"}")
+    parser.add_argument("--quality", default="high",
+                        help="quality tier to pin for the run, or 'auto' to let the governor adapt")
+    parser.add_argument("--out", help="write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+    import config
+    import benchmark
+    if args.script:
+        with open(args.script, "r", encoding="utf-8") as script_file:
+            script = json.load(script_file)
+    else:
+        script = default_script(args.seconds)
+
+    if args.quality != "auto":
+        quality.pin(args.quality)
+    random.seed(args.seed)
+    np.random.seed(args.seed)
+    benchmark.active_run = BenchmarkRun(args.level, args.seconds, args.seed, script, args.warmup, config.FPS)
+
+    import runpy
+    main_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Main.py")
+    wall_get_ticks = pygame.time.get_ticks
+    pygame.time.get_ticks = benchmark.active_run.game_ticks
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            runpy.run_path(main_path, run_name="__main__")
+    except SystemExit:
+        pass
+    finally:
+        pygame.time.get_ticks = wall_get_ticks
+
+    report_json = json.dumps(benchmark.active_run.report(), indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as out_file:
+            out_file.write(report_json + "\n")
+        print(f"Benchmark report written to {args.out}", file=sys.stderr)
+    else:
+        print(report_json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+# blit_batch.py
+
+
+class BlitBatch:
+    def __init__(self):
+        self.items = []
+
+    def __len__(self):
+        return len(self.items)
+
+    def add(self, image, position):
+        if image is not None:
+            self.items.append((image, position))
+
+    def flush(self, surface):
+        if self.items:
+            surface.blits(self.items, doreturn=False)
+            self.items.clear()
+
+    def draw_sprites(self, surface, sprites, camera_y_offset):
+        for sprite in sprites:
+            item = sprite.blit_item(camera_y_offset) if hasattr(sprite, 'blit_item') else None
+            if item is not None:
+                self.items.append(item)
+            else:
+                self.flush(surface)
+                sprite.draw(surface, camera_y_offset)
+        self.flush(surface)
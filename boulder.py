@@ -3,6 +3,7 @@ import pygame
 import os
 import sys
 import math
+import threading
 import config as cfg
 import game_state as gs
 
@@ -25,13 +26,28 @@ class Boulder(pygame.sprite.Sprite):
         self.offset = cfg.BOULDER_INITIAL_OFFSET
         
         self.rotation_angle = 0.0
-        
+        self.image_angle = 0.0
+
+        self.rotation_frames = None
+        if cfg.BOULDER_ROTATION_TABLE_IN_BACKGROUND:
+            threading.Thread(target=self._build_rotation_table, name="boulder-rotation-table", daemon=True).start()
+        else:
+            self._build_rotation_table()
 
         self._update_rect_and_y_from_offset() 
 
+    def _build_rotation_table(self):
+        try:
+            step = 360.0 / cfg.BOULDER_ROTATION_FRAMES
+            frames = [pygame.transform.rotate(self.original_image, i * step) for i in range(cfg.BOULDER_ROTATION_FRAMES)]
+            self.rotation_frames = frames
+        except pygame.error as e:
+            print(f"BOULDER ERROR: Could not build rotation table ({e}). Rotating per frame instead.")
+
     def reset(self):
         self.offset = cfg.BOULDER_INITIAL_OFFSET
         self.rotation_angle = 0.0
+        self.image_angle = 0.0
         if self.original_image: 
             self.image = self.original_image
         self._update_rect_and_y_from_offset()
@@ -52,11 +68,12 @@ class Boulder(pygame.sprite.Sprite):
         self.rect.midbottom = (self.rect.centerx, int(terrain_y_world_at_boulder_center))
 
 
-    def update(self, is_catch_up_mode, player_screen_x_pos): 
+    def update(self, is_catch_up_mode, player_screen_x_pos, time_delta_seconds=None): 
         """
         Updates the boulder's position and rotation.
         is_catch_up_mode: Boolean, true if boulder should speed up.
         player_screen_x_pos: The player's fixed screen X coordinate (e.g., cfg.PLAYER_SCREEN_X).
+        time_delta_seconds: Simulation step; the per-frame speeds are scaled by it (defaults to one frame).
         """
         if not self.rect or not self.original_image:
             return
@@ -65,6 +82,8 @@ class Boulder(pygame.sprite.Sprite):
         current_speed_this_frame = cfg.BOULDER_SPEED_PER_FRAME
         if is_catch_up_mode:
             current_speed_this_frame += cfg.BOULDER_CATCHUP_SPEED_BONUS_PER_FRAME
+        if time_delta_seconds is not None:
+            current_speed_this_frame *= time_delta_seconds * cfg.FPS
         
         self.offset += current_speed_this_frame
 
@@ -75,7 +94,14 @@ class Boulder(pygame.sprite.Sprite):
         old_center_x = self.rect.centerx 
         
       
-        self.image = pygame.transform.rotate(self.original_image, self.rotation_angle)
+        rotation_frames = self.rotation_frames
+        if rotation_frames:
+            frame_index = int(round(self.rotation_angle * len(rotation_frames) / 360.0)) % len(rotation_frames)
+            self.image = rotation_frames[frame_index]
+            self.image_angle = frame_index * 360.0 / len(rotation_frames)
+        else:
+            self.image = pygame.transform.rotate(self.original_image, self.rotation_angle)
+            self.image_angle = self.rotation_angle
         
      
         self.rect = self.image.get_rect(centerx=old_center_x)
@@ -70,6 +70,11 @@ class CeilingDecoration(pygame.sprite.Sprite):
         if self.rect.right < -50:
             self.kill()
 
+    def blit_item(self, camera_y_offset):
+        if self.image and self.rect:
+            return self.image, (self.rect.x, self.rect.y - camera_y_offset)
+        return None
+
     def draw(self, surface, camera_y_offset):
         if self.image and self.rect:
             draw_rect = self.rect.copy()
@@ -2,9 +2,10 @@
 import pygame
 import random
 import math
-import os
-import sys
+import numpy as np
 from config import WIDTH, HEIGHT  
+import asset_registry
+from particles import ParticleEmitter
 
 
 TARGET_BEACON_WIDTH = 100  
@@ -12,6 +13,16 @@ TARGET_BEACON_HEIGHT = 120
 BEACON_FLOATING_OFFSET_Y = 8  
 
 
+def _build_beacon_image(filename, fallback_color):
+    image = asset_registry.get_image(filename, (TARGET_BEACON_WIDTH, TARGET_BEACON_HEIGHT))
+    if image:
+        return image
+    print(f"ERROR: {filename} not available, using fallback.")
+    fallback = pygame.Surface((28, 56), pygame.SRCALPHA)
+    fallback.fill(fallback_color)
+    return pygame.transform.smoothscale(fallback, (TARGET_BEACON_WIDTH, TARGET_BEACON_HEIGHT))
+
+
 class Beacon(pygame.sprite.Sprite):
     def __init__(self, screen_spawn_x, terrain_obj):
         super().__init__()
@@ -30,7 +41,7 @@ class Beacon(pygame.sprite.Sprite):
         self.ground_shockwave_radius = 0
         self.max_ground_shockwave_radius = 0
         self.ground_shockwave_alpha = 0
-        self.intake_particles = []
+        self.intake_particles = ParticleEmitter(0)
 
         self.ignition_blast_radius = 0
         self.ignition_blast_alpha = 0
@@ -54,16 +65,16 @@ class Beacon(pygame.sprite.Sprite):
         self.ray_fade_speed = 25
         self.ray_tip_flare_radius = 0
 
-        self.ray_tip_sparkles = []
         self.max_ray_tip_sparkles = 10
+        self.ray_tip_sparkles = ParticleEmitter(self.max_ray_tip_sparkles, gravity=0.15)
         self.ray_tip_sparkle_spawn_chance = 0.6
 
         self.activation_elements = []
         self.activation_duration_ms = 350
         self.activation_colors = [(100, 255, 100), (150, 255, 150), (200, 255, 200)]
 
-        self.trailing_exhaust_particles = []
         self.max_trailing_exhaust = 30
+        self.trailing_exhaust_particles = ParticleEmitter(self.max_trailing_exhaust, gravity=-0.03)
         self.last_exhaust_spawn = 0
         self.trailing_particle_spawn_interval = 30
         self.trailing_particle_color_start = (100, 255, 100)
@@ -72,40 +83,12 @@ class Beacon(pygame.sprite.Sprite):
         self.sky_burst_elements = []
         self.sky_burst_active = False
 
-        self.image_red_asset_orig = None
-        self.image_green_asset_orig = None
-
-        try:
-            main_script_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
-            path_red = os.path.join(main_script_dir, "assets", "BeconRed.png")
-            path_green = os.path.join(main_script_dir, "assets", "BeconGreen.png")
-
-            if os.path.exists(path_red):
-                self.image_red_asset_orig = pygame.image.load(path_red).convert_alpha()
-            else:
-                print(f"ERROR: BeconRed.png not found at {path_red}")
-                self.image_red_asset_orig = pygame.Surface((28, 56), pygame.SRCALPHA)
-                self.image_red_asset_orig.fill((255, 0, 0, 200))
-
-            if os.path.exists(path_green):
-                self.image_green_asset_orig = pygame.image.load(path_green).convert_alpha()
-            else:
-                print(f"ERROR: BeconGreen.png not found at {path_green}")
-                self.image_green_asset_orig = pygame.Surface((28, 56), pygame.SRCALPHA)
-                self.image_green_asset_orig.fill((0, 255, 0, 200))
-        except Exception as e:
-            print(f"Error loading beacon images: {e}")
-            if not self.image_red_asset_orig:
-                self.image_red_asset_orig = pygame.Surface((28, 56), pygame.SRCALPHA)
-                self.image_red_asset_orig.fill((255, 0, 0, 200))
-            if not self.image_green_asset_orig:
-                self.image_green_asset_orig = pygame.Surface((28, 56), pygame.SRCALPHA)
-                self.image_green_asset_orig.fill((0, 255, 0, 200))
-
-        self.image_red_asset = pygame.transform.smoothscale(self.image_red_asset_orig,
-                                                            (TARGET_BEACON_WIDTH, TARGET_BEACON_HEIGHT))
-        self.image_green_asset = pygame.transform.smoothscale(self.image_green_asset_orig,
-                                                              (TARGET_BEACON_WIDTH, TARGET_BEACON_HEIGHT))
+        self.image_red_asset = asset_registry.get_built(
+            ("beacon", "BeconRed.png", TARGET_BEACON_WIDTH, TARGET_BEACON_HEIGHT),
+            lambda: _build_beacon_image("BeconRed.png", (255, 0, 0, 200)))
+        self.image_green_asset = asset_registry.get_built(
+            ("beacon", "BeconGreen.png", TARGET_BEACON_WIDTH, TARGET_BEACON_HEIGHT),
+            lambda: _build_beacon_image("BeconGreen.png", (0, 255, 0, 200)))
 
         self.image = self.image_red_asset
         self.width, self.height = self.image.get_size()
@@ -176,22 +159,12 @@ class Beacon(pygame.sprite.Sprite):
         self.ignition_blast_alpha = 255 * math.sin(progress * math.pi)
         self.beacon_pulse_magnitude = 1.0
 
-    def _simple_particle_update(self, particle_list, time_delta_seconds, time_factor, gravity=0.1, alpha_decay_rate=5,
-                                fixed_x_screen=None):
-        active_particles = []
-        for p in particle_list:
-            p['y_world'] += p['vy'] * time_factor
-            p['vy'] += gravity * time_factor
-            if 'vx' in p:
-                if fixed_x_screen is None:  
-                    p['x_offset'] += p['vx'] * time_factor
-                p['vx'] *= 0.98
-
-            p['life'] -= time_delta_seconds
-            p['alpha'] -= alpha_decay_rate * time_factor
-            if p['life'] > 0 and p['alpha'] > 10:
-                active_particles.append(p)
-        return active_particles
+    def _simple_particle_update(self, particles, time_delta_seconds, time_factor, alpha_decay_rate=5):
+        if not particles: return
+        particles.integrate(time_factor, drag_x=0.98, move_x=False)
+        particles.age(time_delta_seconds)
+        particles.decay_alpha(alpha_decay_rate * time_factor)
+        particles.cull(min_alpha=10, require_life=True)
 
     def _update_ray_and_associated_particles(self, time_delta_seconds):
         time_factor = 60 * time_delta_seconds
@@ -205,31 +178,29 @@ class Beacon(pygame.sprite.Sprite):
                 1 + 0.8 * math.sin(pygame.time.get_ticks() * 0.06))
 
         if len(self.ray_tip_sparkles) < self.max_ray_tip_sparkles and random.random() < self.ray_tip_sparkle_spawn_chance:
-            self.ray_tip_sparkles.append(
-                {'x_offset': random.uniform(-self.ray_core_thickness * 0.7, self.ray_core_thickness * 0.7),
-                 'y_world': self.ray_current_top_y_world + random.uniform(-25, 15), 
-                 'vy': -random.uniform(self.ray_speed * 0.15, self.ray_speed * 0.4),
-                 'life': random.uniform(0.2, 0.45), 'alpha': random.randint(230, 255), 'size': random.randint(2, 5)})
+            self.ray_tip_sparkles.spawn(
+                1, x=random.uniform(-self.ray_core_thickness * 0.7, self.ray_core_thickness * 0.7),
+                y=self.ray_current_top_y_world + random.uniform(-25, 15), 
+                vy=-random.uniform(self.ray_speed * 0.15, self.ray_speed * 0.4),
+                life=random.uniform(0.2, 0.45), alpha=random.randint(230, 255), size=random.randint(2, 5))
         
-        self.ray_tip_sparkles = self._simple_particle_update(self.ray_tip_sparkles, time_delta_seconds, time_factor,
-                                                             gravity=0.15, alpha_decay_rate=12, fixed_x_screen=True)
+        self._simple_particle_update(self.ray_tip_sparkles, time_delta_seconds, time_factor, alpha_decay_rate=12)
 
         current_ticks = pygame.time.get_ticks()
         if current_ticks - self.last_exhaust_spawn > self.trailing_particle_spawn_interval and len(
                 self.trailing_exhaust_particles) < self.max_trailing_exhaust:
             self.last_exhaust_spawn = current_ticks
             spawn_y_exhaust = self.world_y + self.height * 0.5
-            self.trailing_exhaust_particles.append({'x_offset': random.uniform(-self.width * 0.2, self.width * 0.2),
-                                                    'y_world': spawn_y_exhaust, 
-                                                    'vy': self.beacon_fly_speed * random.uniform(0.1,
-                                                                                                 0.4) * 0.15 - random.uniform(
-                                                        0.8, 2.0),
-                                                    'vx': random.uniform(-1.0, 1.0), 'life': random.uniform(0.6, 1.2),
-                                                    'alpha': random.randint(150, 220), 'size': random.randint(3, 6)})
+            self.trailing_exhaust_particles.spawn(1, x=random.uniform(-self.width * 0.2, self.width * 0.2),
+                                                  y=spawn_y_exhaust, 
+                                                  vy=self.beacon_fly_speed * random.uniform(0.1,
+                                                                                            0.4) * 0.15 - random.uniform(
+                                                      0.8, 2.0),
+                                                  vx=random.uniform(-1.0, 1.0), life=random.uniform(0.6, 1.2),
+                                                  alpha=random.randint(150, 220), size=random.randint(3, 6))
         
-        self.trailing_exhaust_particles = self._simple_particle_update(self.trailing_exhaust_particles,
-                                                                       time_delta_seconds, time_factor, gravity=-0.03,
-                                                                       alpha_decay_rate=2.5, fixed_x_screen=True)
+        self._simple_particle_update(self.trailing_exhaust_particles, time_delta_seconds, time_factor,
+                                     alpha_decay_rate=2.5)
 
     def _update_sky_burst(self, time_delta_seconds, progress):
         if not self.sky_burst_active:
@@ -287,13 +258,10 @@ class Beacon(pygame.sprite.Sprite):
                 self.current_ray_alpha = max(0, self.current_ray_alpha - self.ray_fade_speed * (
                         60 * time_delta_seconds) * 0.35)
                 self.world_y -= self.beacon_fly_speed * 0.2 * (60 * time_delta_seconds)
-                self.ray_tip_sparkles = self._simple_particle_update(self.ray_tip_sparkles, time_delta_seconds,
-                                                                     (60 * time_delta_seconds), gravity=0.15,
-                                                                     alpha_decay_rate=15, fixed_x_screen=True)
-                self.trailing_exhaust_particles = self._simple_particle_update(self.trailing_exhaust_particles,
-                                                                               time_delta_seconds,
-                                                                               (60 * time_delta_seconds), gravity=-0.03,
-                                                                               alpha_decay_rate=3, fixed_x_screen=True)
+                self._simple_particle_update(self.ray_tip_sparkles, time_delta_seconds, (60 * time_delta_seconds),
+                                             alpha_decay_rate=15)
+                self._simple_particle_update(self.trailing_exhaust_particles, time_delta_seconds,
+                                             (60 * time_delta_seconds), alpha_decay_rate=3)
                 if progress >= 1.0 and self.current_ray_alpha <= 0 and \
                         not self.ray_tip_sparkles and not self.trailing_exhaust_particles and \
                         (not self.sky_burst_active or not self.sky_burst_elements):
@@ -335,15 +303,18 @@ class Beacon(pygame.sprite.Sprite):
                                        int(self.ground_shockwave_radius), random.randint(2, 4))
                 except TypeError:
                     pass
-            for p in self.intake_particles:
-                if p['alpha'] > 10:
+            intake = self.intake_particles
+            for x_off, y_off, alpha, size, color in zip(intake['x'].tolist(), intake['y'].tolist(),
+                                                        intake['alpha'].tolist(), intake['size'].tolist(),
+                                                        intake.colors().tolist()):
+                if alpha > 10:
                  
-                    p_x = draw_x_effects_center + p['x_off']
-                    p_y = (draw_y_beacon_current_center + p['y_off']) - camera_y_offset
+                    p_x = draw_x_effects_center + x_off
+                    p_y = (draw_y_beacon_current_center + y_off) - camera_y_offset
                     try:
-                        pygame.draw.line(surface, (*p['color'], int(p['alpha'])), (int(p_x), int(p_y)),
+                        pygame.draw.line(surface, (*color, int(alpha)), (int(p_x), int(p_y)),
                                          (int(draw_x_effects_center),
-                                          int(draw_y_beacon_current_center - camera_y_offset)), p['size'] // 2 + 1)
+                                          int(draw_y_beacon_current_center - camera_y_offset)), int(size) // 2 + 1)
                     except TypeError:
                         pass
 
@@ -403,39 +374,38 @@ class Beacon(pygame.sprite.Sprite):
                 except TypeError:
                     pass
 
-        for s in self.ray_tip_sparkles:
-            if s['alpha'] > 10:
-                sx = draw_x_effects_center + s['x_offset']
-                sy = s['y_world'] - camera_y_offset
-                s_color = (230, 255, 230, int(max(0, min(255, s['alpha']))))
+        sparkles = self.ray_tip_sparkles
+        for x_off, y_world, alpha, size in zip(sparkles['x'].tolist(), sparkles['y'].tolist(),
+                                               sparkles['alpha'].tolist(), sparkles['size'].tolist()):
+            if alpha > 10:
+                sx = draw_x_effects_center + x_off
+                sy = y_world - camera_y_offset
+                s_color = (230, 255, 230, int(max(0, min(255, alpha))))
                 try:
-                    pygame.draw.circle(surface, s_color, (int(sx), int(sy)), s['size'])
+                    pygame.draw.circle(surface, s_color, (int(sx), int(sy)), int(size))
                 except TypeError:
                     pass
 
-        for p in self.trailing_exhaust_particles:
-            if p['alpha'] > 10:
-                px = draw_x_effects_center + p['x_offset']
-                py = p['y_world'] - camera_y_offset
-                life_prog = max(0, p['life'] / (1.0 if p['life'] > 0.001 else 1))
-                r = max(0, min(255, int(
-                    self.trailing_particle_color_start[0] * life_prog + self.trailing_particle_color_end[0] * (
-                                1 - life_prog))))
-                g = max(0, min(255, int(
-                    self.trailing_particle_color_start[1] * life_prog + self.trailing_particle_color_end[1] * (
-                                1 - life_prog))))
-                b = max(0, min(255, int(
-                    self.trailing_particle_color_start[2] * life_prog + self.trailing_particle_color_end[2] * (
-                                1 - life_prog))))
-                p_alpha = int(max(0, min(255, p['alpha'])))
-                p_color = (r, g, b, p_alpha)
-                end_px = px + p['vx'] * -2.5
-                end_py = py + p['vy'] * -2.5
-                try:
-                    pygame.draw.line(surface, p_color, (int(px), int(py)), (int(end_px), int(end_py)),
-                                     p['size'] // 2 + 1)
-                except TypeError:
-                    pass
+        exhaust = self.trailing_exhaust_particles
+        if exhaust:
+            life_prog = np.maximum(exhaust['life'], 0)[:, None]
+            exhaust_colors = np.clip(np.array(self.trailing_particle_color_start) * life_prog +
+                                     np.array(self.trailing_particle_color_end) * (1 - life_prog), 0, 255).astype(int)
+            for x_off, y_world, pvx, pvy, alpha, size, color in zip(
+                    exhaust['x'].tolist(), exhaust['y'].tolist(), exhaust['vx'].tolist(), exhaust['vy'].tolist(),
+                    exhaust['alpha'].tolist(), exhaust['size'].tolist(), exhaust_colors.tolist()):
+                if alpha > 10:
+                    px = draw_x_effects_center + x_off
+                    py = y_world - camera_y_offset
+                    p_alpha = int(max(0, min(255, alpha)))
+                    p_color = (*color, p_alpha)
+                    end_px = px + pvx * -2.5
+                    end_py = py + pvy * -2.5
+                    try:
+                        pygame.draw.line(surface, p_color, (int(px), int(py)), (int(end_px), int(end_py)),
+                                         int(size) // 2 + 1)
+                    except TypeError:
+                        pass
 
         if self.animation_phase == "sky_connection_burst" or (
                 self.animation_phase == "fading_out" and self.sky_burst_active):
@@ -0,0 +1,155 @@
+# collision.py
+import pygame
+from collections import OrderedDict
+import config
+
+_masks = OrderedDict()
+_mask_hits = 0
+_mask_misses = 0
+
+
+def _cache_mask(key, build):
+    global _mask_hits, _mask_misses
+    mask = _masks.get(key)
+    if mask is not None:
+        _mask_hits += 1
+        _masks.move_to_end(key)
+        return mask
+    _mask_misses += 1
+    mask = build()
+    _masks[key] = mask
+    while len(_masks) > config.COLLISION_MASK_CACHE_MAX_ENTRIES:
+        _masks.popitem(last=False)
+    return mask
+
+
+def angle_bucket(angle):
+    step = config.COLLISION_MASK_ANGLE_STEP
+    return int(round((angle % 360.0) / step)) % int(round(360.0 / step))
+
+
+def image_mask(image):
+    return _cache_mask(image, lambda: pygame.mask.from_surface(image))
+
+
+def bottom_slice_mask(source, height):
+    source_w, source_h = source.get_size()
+    height = max(1, min(source_h, height))
+    return _cache_mask((source, "bottom", height), lambda: pygame.mask.from_surface(
+        source.subsurface(pygame.Rect(0, source_h - height, source_w, height))))
+
+
+def mask_for(sprite):
+    custom = getattr(sprite, "collision_mask", None)
+    if custom is not None:
+        return custom()
+    image = getattr(sprite, "image", None)
+    if image is None or sprite.rect is None:
+        return None, None
+    source = getattr(sprite, "original_image", None)
+    angle = getattr(sprite, "image_angle", 0.0)
+    if source is not None and angle:
+        bucket = angle_bucket(angle)
+        mask = _cache_mask((source, bucket), lambda: pygame.mask.from_surface(
+            pygame.transform.rotate(source, bucket * config.COLLISION_MASK_ANGLE_STEP)))
+        w, h = mask.get_size()
+        return mask, (sprite.rect.centerx - w // 2, sprite.rect.centery - h // 2)
+    return image_mask(image), sprite.rect.topleft
+
+
+def sprites_overlap(a, b):
+    if not config.COLLISION_PIXEL_MASKS:
+        return True
+    mask_a, pos_a = mask_for(a)
+    mask_b, pos_b = mask_for(b)
+    if mask_a is None or mask_b is None:
+        return True
+    return mask_a.overlap(mask_b, (pos_b[0] - pos_a[0], pos_b[1] - pos_a[1])) is not None
+
+
+class SpatialHash:
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def clear(self):
+        self.cells.clear()
+
+    def _cell_range(self, rect):
+        cs = self.cell_size
+        return range(rect.left // cs, (rect.right - 1) // cs + 1), range(rect.top // cs, (rect.bottom - 1) // cs + 1)
+
+    def insert(self, sprite):
+        cells = self.cells
+        xs, ys = self._cell_range(sprite.rect)
+        for cx in xs:
+            for cy in ys:
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cells[(cx, cy)] = [sprite]
+                else:
+                    cell.append(sprite)
+
+    def query(self, rect):
+        cells = self.cells
+        found = []
+        seen = set()
+        xs, ys = self._cell_range(rect)
+        for cx in xs:
+            for cy in ys:
+                for sprite in cells.get((cx, cy), ()):
+                    if id(sprite) not in seen:
+                        seen.add(id(sprite))
+                        found.append(sprite)
+        return found
+
+
+class CollisionWorld:
+    def __init__(self, cell_size=None):
+        self.cell_size = cell_size or config.COLLISION_CELL_SIZE
+        self.layers = {}
+
+    def rebuild(self, layers):
+        self.layers = {}
+        for name, sprites in layers.items():
+            grid = SpatialHash(self.cell_size)
+            for sprite in sprites:
+                if sprite.rect is not None and sprite.rect.width > 0 and sprite.rect.height > 0:
+                    grid.insert(sprite)
+            self.layers[name] = grid
+
+    def collide(self, sprites, layer, precise=False):
+        grid = self.layers.get(layer)
+        pairs = []
+        if grid is None:
+            return pairs
+        for a in sprites:
+            if a is None or a.rect is None:
+                continue
+            for b in grid.query(a.rect):
+                if a.rect.colliderect(b.rect) and (not precise or sprites_overlap(a, b)):
+                    pairs.append((a, b))
+        return pairs
+
+    def frame_hits(self, checks):
+        return {name: self.collide(sprites, layer, precise) for name, (sprites, layer, precise) in checks.items()}
+
+
+def resolve_kills(pairs, kill_a=False, kill_b=False):
+    hits = {}
+    for a, b in pairs:
+        if kill_b and not b.alive():
+            continue
+        hits.setdefault(a, []).append(b)
+        if kill_b:
+            b.kill()
+    if kill_a:
+        for a in hits:
+            a.kill()
+    return hits
+
+
+def stats():
+    lookups = _mask_hits + _mask_misses
+    return {"masks": len(_masks), "hits": _mask_hits, "misses": _mask_misses,
+            "hit_rate": _mask_hits / lookups if lookups else 0.0}
@@ -4,6 +4,12 @@ import math
 
 WIDTH, HEIGHT = 1280, 720
 FPS = 60
+RENDER_FPS_CAP = FPS
+SIMULATION_HZ = FPS
+SIMULATION_MAX_STEPS_PER_FRAME = 5
+SIMULATION_MAX_FRAME_SECONDS = 0.25
+SIMULATION_SNAP_SECONDS = 0.002
+SIMULATION_INTERPOLATION_MAX_JUMP_PX = 96
 
 
 GROUND_Y = HEIGHT * 2 // 3
@@ -36,6 +42,7 @@ OBSTACLE_SPAWN_INTERVAL_MAX = 3000
 MAX_OBSTACLES_ON_SCREEN = 5
 OBSTACLE_SPRITE_WIDTH = 100  
 OBSTACLE_SPRITE_HEIGHT = 190 
+SATELLITE_CLIP_TOLERANCE_PX = 1.0
 
 
 ICE_SPIKE_OVERLAY_WIDTH = 60
@@ -60,6 +67,8 @@ BOULDER_ENABLED_L2 = True
 BOULDER_TARGET_WIDTH = 300
 BOULDER_TARGET_HEIGHT = 300
 BOULDER_ROTATION_SPEED_DEG_PER_PIXEL = 10
+BOULDER_ROTATION_FRAMES = 72
+BOULDER_ROTATION_TABLE_IN_BACKGROUND = True
 
 
 BOULDER_SPEED_PER_FRAME = 0.25
@@ -111,6 +120,13 @@ LASER_GRAVITY = 0.2
 FINAL_RAMP_HEIGHT_RISE = 700
 
 
+VIDEO_DECODE_AHEAD_ENABLED = True
+VIDEO_DECODE_AHEAD_FRAMES = 8
+VIDEO_FRAME_CACHE_ENABLED = True
+VIDEO_FRAME_CACHE_DIR_NAME = "frame_cache"
+VIDEO_FRAME_CACHE_MAX_BYTES = 8 * 1024 ** 3
+
+
 SNOW_LAYERS = [
     {
         "count": 350, "speed_y_min": 0.4, "speed_y_max": 1.2, "base_speed_x_min": -0.1,
@@ -129,6 +145,49 @@ SNOW_LAYERS = [
     }
 ]
 
+STAMP_CACHE_MAX_ENTRIES = 512
+STAMP_CACHE_ALPHA_STEP = 8
+STAMP_CACHE_COLOR_STEP = 4
+
+PROFILER_HISTORY_FRAMES = 240
+PROFILER_BAR_WIDTH = 2
+PROFILER_GRAPH_HEIGHT = 160
+PROFILER_GRAPH_MAX_MS = 33.3
+PROFILER_CSV_DIR_NAME = "profiles"
+
+COLLISION_CELL_SIZE = 128
+COLLISION_PIXEL_MASKS = True
+COLLISION_MASK_ANGLE_STEP = 5
+COLLISION_MASK_HEIGHT_STEP = 6
+COLLISION_MASK_CACHE_MAX_ENTRIES = 256
+
+POOL_MAX_FREE_PER_CLASS = 64
+
+EXPLOSION_ATLAS_VARIANTS = 4
+EXPLOSION_ATLAS_FPS = FPS
+EXPLOSION_ATLAS_IN_BACKGROUND = True
+
+ROTATION_CACHE_ANGLE_STEP = 2
+ROTATION_CACHE_MAX_BYTES = 24 * 1024 * 1024
+ROTATION_CACHE_PREWARM_TILT = 30
+
+TEXT_CACHE_MAX_ENTRIES = 256
+TEXT_CACHE_MAX_LAYOUTS = 64
+
+QUALITY_GOVERNOR_ENABLED = True
+QUALITY_WINDOW_FRAMES = 90
+QUALITY_SLOW_FRAME_PERCENTILE = 0.9
+QUALITY_DOWNGRADE_MS = 1000.0 / FPS * 0.95
+QUALITY_UPGRADE_MS = 1000.0 / FPS * 0.6
+QUALITY_DOWNGRADE_COOLDOWN_MS = 2000
+QUALITY_UPGRADE_COOLDOWN_MS = 8000
+QUALITY_TIERS = [
+    {"name": "high", "snow": 1.0, "lava": 1.0, "smoke": 1.0, "meteors": 1.0, "fog_layers": 1.0, "rope_glow": True},
+    {"name": "medium", "snow": 0.6, "lava": 0.6, "smoke": 0.6, "meteors": 0.6, "fog_layers": 1.0, "rope_glow": True},
+    {"name": "low", "snow": 0.35, "lava": 0.35, "smoke": 0.35, "meteors": 0.3, "fog_layers": 0.5, "rope_glow": False},
+    {"name": "minimal", "snow": 0.15, "lava": 0.15, "smoke": 0.15, "meteors": 0.0, "fog_layers": 0.0, "rope_glow": False},
+]
+
 
 WIND_GUST_INTERVAL_MIN = 7000
 WIND_GUST_INTERVAL_MAX = 12000
@@ -168,11 +227,15 @@ PROCEDURAL_FOG_LAYERS_CONFIG = [
     }
 ]
 ENABLE_FOG_EFFECT = True
+PROCEDURAL_FOG_SEED = 1337
+FOG_CACHE_ENABLED = True
+FOG_CACHE_DIR_NAME = "fog_cache"
 
 
 LEVEL2_TERRAIN_COLOR_OVERRIDE = (25, 30, 55)
 LEVEL2_TERRAIN_GRADIENT_LIGHT_BLUE = (65, 85, 135)
 LEVEL2_TERRAIN_GRADIENT_STRIPS = 10
+L2_TERRAIN_STRIP_Y_MARGIN = 128
 LEVEL2_TERRAIN_HIGHLIGHT_COLOR = (45, 50, 75)
 
 LEVEL2_CEILING_LIGHT_SPACING = 50
@@ -205,6 +268,8 @@ L2_ROPE_LIGHT_SWAY_AMPLITUDE_X = 3.0
 L2_ROPE_LIGHT_SWAY_SPEED_HZ = 0.3
 L2_ROPE_LIGHT_SWAY_PHASE_OFFSET_MAX_RAD = math.pi * 2
 L2_ROPE_LIGHT_HANGING_LINE_COLOR = (70, 70, 80, 120)
+L2_ROPE_LIGHT_BRIGHTNESS_LEVELS = 16
+L2_ROPE_LIGHT_GLOW_LEVELS = 8
 
 
 L2_PARTICLE_LIGHT_PULSE_SPEED_HZ = 0.6
@@ -225,6 +290,7 @@ L2_HANGING_LIGHT_Y_OFFSET_FROM_CEILING = -1
 L2_MAX_HANGING_LIGHTS_ON_SCREEN = 10
 L2_HANGING_LIGHT_MAX_SWING_ANGLE = 15.0
 L2_HANGING_LIGHT_SWING_FREQUENCY = 1.5
+L2_HANGING_LIGHT_SWING_ANGLE_STEP = 0.5
 
 
 L2_BLACK_PLATFORM_THICKNESS = 70
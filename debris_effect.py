@@ -2,27 +2,69 @@
 import pygame
 import random
 import math
+import numpy as np
+from particles import ParticleEmitter
+import pool
 
+DEBRIS_SHAPES = ('polygon_sharp', 'triangle_ice_sharp', 'rect_chunky', 'spark_line', 'circle', 'circle_soft')
+DEBRIS_SHAPE_INDEX = {shape: i for i, shape in enumerate(DEBRIS_SHAPES)}
+DEBRIS_EXTRA_FIELDS = ('shape', 'rotation', 'angular_velocity', 'alpha_cap', 'shape_slot')
+DEBRIS_POLYGON_SHAPES = (DEBRIS_SHAPE_INDEX['polygon_sharp'], DEBRIS_SHAPE_INDEX['triangle_ice_sharp'],
+                         DEBRIS_SHAPE_INDEX['rect_chunky'])
+DEBRIS_MAX_VERTICES = 6
 
-class DebrisEffect(pygame.sprite.Sprite):
+
+def _shape_vertices(shape_idx, sizes, n):
+    sizes = np.broadcast_to(np.asarray(sizes, dtype=np.float32), (n,)).astype(np.int32).astype(np.float32)
+    vertices = np.zeros((n, DEBRIS_MAX_VERTICES, 2), dtype=np.float32)
+    counts = np.zeros(n, dtype=np.int32)
+    if shape_idx == DEBRIS_SHAPE_INDEX['polygon_sharp']:
+        counts[:] = np.random.randint(4, 7, n)
+        i = np.arange(DEBRIS_MAX_VERTICES)
+        angle = (2 * math.pi / counts[:, None]) * i + np.random.uniform(-0.2, 0.2, (n, DEBRIS_MAX_VERTICES))
+        r_scale = np.where(i % 2 == 0, np.random.uniform(0.4, 1.0, (n, DEBRIS_MAX_VERTICES)),
+                           np.random.uniform(0.7, 1.3, (n, DEBRIS_MAX_VERTICES)))
+        vertices[:, :, 0] = sizes[:, None] * np.cos(angle) * r_scale
+        vertices[:, :, 1] = sizes[:, None] * np.sin(angle) * r_scale
+    elif shape_idx == DEBRIS_SHAPE_INDEX['triangle_ice_sharp']:
+        counts[:] = 3
+        half_s = sizes * np.random.uniform(0.8, 1.2, n)
+        half_h = half_s * np.random.uniform(1.2, 2.0, n) / 2.0
+        half_w = half_s * np.random.uniform(0.2, 0.6, n) / 2.0
+        vertices[:, 0, 1] = -half_h
+        vertices[:, 1, 0], vertices[:, 1, 1] = -half_w, half_h
+        vertices[:, 2, 0], vertices[:, 2, 1] = half_w, half_h
+    elif shape_idx == DEBRIS_SHAPE_INDEX['rect_chunky']:
+        counts[:] = 4
+        half_w = sizes * np.random.uniform(0.6, 1.5, n) / 2
+        half_h = sizes * np.random.uniform(0.6, 1.5, n) / 2
+        vertices[:, :4, 0] = np.stack([-half_w, half_w, half_w, -half_w], axis=1)
+        vertices[:, :4, 1] = np.stack([-half_h, -half_h, half_h, half_h], axis=1)
+    return vertices, counts
+
+
+class DebrisEffect(pool.PooledSprite, pygame.sprite.Sprite):
     def __init__(self, center_x, center_y, material_type, intensity=1.0):
         super().__init__()
+        self.particles = None
+        self.image = pygame.Surface((1, 1), pygame.SRCALPHA)
+        self.rect = self.image.get_rect()
+        self.reset(center_x, center_y, material_type, intensity)
+
+    def reset(self, center_x, center_y, material_type, intensity=1.0):
         self.center_x_world = float(center_x)
         self.center_y_world = float(center_y)
         self.material_type = material_type
         self.intensity = intensity
-
-        self.particles = []
         self._generate_particles()
-
-        self.image = pygame.Surface((1, 1), pygame.SRCALPHA)
-        self.rect = self.image.get_rect(center=(int(center_x), int(center_y)))
+        self.rect.center = (int(center_x), int(center_y))
         self.time_since_creation = 0
 
     def _generate_particles(self):
         num_particles = 0
         
         particle_properties_template = {}
+        extra_batches = []
 
         if self.material_type == "mirror":
             num_particles = int(random.randint(12, 20) * self.intensity)
@@ -44,30 +86,32 @@ class DebrisEffect(pygame.sprite.Sprite):
                 'gravity': 0.25,
                 'shape': 'rect_chunky'
             }
-            for _ in range(random.randint(5, 10)):
-                angle = random.uniform(0, 2 * math.pi)
-                speed = random.uniform(5.0, 8.5) * self.intensity
-                self.particles.append(
-                    {'x': self.center_x_world, 'y': self.center_y_world, 'vx': math.cos(angle) * speed,
-                     'vy': math.sin(angle) * speed, 'size': random.randint(1, 4),
-                     'color': random.choice([(255, 180, 50), (255, 220, 100)]), 'alpha': 255.0, 'max_alpha': 255.0,
-                     'life': random.uniform(0.2, 0.45), 'max_life': random.uniform(0.2, 0.45), 'gravity': 0.15,
-                     'shape': 'spark_line'})
+            n = random.randint(5, 10)
+            angle = np.random.uniform(0, 2 * math.pi, n)
+            speed = np.random.uniform(5.0, 8.5, n) * self.intensity
+            spark_colors = np.array([(255, 180, 50), (255, 220, 100)], dtype=np.float32)[np.random.randint(0, 2, n)]
+            extra_batches.append(dict(
+                n=n, x=self.center_x_world, y=self.center_y_world, vx=np.cos(angle) * speed,
+                vy=np.sin(angle) * speed, size=np.random.randint(1, 5, n),
+                r=spark_colors[:, 0], g=spark_colors[:, 1], b=spark_colors[:, 2], alpha_cap=255.0,
+                alpha=255.0, life=np.random.uniform(0.2, 0.45, n), max_life=np.random.uniform(0.2, 0.45, n),
+                gravity=0.15, shape=DEBRIS_SHAPE_INDEX['spark_line']))
         elif self.material_type == "ice":
             num_particles = int(random.randint(40, 70) * self.intensity)
             particle_properties_template = {
                 'color_list': [(200, 220, 255), (220, 235, 255, 230), (190, 210, 245, 210), (230, 240, 255, 190)],
                 'size_range': (4, 12), 'speed_range': (3.5, 8.0), 'life_range': (0.6, 1.5), 'gravity': 0.18,
                 'shape': 'triangle_ice_sharp'}
-            for _ in range(int(25 * self.intensity)):
-                angle = random.uniform(0, 2 * math.pi)
-                speed = random.uniform(1.5, 3.5) * self.intensity
-                life_mist = random.uniform(0.4, 0.7)
-                self.particles.append(
-                    {'x': self.center_x_world, 'y': self.center_y_world, 'vx': math.cos(angle) * speed,
-                     'vy': math.sin(angle) * speed - random.uniform(0.8, 2.0), 'size': random.randint(1, 4),
-                     'color': (230, 240, 255), 'alpha': random.uniform(120, 200), 'max_alpha': random.uniform(120, 200),
-                     'life': life_mist, 'max_life': life_mist, 'gravity': 0.04, 'shape': 'circle'})
+            n = int(25 * self.intensity)
+            angle = np.random.uniform(0, 2 * math.pi, n)
+            speed = np.random.uniform(1.5, 3.5, n) * self.intensity
+            life_mist = np.random.uniform(0.4, 0.7, n)
+            extra_batches.append(dict(
+                n=n, x=self.center_x_world, y=self.center_y_world, vx=np.cos(angle) * speed,
+                vy=np.sin(angle) * speed - np.random.uniform(0.8, 2.0, n), size=np.random.randint(1, 5, n),
+                r=230.0, g=240.0, b=255.0, alpha_cap=255.0,
+                alpha=np.random.uniform(120, 200, n), start_alpha=np.random.uniform(120, 200, n),
+                life=life_mist, max_life=life_mist, gravity=0.04, shape=DEBRIS_SHAPE_INDEX['circle']))
         elif self.material_type == "rock":
             num_particles = int(random.randint(10, 18) * self.intensity)
             particle_properties_template = {'color_list': [(100, 90, 80), (120, 110, 100), (80, 70, 60)],
@@ -97,133 +141,120 @@ class DebrisEffect(pygame.sprite.Sprite):
             }
         
 
-        for _ in range(num_particles):
-            angle = random.uniform(0, 2 * math.pi)
-            initial_vy_offset = 0
-            speed_base = particle_properties_template.get('speed_range', (1.0, 3.0))
-            speed = random.uniform(speed_base[0], speed_base[1]) * self.intensity
-            if self.material_type == "snow_puff":
-                initial_vy_offset = -random.uniform(0.5, 2.0) * self.intensity
-            elif self.material_type == "ice":
-                initial_vy_offset = -random.uniform(0, speed * 0.4)
-            elif self.material_type == "bug_flesh":
-                initial_vy_offset = -random.uniform(0.3, 2.0) * self.intensity
+        n = num_particles
+        angle = np.random.uniform(0, 2 * math.pi, n)
+        speed_base = particle_properties_template.get('speed_range', (1.0, 3.0))
+        speed = np.random.uniform(speed_base[0], speed_base[1], n) * self.intensity
+        if self.material_type == "snow_puff":
+            initial_vy_offset = -np.random.uniform(0.5, 2.0, n) * self.intensity
+        elif self.material_type == "ice":
+            initial_vy_offset = -np.random.uniform(0, 1, n) * speed * 0.4
+        elif self.material_type == "bug_flesh":
+            initial_vy_offset = -np.random.uniform(0.3, 2.0, n) * self.intensity
+        else:
+            initial_vy_offset = 0.0
 
+        life_base = particle_properties_template.get('life_range', (0.5, 1.0))
+        life = np.random.uniform(life_base[0], life_base[1], n)
+        size_base = particle_properties_template.get('size_range', (2, 5))
+        spread = self.intensity * 5 if self.material_type == "snow_puff" else self.intensity * 2
+        color_list = particle_properties_template.get('color_list', [(200, 200, 200)])
+        color_table = np.array([(c[0], c[1], c[2], c[3] if len(c) == 4 else 255) for c in color_list], dtype=np.float32)
+        colors = color_table[np.random.randint(0, len(color_list), n)]
 
-            life_base = particle_properties_template.get('life_range', (0.5, 1.0))
-            life = random.uniform(life_base[0], life_base[1])
-            size_base = particle_properties_template.get('size_range', (2, 5))
-            size_val = random.randint(size_base[0], size_base[1])
-            start_alpha = 255.0
+        batches = [dict(
+            n=n,
+            x=self.center_x_world + np.random.uniform(-spread, spread, n),
+            y=self.center_y_world + np.random.uniform(-spread, spread, n),
+            vx=np.cos(angle) * speed, vy=np.sin(angle) * speed + initial_vy_offset,
+            size=np.random.randint(size_base[0], size_base[1] + 1, n),
+            r=colors[:, 0], g=colors[:, 1], b=colors[:, 2], alpha_cap=colors[:, 3],
+            alpha=255.0, life=life, max_life=life,
+            gravity=particle_properties_template.get('gravity', 0.1),
+            shape=DEBRIS_SHAPE_INDEX[particle_properties_template.get('shape', 'rect_chunky')],
+            rotation=np.random.uniform(0, 360, n), angular_velocity=np.random.uniform(-300, 300, n))]
+        batches = extra_batches + batches
 
-            self.particles.append({
-                'x': self.center_x_world + random.uniform(-self.intensity * 5,
-                                                          self.intensity * 5) if self.material_type == "snow_puff" else self.center_x_world + random.uniform(
-                    -self.intensity * 2, self.intensity * 2),
-                'y': self.center_y_world + random.uniform(-self.intensity * 5,
-                                                          self.intensity * 5) if self.material_type == "snow_puff" else self.center_y_world + random.uniform(
-                    -self.intensity * 2, self.intensity * 2),
-                'vx': math.cos(angle) * speed, 'vy': math.sin(angle) * speed + initial_vy_offset,
-                'size': size_val,
-                'color': random.choice(particle_properties_template.get('color_list', [(200, 200, 200)])),
-                'alpha': start_alpha, 'max_alpha': start_alpha,
-                'life': life, 'max_life': life,
-                'gravity': particle_properties_template.get('gravity', 0.1),
-                'shape': particle_properties_template.get('shape', 'rect_chunky'),
-                'rotation': random.uniform(0, 360), 'angular_velocity': random.uniform(-300, 300)
-            })
+        capacity = max(1, sum(batch['n'] for batch in batches))
+        if self.particles is None or self.particles.capacity < capacity:
+            self.particles = ParticleEmitter(capacity, extra_fields=DEBRIS_EXTRA_FIELDS)
+            self.shape_vertices = np.zeros((capacity, DEBRIS_MAX_VERTICES, 2), dtype=np.float32)
+            self.shape_vertex_counts = np.zeros(capacity, dtype=np.int32)
+        else:
+            self.particles.clear()
+        for batch in batches:
+            n = batch.pop('n')
+            slot = len(self.particles)
+            if n > 0 and batch['shape'] in DEBRIS_POLYGON_SHAPES:
+                vertices, counts = _shape_vertices(batch['shape'], batch['size'], n)
+                self.shape_vertices[slot:slot + n] = vertices
+                self.shape_vertex_counts[slot:slot + n] = counts
+            else:
+                self.shape_vertex_counts[slot:slot + n] = 0
+            self.particles.spawn(n, shape_slot=np.arange(slot, slot + n), **batch)
 
     def update(self, time_delta_seconds, world_scroll_dx):
         self.center_x_world -= world_scroll_dx
         self.time_since_creation += time_delta_seconds
-        active_particles = []
-        for p in self.particles:
-            p['vx'] *= (1 - 0.2 * time_delta_seconds)
-            p['vy'] *= (1 - 0.1 * time_delta_seconds)
-            p['x'] += p['vx']
-            p['y'] += p['vy']
-            p['vy'] += p['gravity'] * (60 * time_delta_seconds)
-            p['x'] -= world_scroll_dx
-            p['life'] -= time_delta_seconds
-
-            if p['max_life'] > 0 and p['life'] > 0:
-                life_ratio = p['life'] / p['max_life']
-                p['alpha'] = p['max_alpha'] * (life_ratio ** 0.5)
-            elif p['life'] <= 0:
-                p['alpha'] -= 400 * time_delta_seconds
+        particles = self.particles
+        if particles:
+            particles.integrate(1.0, scroll_dx=world_scroll_dx, gravity_step=60 * time_delta_seconds,
+                                drag_x=1 - 0.2 * time_delta_seconds, drag_y=1 - 0.1 * time_delta_seconds)
+            particles.age(time_delta_seconds)
+            life = particles['life']
+            alpha = particles['alpha']
+            life_ratio = particles.life_ratio()
+            alive = (particles['max_life'] > 0) & (life > 0)
+            alpha[alive] = (particles['start_alpha'] * np.sqrt(life_ratio))[alive]
+            expired = life <= 0
+            alpha[expired] -= 400 * time_delta_seconds
+            np.maximum(alpha, 0, out=alpha)
+            rotation = particles['rotation']
+            rotation += particles['angular_velocity'] * time_delta_seconds
+            np.mod(rotation, 360, out=rotation)
+            particles.cull(min_alpha=5)
 
-            p['alpha'] = max(0, p['alpha'])
-            if 'rotation' in p: p['rotation'] = (p['rotation'] + p['angular_velocity'] * time_delta_seconds) % 360
-            if p['alpha'] > 5: active_particles.append(p)
-
-        self.particles = active_particles
         if not self.particles and self.time_since_creation > 0.2:
             self.kill()
         elif self.time_since_creation > 7.0:
             self.kill()
         self.rect.center = (int(self.center_x_world), int(self.center_y_world))
 
-    def _rotate_points(self, points, angle_degrees, center_x, center_y):
-        angle_rad = math.radians(angle_degrees)
-        s, c = math.sin(angle_rad), math.cos(angle_rad)
-        rotated_points = []
-        for px, py in points: translated_x, translated_y = px - center_x, py - center_y; new_x = translated_x * c - translated_y * s; new_y = translated_x * s + translated_y * c; rotated_points.append(
-            (new_x + center_x, new_y + center_y))
-        return rotated_points
-
     def draw(self, surface, camera_y_offset):
-        for p in self.particles:
-            if p['alpha'] <= 5: continue
-            draw_x_center = p['x']
-            draw_y_center = p['y'] - camera_y_offset
-            base_color = p['color']
-            current_alpha = int(p['alpha'])
-            if len(base_color) == 4:
-                final_color = (base_color[0], base_color[1], base_color[2], int(min(current_alpha, base_color[3])))
-            else:
-                final_color = (*base_color, current_alpha)
-            size = int(p['size'])
+        particles = self.particles
+        if not particles: return
+        slots = particles['shape_slot'].astype(np.int32)
+        vertices = self.shape_vertices[slots]
+        angle = np.radians(particles['rotation'])[:, None]
+        c, s = np.cos(angle), np.sin(angle)
+        screen_x = vertices[:, :, 0] * c - vertices[:, :, 1] * s + particles['x'][:, None]
+        screen_y = vertices[:, :, 0] * s + vertices[:, :, 1] * c + (particles['y'] - camera_y_offset)[:, None]
+        polygons = np.stack([screen_x, screen_y], axis=2).astype(np.int32).tolist()
+        columns = zip(particles['x'].tolist(), particles['y'].tolist(), particles['vx'].tolist(),
+                      particles['vy'].tolist(), particles['alpha'].tolist(), particles['alpha_cap'].tolist(),
+                      particles['size'].tolist(), particles['shape'].tolist(), particles.colors().tolist(),
+                      polygons, self.shape_vertex_counts[slots].tolist())
+        for px, py, pvx, pvy, alpha, alpha_cap, psize, shape_idx, base_color, polygon, vertex_count in columns:
+            if alpha <= 5: continue
+            draw_x_center = px
+            draw_y_center = py - camera_y_offset
+            current_alpha = int(alpha)
+            final_color = (base_color[0], base_color[1], base_color[2], int(min(current_alpha, alpha_cap)))
+            size = int(psize)
             if size <= 0: continue
+            shape = DEBRIS_SHAPES[int(shape_idx)]
             try:
-                if p['shape'] == 'polygon_sharp':
-                    num_points = random.randint(4, 6); 
-                    points_orig = []
-                    for i in range(num_points):
-                        angle_rad = (2 * math.pi / num_points) * i + random.uniform(-0.2, 0.2) 
-                        
-                        r_scale = random.uniform(0.4, 1.0) if i % 2 == 0 else random.uniform(0.7, 1.3)
-                        px_rel = size * math.cos(angle_rad) * r_scale
-                        py_rel = size * math.sin(angle_rad) * r_scale
-                        points_orig.append((px_rel, py_rel))
-                    rotated_points = self._rotate_points(points_orig, p.get('rotation', 0), 0, 0)
-                    screen_points = [(int(draw_x_center + rp[0]), int(draw_y_center + rp[1])) for rp in rotated_points]
-                    if len(screen_points) >= 3: pygame.draw.polygon(surface, final_color, screen_points)
-                elif p['shape'] == 'triangle_ice_sharp':
-                    half_s = size * random.uniform(0.8, 1.2)
-                    height_factor = random.uniform(1.2, 2.0)
-                    base_width_factor = random.uniform(0.2, 0.6)
-                    points_orig = [(0, -half_s * height_factor / 2.0),
-                                   (-half_s * base_width_factor / 2.0, half_s * height_factor / 2.0),
-                                   (half_s * base_width_factor / 2.0, half_s * height_factor / 2.0)]
-                    rotated_points = self._rotate_points(points_orig, p.get('rotation', random.uniform(0, 360)), 0, 0)
-                    screen_points = [(int(draw_x_center + rp[0]), int(draw_y_center + rp[1])) for rp in rotated_points]
-                    if len(screen_points) >= 3: pygame.draw.polygon(surface, final_color, screen_points)
-                elif p['shape'] == 'rect_chunky' or p['shape'] == 'rect_varied_rock':
-                    w = size * random.uniform(0.6, 1.5)
-                    h = size * random.uniform(0.6, 1.5)
-                    points_orig = [(-w / 2, -h / 2), (w / 2, -h / 2), (w / 2, h / 2), (-w / 2, h / 2)]
-                    rotated_points = self._rotate_points(points_orig, p.get('rotation', random.uniform(0, 90)), 0, 0)
-                    screen_points = [(int(draw_x_center + rp[0]), int(draw_y_center + rp[1])) for rp in rotated_points]
-                    if len(screen_points) >= 3: pygame.draw.polygon(surface, final_color, screen_points)
-                elif p['shape'] == 'spark_line':
-                    angle_rad = math.atan2(p['vy'], p['vx'])
+                if vertex_count >= 3:
+                    pygame.draw.polygon(surface, final_color, polygon[:vertex_count])
+                elif shape == 'spark_line':
+                    angle_rad = math.atan2(pvy, pvx)
                     length = max(3, size * 2.0)
                     end_x = draw_x_center + length * math.cos(angle_rad)
                     end_y = draw_y_center + length * math.sin(angle_rad)
                     pygame.draw.line(surface, final_color, (int(draw_x_center), int(draw_y_center)),
                                      (int(end_x), int(end_y)), max(1, size // 2 + 1))
-                elif p['shape'] == 'circle_soft' or p['shape'] == 'circle':
-                    if p['shape'] == 'circle_soft':
+                elif shape == 'circle_soft' or shape == 'circle':
+                    if shape == 'circle_soft':
                         for i_soft in range(2, 0, -1):
                             s_alpha = current_alpha // (2 - i_soft + 1)
                             s_size = size * (i_soft / 2.0)
@@ -2,26 +2,23 @@
 import pygame
 import random
 import math
+import threading
+import config
+import asset_registry
+import pool
 
 
-class Explosion(pygame.sprite.Sprite):
-    def __init__(self, center_x_world, center_y_world):
-        super().__init__()
-        self.center_x_world_initial = float(center_x_world)
-        self.center_y_world_initial = float(center_y_world)
-
-        self.current_center_x_world = self.center_x_world_initial
-        self.current_center_y_world = self.center_y_world_initial
-
+class ExplosionBaker:
+    def __init__(self, rng=random):
+        self.rng = rng
         self.animation_speed_multiplier = 1.0
         self.frame_index = 0
-        self.last_update_time = pygame.time.get_ticks()
 
        
         self.frames_definition = [
        
             ('shards', 60 * self.animation_speed_multiplier, {
-                'num_shards': random.randint(5, 8),
+                'num_shards': self.rng.randint(5, 8),
                 'max_radius': 35,  
                 'min_shard_verts': 4, 'max_shard_verts': 6,
                 'colors': [(255, 100, 0), (255, 150, 50), (255, 80, 0), (255, 50, 0)],  
@@ -29,7 +26,7 @@ class Explosion(pygame.sprite.Sprite):
                 'expand_rate': 1.6 
             }),
             ('shards', 75 * self.animation_speed_multiplier, {
-                'num_shards': random.randint(7, 11),
+                'num_shards': self.rng.randint(7, 11),
                 'max_radius': 65, 
                 'min_shard_verts': 4, 'max_shard_verts': 7,
                 'colors': [(255, 180, 50), (255, 200, 100), (255, 160, 30), (255, 150, 0)],
@@ -37,7 +34,7 @@ class Explosion(pygame.sprite.Sprite):
                 'expand_rate': 1.8 
             }),
             ('shards', 85 * self.animation_speed_multiplier, {
-                'num_shards': random.randint(6, 9),
+                'num_shards': self.rng.randint(6, 9),
                 'max_radius': 105,  
                 'min_shard_verts': 3, 'max_shard_verts': 6,
                 'colors': [(255, 220, 100), (255, 230, 150), (240, 180, 90), (200, 100, 50)],
@@ -47,31 +44,31 @@ class Explosion(pygame.sprite.Sprite):
             
             ('smoke', 130 * self.animation_speed_multiplier, [  
                 {'radius': 60, 'color': (150, 150, 150), 'alpha': 130, 'rise': -0.18,
-                 'drift_x': random.uniform(-0.12, 0.12), 'offset_x': random.uniform(-12, 12),
-                 'offset_y': random.uniform(-12, 12), 'expand_rate': 0.3, 'aspect_ratio_range': (0.7, 1.3)},
+                 'drift_x': self.rng.uniform(-0.12, 0.12), 'offset_x': self.rng.uniform(-12, 12),
+                 'offset_y': self.rng.uniform(-12, 12), 'expand_rate': 0.3, 'aspect_ratio_range': (0.7, 1.3)},
                 {'radius': 50, 'color': (140, 140, 140), 'alpha': 120, 'rise': -0.22,
-                 'drift_x': random.uniform(-0.18, 0.18), 'offset_x': random.uniform(-18, 18),
-                 'offset_y': random.uniform(-18, 18), 'expand_rate': 0.38, 'aspect_ratio_range': (0.6, 1.4)},
+                 'drift_x': self.rng.uniform(-0.18, 0.18), 'offset_x': self.rng.uniform(-18, 18),
+                 'offset_y': self.rng.uniform(-18, 18), 'expand_rate': 0.38, 'aspect_ratio_range': (0.6, 1.4)},
                 
             ]),
             ('smoke', 160 * self.animation_speed_multiplier, [ 
                 {'radius': 85, 'color': (130, 130, 130), 'alpha': 120, 'rise': -0.28,
-                 'drift_x': random.uniform(-0.18, 0.18), 'offset_x': random.uniform(-18, 18),
-                 'offset_y': random.uniform(-18, 18), 'expand_rate': 0.5, 'aspect_ratio_range': (0.7, 1.3)},
+                 'drift_x': self.rng.uniform(-0.18, 0.18), 'offset_x': self.rng.uniform(-18, 18),
+                 'offset_y': self.rng.uniform(-18, 18), 'expand_rate': 0.5, 'aspect_ratio_range': (0.7, 1.3)},
                 {'radius': 75, 'color': (120, 120, 120), 'alpha': 80, 'rise': -0.32,
-                 'drift_x': random.uniform(-0.22, 0.22), 'offset_x': random.uniform(-22, 22),
-                 'offset_y': random.uniform(-22, 22), 'expand_rate': 0.45, 'aspect_ratio_range': (0.6, 1.4)},
+                 'drift_x': self.rng.uniform(-0.22, 0.22), 'offset_x': self.rng.uniform(-22, 22),
+                 'offset_y': self.rng.uniform(-22, 22), 'expand_rate': 0.45, 'aspect_ratio_range': (0.6, 1.4)},
             ]),
             ('smoke', 200 * self.animation_speed_multiplier, [ 
                 {'radius': 100, 'color': (100, 100, 100), 'alpha': 70, 'rise': -0.35,
-                 'drift_x': random.uniform(-0.20, 0.20), 'offset_x': random.uniform(-20, 20),
-                 'offset_y': random.uniform(-20, 20), 'expand_rate': 0.55, 'aspect_ratio_range': (0.7, 1.3)},
+                 'drift_x': self.rng.uniform(-0.20, 0.20), 'offset_x': self.rng.uniform(-20, 20),
+                 'offset_y': self.rng.uniform(-20, 20), 'expand_rate': 0.55, 'aspect_ratio_range': (0.7, 1.3)},
                 
             ]),
             ('smoke', 220 * self.animation_speed_multiplier, [ 
                 {'radius': 110, 'color': (80, 80, 80), 'alpha': 35, 'rise': -0.38,
-                 'drift_x': random.uniform(-0.25, 0.25), 'offset_x': random.uniform(-25, 25),
-                 'offset_y': random.uniform(-25, 25), 'expand_rate': 0.7, 'aspect_ratio_range': (0.7, 1.3)},
+                 'drift_x': self.rng.uniform(-0.25, 0.25), 'offset_x': self.rng.uniform(-25, 25),
+                 'offset_y': self.rng.uniform(-25, 25), 'expand_rate': 0.7, 'aspect_ratio_range': (0.7, 1.3)},
             ]),
         ]
         self.num_frames_defined = len(self.frames_definition)
@@ -93,7 +90,6 @@ class Explosion(pygame.sprite.Sprite):
         self.max_dimension += 70 
 
         self.image = pygame.Surface((self.max_dimension, self.max_dimension), pygame.SRCALPHA)
-        self.rect = self.image.get_rect(center=(int(self.current_center_x_world), int(self.current_center_y_world)))
 
         self.frame_elements = []
         self.time_in_current_frame_def = 0
@@ -103,13 +99,13 @@ class Explosion(pygame.sprite.Sprite):
 
     def generate_random_convex_polygon(self, center_x, center_y, max_r_base, min_verts, max_verts):
         points = []
-        num_vertices = random.randint(min_verts, max_verts)
+        num_vertices = self.rng.randint(min_verts, max_verts)
         angle_step = 360 / num_vertices
         generation_radius_scale = 0.65  
 
         for i in range(num_vertices):
-            angle_rad = math.radians(i * angle_step + random.uniform(-angle_step * 0.45, angle_step * 0.45))
-            radius = random.uniform(max_r_base * 0.3,
+            angle_rad = math.radians(i * angle_step + self.rng.uniform(-angle_step * 0.45, angle_step * 0.45))
+            radius = self.rng.uniform(max_r_base * 0.3,
                                     max_r_base * 0.8) * generation_radius_scale  
 
             x = center_x + radius * math.cos(angle_rad)
@@ -131,8 +127,8 @@ class Explosion(pygame.sprite.Sprite):
                     properties['max_radius'],
                     properties['min_shard_verts'], properties['max_shard_verts']
                 )
-                color = random.choice(properties['colors'])
-                rotation_angle = random.uniform(0, 360)
+                color = self.rng.choice(properties['colors'])
+                rotation_angle = self.rng.uniform(0, 360)
                 self.frame_elements.append(
                     {'type': 'polygon', 'points': polygon_points, 'color': color, 'rotation': rotation_angle})
 
@@ -141,22 +137,22 @@ class Explosion(pygame.sprite.Sprite):
                 self.frame_elements.append({
                     'type': 'smoke_puff',
                     'orig_radius': smoke_prop_template['radius'],
-                    'current_radius': smoke_prop_template['radius'] * random.uniform(0.35, 0.65),
+                    'current_radius': smoke_prop_template['radius'] * self.rng.uniform(0.35, 0.65),
                     'color': smoke_prop_template['color'],
                     'orig_alpha': smoke_prop_template['alpha'],
-                    'current_alpha': smoke_prop_template['alpha'] * random.uniform(0.85, 1.05),
-                    'rise_speed': smoke_prop_template['rise'] * random.uniform(0.8, 1.2),
-                    'drift_x_speed': smoke_prop_template['drift_x'] * random.uniform(0.7, 1.3),
-                    'base_offset_x': smoke_prop_template.get('offset_x', 0) + random.uniform(
+                    'current_alpha': smoke_prop_template['alpha'] * self.rng.uniform(0.85, 1.05),
+                    'rise_speed': smoke_prop_template['rise'] * self.rng.uniform(0.8, 1.2),
+                    'drift_x_speed': smoke_prop_template['drift_x'] * self.rng.uniform(0.7, 1.3),
+                    'base_offset_x': smoke_prop_template.get('offset_x', 0) + self.rng.uniform(
                         -smoke_prop_template['radius'] * 0.35, smoke_prop_template['radius'] * 0.35),
-                    'base_offset_y': smoke_prop_template.get('offset_y', 0) + random.uniform(
+                    'base_offset_y': smoke_prop_template.get('offset_y', 0) + self.rng.uniform(
                         -smoke_prop_template['radius'] * 0.35, smoke_prop_template['radius'] * 0.35),
                     'current_offset_y': 0,
                     'current_offset_x': 0,
-                    'expand_rate': smoke_prop_template.get('expand_rate', 0.2) * random.uniform(0.85, 1.15),
-                    'aspect_ratio': random.uniform(smoke_prop_template.get('aspect_ratio_range', (0.7, 1.3))[0],
+                    'expand_rate': smoke_prop_template.get('expand_rate', 0.2) * self.rng.uniform(0.85, 1.15),
+                    'aspect_ratio': self.rng.uniform(smoke_prop_template.get('aspect_ratio_range', (0.7, 1.3))[0],
                                                    smoke_prop_template.get('aspect_ratio_range', (0.7, 1.3))[1]),
-                    'rotation': random.uniform(0, 60) 
+                    'rotation': self.rng.uniform(0, 60) 
                 })
 
     def rotate_point(self, point, angle_degrees, center_x, center_y):
@@ -168,7 +164,7 @@ class Explosion(pygame.sprite.Sprite):
         return new_x + center_x, new_y + center_y
 
     def update_image_content(self):
-        if self.frame_index >= self.num_frames_defined: self.kill(); return
+        if self.frame_index >= self.num_frames_defined: return
         self.image.fill((0, 0, 0, 0))
         frame_type, duration_ms, properties = self.frames_definition[self.frame_index]
         progress = min(1.0, self.time_in_current_frame_def / duration_ms if duration_ms > 0 else 1.0)
@@ -232,30 +228,97 @@ class Explosion(pygame.sprite.Sprite):
                         except (TypeError, ValueError):
                             pass 
 
+    def step(self, delta_ms):
+        if self.frame_index >= self.num_frames_defined: return False
+        self.time_in_current_frame_def += delta_ms
+        _, duration_ms, _ = self.frames_definition[self.frame_index]
+        if self.time_in_current_frame_def >= duration_ms:
+            self.frame_index += 1
+            self.time_in_current_frame_def = 0
+            if self.frame_index >= self.num_frames_defined:
+                return False
+            self.generate_frame_elements()
+        self.update_image_content()
+        return True
+
+    def capture_frame(self):
+        center = self.max_dimension // 2
+        bounds = self.image.get_bounding_rect()
+        if bounds.width > 0 and bounds.height > 0:
+            frame_surf = self.image.subsurface(bounds).copy()
+        else:
+            frame_surf = pygame.Surface((1, 1), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            frame_surf = frame_surf.convert_alpha()
+        return frame_surf, (bounds.x - center, bounds.y - center)
+
+    def bake(self, frame_ms):
+        frames = [self.capture_frame()]
+        while self.step(frame_ms):
+            frames.append(self.capture_frame())
+        return frames
+
+
+def _bake_variant(variant_index):
+    return ExplosionBaker(random.Random(variant_index)).bake(1000.0 / config.EXPLOSION_ATLAS_FPS)
+
+
+_atlas_lock = threading.Lock()
+
+
+def atlas_variant(variant_index):
+    with _atlas_lock:
+        return asset_registry.get_built(("explosion_atlas", variant_index), lambda: _bake_variant(variant_index))
+
+
+def _prebake_atlas():
+    try:
+        for variant_index in range(config.EXPLOSION_ATLAS_VARIANTS):
+            atlas_variant(variant_index)
+    except pygame.error as e:
+        print(f"Explosion atlas: error baking in the background ({e}). Baking on first use instead.")
+
+
+def prebake_atlas():
+    if config.EXPLOSION_ATLAS_IN_BACKGROUND:
+        threading.Thread(target=_prebake_atlas, name="explosion-atlas", daemon=True).start()
+
+
+class Explosion(pool.PooledSprite, pygame.sprite.Sprite):
+    def __init__(self, center_x_world, center_y_world):
+        super().__init__()
+        self.image = None
+        self.rect = None
+        self.reset(center_x_world, center_y_world)
+
+    def reset(self, center_x_world, center_y_world):
+        self.current_center_x_world = float(center_x_world)
+        self.current_center_y_world = float(center_y_world)
+        self.frames = atlas_variant(random.randrange(config.EXPLOSION_ATLAS_VARIANTS))
+        self.elapsed_ms = 0.0
+        self.frame_index = 0
+        self._apply_frame()
+
+    def _apply_frame(self):
+        if self.frame_index >= len(self.frames):
+            self.kill()
+            return
+        self.image, (offset_x, offset_y) = self.frames[self.frame_index]
+        if self.rect is None:
+            self.rect = self.image.get_rect()
+        else:
+            self.rect.size = self.image.get_size()
+        self.rect.topleft = (int(self.current_center_x_world) + offset_x, int(self.current_center_y_world) + offset_y)
+
     def update(self, time_delta_seconds, world_scroll_dx):
         if not self.alive(): return
         self.current_center_x_world -= world_scroll_dx
-        current_time = pygame.time.get_ticks()
-        delta_ms_since_last_major_update = current_time - self.last_update_time
-        self.time_in_current_frame_def += delta_ms_since_last_major_update
-        self.last_update_time = current_time
-        if self.frame_index < self.num_frames_defined:
-            _, duration_ms, _ = self.frames_definition[self.frame_index]
-            if self.time_in_current_frame_def >= duration_ms:
-                self.frame_index += 1
-                self.time_in_current_frame_def = 0
-                if self.frame_index < self.num_frames_defined:
-                    self.generate_frame_elements()
-                else:
-                    self.kill()
-                    return
-            if self.alive(): self.update_image_content()
-        else:
-            self.kill(); return
-        if self.rect: self.rect.center = (int(self.current_center_x_world), int(self.current_center_y_world))
+        self.elapsed_ms += time_delta_seconds * 1000.0
+        self.frame_index = int(self.elapsed_ms * config.EXPLOSION_ATLAS_FPS / 1000.0)
+        self._apply_frame()
 
     def draw(self, surface, camera_y_offset):
         if self.image and self.rect and self.alive():
             draw_rect = self.rect.copy()
             draw_rect.y -= camera_y_offset
-            surface.blit(self.image, draw_rect)
\ No newline at end of file
+            surface.blit(self.image, draw_rect)
@@ -0,0 +1,115 @@
+# fog.py
+import os
+import json
+import hashlib
+import numpy as np
+import pygame
+import config
+
+FOG_CACHE_VERSION = 1
+
+
+def get_fog_cache_path(base_dir, layer_conf, width, seed):
+    key = json.dumps({"version": FOG_CACHE_VERSION, "layer": layer_conf, "width": width, "seed": seed},
+                     sort_keys=True, default=list)
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    file_name = f"fog-{width}x{layer_conf['height_on_screen']}-{digest}.npy"
+    return os.path.join(base_dir, config.FOG_CACHE_DIR_NAME, file_name)
+
+
+def bake_fog_alpha(layer_conf, width, seed):
+    height = layer_conf["height_on_screen"]
+    rng = np.random.default_rng(seed)
+    num_puffs = layer_conf["num_main_puffs"]
+    num_sub = layer_conf["puff_sub_puffs"]
+
+    centers_x = rng.integers(0, width, num_puffs, endpoint=True)
+    centers_y = rng.integers(int(height * 0.2), int(height * 0.8), num_puffs, endpoint=True)
+    base_radii = rng.integers(layer_conf["puff_base_radius_min"], layer_conf["puff_base_radius_max"], num_puffs,
+                              endpoint=True)
+
+    base_radii = np.repeat(base_radii, num_sub)
+    sub_x = np.repeat(centers_x, num_sub) + rng.integers(-(base_radii // 2), base_radii // 2, endpoint=True)
+    sub_y = np.repeat(centers_y, num_sub) + rng.integers(-(base_radii // 3), base_radii // 3, endpoint=True)
+    sub_radii = (base_radii * layer_conf["puff_sub_radius_factor"] * rng.uniform(0.6, 1.4, len(base_radii))).astype(int)
+    sub_alphas = rng.integers(layer_conf["puff_alpha_min"], layer_conf["puff_alpha_max"], len(base_radii),
+                              endpoint=True)
+    ellipse_w = np.maximum(3, (sub_radii * rng.uniform(1.2, 2.8, len(base_radii))).astype(int))
+    ellipse_h = np.maximum(3, (sub_radii * rng.uniform(0.7, 1.7, len(base_radii))).astype(int))
+    keep = sub_radii > 0
+
+    log_transmittance = np.zeros((height, width), dtype=np.float32)
+    for x, y, ew, eh, alpha in zip(sub_x[keep].tolist(), sub_y[keep].tolist(), ellipse_w[keep].tolist(),
+                                   ellipse_h[keep].tolist(), sub_alphas[keep].tolist()):
+        left, top = x - ew // 2, y - eh // 2
+        x0, x1 = max(0, left), min(width, left + ew)
+        y0, y1 = max(0, top), min(height, top + eh)
+        if x0 >= x1 or y0 >= y1:
+            continue
+        dx = (np.arange(x0, x1, dtype=np.float32) + 0.5 - (left + ew / 2.0)) / (ew / 2.0)
+        dy = (np.arange(y0, y1, dtype=np.float32) + 0.5 - (top + eh / 2.0)) / (eh / 2.0)
+        inside = dy[:, None] ** 2 + dx[None, :] ** 2 <= 1.0
+        log_transmittance[y0:y1, x0:x1] += inside * np.float32(np.log1p(-alpha / 255.0))
+
+    coverage = 1.0 - np.exp(log_transmittance)
+
+    rows = np.arange(height, dtype=np.float64)
+    fade_pixels = (height * (1.0 - 0.7)) / 2.0
+    gradient = np.full(height, 255.0)
+    if fade_pixels > 0:
+        gradient = np.where(rows < fade_pixels, np.floor(255 * rows / fade_pixels), gradient)
+        gradient = np.where(rows > height - fade_pixels, np.floor(255 * (height - rows) / fade_pixels), gradient)
+    gradient = np.clip(gradient, 0, 255)
+
+    return np.clip(coverage * gradient[:, None], 0, 255).astype(np.uint8)
+
+
+def load_fog_alpha(base_dir, layer_conf, width, seed):
+    cache_path = get_fog_cache_path(base_dir, layer_conf, width, seed) if config.FOG_CACHE_ENABLED else None
+    if cache_path and os.path.exists(cache_path):
+        try:
+            alpha = np.load(cache_path)
+            if alpha.shape == (layer_conf["height_on_screen"], width) and alpha.dtype == np.uint8:
+                return alpha
+            print(f"Fog cache: ignoring invalid cache file {cache_path}")
+        except (OSError, ValueError) as e:
+            print(f"Fog cache: error reading {cache_path}: {e}")
+
+    alpha = bake_fog_alpha(layer_conf, width, seed)
+    if cache_path:
+        temp_path = cache_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(temp_path, "wb") as cache_file:
+                np.save(cache_file, alpha)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            print(f"Fog cache: error writing {cache_path}: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    return alpha
+
+
+def build_fog_layers(base_dir):
+    fog_layers = []
+    width = int(config.WIDTH * 1.5)
+    for layer_index, layer_conf in enumerate(config.PROCEDURAL_FOG_LAYERS_CONFIG):
+        try:
+            height = layer_conf["height_on_screen"]
+            if width <= 0 or height <= 0: continue
+            alpha = load_fog_alpha(base_dir, layer_conf, width, config.PROCEDURAL_FOG_SEED + layer_index)
+            layer_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            layer_surface.fill((*layer_conf["color"], 0))
+            surface_alpha = pygame.surfarray.pixels_alpha(layer_surface)
+            surface_alpha[:, :] = alpha.T
+            del surface_alpha
+
+            fog_layers.append({
+                "surface": layer_surface,
+                "y_offset_from_bottom": layer_conf["y_offset_from_bottom"],
+                "scroll_factor": layer_conf["scroll_factor"],
+                "x_pos": 0.0
+            })
+        except Exception as e:
+            print(f"Error creating procedural organic fog layer: {e}")
+    return fog_layers
@@ -14,6 +14,7 @@ CREDITS = 'credits'
 
 
 current_state = MENU
+sim_time_ms = 0.0
 
 
 menu_options = ['Start Level 1', 'Start Level 2', 'Controls', 'Settings', 'Quit']
@@ -2,7 +2,32 @@
 import pygame
 import math
 import random 
+import numpy as np
 import config 
+import asset_registry
+
+GLOW_EDGE_COLOR = (50, 50, 10)
+GLOW_GRADIENT_WIDTH = 256
+
+
+def _build_glow_gradient(color_edge, color_mid, glow_alpha):
+    t = np.linspace(0.0, 1.0, GLOW_GRADIENT_WIDTH)
+    edge = np.array(color_edge, dtype=np.float64)
+    mid = np.array(color_mid, dtype=np.float64)
+    rising = edge + (mid - edge) * (t * 2.0)[:, None]
+    falling = mid + (edge - mid) * ((t - 0.5) * 2.0)[:, None]
+    colors = np.where((t <= 0.5)[:, None], rising, falling).astype(np.uint8)
+    gradient = pygame.Surface((GLOW_GRADIENT_WIDTH, 1), pygame.SRCALPHA)
+    gradient.fill((0, 0, 0, glow_alpha))
+    pixels = pygame.surfarray.pixels3d(gradient)
+    pixels[:, 0, :] = colors
+    del pixels
+    return gradient
+
+
+def _build_swing_frames(image_surface, max_angle, angle_step):
+    count = int(round(2 * max_angle / angle_step)) + 1
+    return [pygame.transform.rotate(image_surface, -max_angle + i * angle_step) for i in range(count)]
 
 
 class HangingLight(pygame.sprite.Sprite):
@@ -35,24 +60,21 @@ class HangingLight(pygame.sprite.Sprite):
 
         self.glow_top_width_factor = 0.7
         self.glow_bottom_width_factor = 3.5
-        
+        self.glow_gradient = asset_registry.get_built(
+            ("hanging_light_glow", GLOW_EDGE_COLOR, self.glow_color),
+            lambda: _build_glow_gradient(GLOW_EDGE_COLOR, self.glow_color[:3], self.glow_color[3]))
 
-    def _lerp_component(self, c1_comp, c2_comp, t):
-        """Linearly interpolates a single color component."""
-        return int(c1_comp * (1.0 - t) + c2_comp * t)
+        self.swing_angle_step = config.L2_HANGING_LIGHT_SWING_ANGLE_STEP
+        self.swing_frames = asset_registry.get_built(
+            ("hanging_light_swing", self.original_image, self.max_angle, self.swing_angle_step),
+            lambda: _build_swing_frames(self.original_image, self.max_angle, self.swing_angle_step))
 
-    def _lerp_rgb_color(self, color1_rgb, color2_rgb, t):
-        """Linearly interpolates between two RGB colors."""
-        r = self._lerp_component(color1_rgb[0], color2_rgb[0], t)
-        g = self._lerp_component(color1_rgb[1], color2_rgb[1], t)
-        b = self._lerp_component(color1_rgb[2], color2_rgb[2], t)
-        return (r, g, b)
-
-    def update(self, dx_world_scroll):
+    def update(self, dx_world_scroll, time_delta_seconds=1.0 / config.FPS):
         self.world_x_anchor -= dx_world_scroll
-        self.swing_timer += 0.05
+        self.swing_timer += 0.05 * time_delta_seconds * config.FPS
         self.swing_angle = math.sin(self.swing_timer * self.swing_frequency) * self.max_angle
-        self.image = pygame.transform.rotate(self.original_image, self.swing_angle)
+        frame_index = int(round((self.swing_angle + self.max_angle) / self.swing_angle_step))
+        self.image = self.swing_frames[max(0, min(len(self.swing_frames) - 1, frame_index))]
         current_world_y_ceiling_bottom_edge = self.terrain.ceiling_height_at(self.world_x_anchor)
         pivot_y_world = 0
         if not math.isfinite(current_world_y_ceiling_bottom_edge):
@@ -118,50 +140,20 @@ class HangingLight(pygame.sprite.Sprite):
                         glow_bbox_height = int(max_y_glow - min_y_glow)
 
                         if glow_bbox_width > 0 and glow_bbox_height > 0:
-                           
-                           
-                            color_edge = (50, 50, 10)
-                            color_mid = self.glow_color[:3] 
-                            glow_alpha = self.glow_color[3] 
-
-                            
-                            
-                            gradient_rect_surface = pygame.Surface((glow_bbox_width, glow_bbox_height), pygame.SRCALPHA)
-                            gradient_rect_surface.fill((0, 0, 0, 0)) 
-
-                            
-                            for x_local in range(glow_bbox_width):
-                                if glow_bbox_width == 1:
-                                    t_gradient = 0.5 
-                                else:
-                                    t_gradient = x_local / (glow_bbox_width - 1.0)
-                                
-                                current_rgb = ()
-                                if t_gradient <= 0.5:
-                                    interp_t = t_gradient * 2.0 
-                                    current_rgb = self._lerp_rgb_color(color_edge, color_mid, interp_t)
-                                else:
-                                    interp_t = (t_gradient - 0.5) * 2.0
-                                    current_rgb = self._lerp_rgb_color(color_mid, color_edge, interp_t)
-                                
-                                strip_color_with_alpha = (*current_rgb, glow_alpha)
-                                pygame.draw.line(gradient_rect_surface, strip_color_with_alpha, 
-                                                 (x_local, 0), (x_local, glow_bbox_height - 1))
-
-                            
-                            
-                            polygon_shape_mask = pygame.Surface((glow_bbox_width, glow_bbox_height), pygame.SRCALPHA)
-                            polygon_shape_mask.fill((0, 0, 0, 0)) 
-                            
-                            
-                            local_glow_points = [(int(p[0] - min_x_glow), int(p[1] - min_y_glow)) for p in glow_points_screen]
-                            pygame.draw.polygon(polygon_shape_mask, (255, 255, 255, 255), local_glow_points) 
-
-                            
-                            gradient_rect_surface.blit(polygon_shape_mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-                            
-                            
-                            surface.blit(gradient_rect_surface, (int(min_x_glow), int(min_y_glow)), special_flags=pygame.BLEND_RGBA_ADD)
+                            glow_surface = pygame.transform.scale(self.glow_gradient,
+                                                                  (glow_bbox_width, glow_bbox_height))
+
+                            l1, l2, l3, l4 = [(int(p[0] - min_x_glow), int(p[1] - min_y_glow))
+                                              for p in glow_points_screen]
+                            clear = (0, 0, 0, 0)
+                            pygame.draw.polygon(glow_surface, clear, [(0, 0), l1, l4, (0, glow_bbox_height)])
+                            pygame.draw.polygon(glow_surface, clear,
+                                                [l2, (glow_bbox_width, 0), (glow_bbox_width, glow_bbox_height), l3])
+                            pygame.draw.polygon(glow_surface, clear,
+                                                [l4, l3, (glow_bbox_width, glow_bbox_height), (0, glow_bbox_height)])
+
+                            surface.blit(glow_surface, (int(min_x_glow), int(min_y_glow)),
+                                         special_flags=pygame.BLEND_RGBA_ADD)
                             
             except (TypeError, ValueError) as e:
                 
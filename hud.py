@@ -2,6 +2,34 @@
 import pygame
 import math
 import os
+import text_cache
+
+LOW_AMMO_PULSE_STEPS = 16
+
+
+class HudWidget:
+    def __init__(self, build_func):
+        self.build_func = build_func
+        self.key = None
+        self.surface = None
+        self.topleft = (0, 0)
+
+    def draw(self, surface, key, *build_args):
+        if self.surface is None or key != self.key:
+            self.surface, self.topleft = self.build_func(*build_args)
+            self.key = key
+        surface.blit(self.surface, self.topleft)
+
+
+def _compose(parts):
+    left = min(pos[0] for _, pos in parts)
+    top = min(pos[1] for _, pos in parts)
+    right = max(pos[0] + part.get_width() for part, pos in parts)
+    bottom = max(pos[1] + part.get_height() for part, pos in parts)
+    composed = pygame.Surface((max(1, right - left), max(1, bottom - top)), pygame.SRCALPHA)
+    for part, pos in parts:
+        composed.blit(part, (pos[0] - left, pos[1] - top))
+    return composed, (left, top)
 
 
 class HUD:
@@ -34,6 +62,11 @@ class HUD:
         self.critical_health_pulse_timer = 0
         self._last_pulse_update_time = pygame.time.get_ticks() 
 
+        self.health_widget = HudWidget(self._build_health_bar)
+        self.bullet_widget = HudWidget(self._build_counter)
+        self.checkpoint_widget = HudWidget(self._build_counter)
+        self.critical_glow_surfaces = {}
+
     def load_assets(self):
         script_dir = os.path.dirname(os.path.abspath(__file__))
         assets_dir = os.path.join(script_dir, "assets")
@@ -140,91 +173,90 @@ class HUD:
         health_percent_display = self.displayed_health / max_health if max_health > 0 else 0
         health_percent_actual = current_health / max_health if max_health > 0 else 0
 
-        
-        icon_spacing = 10
-        text_spacing = 10
-        bar_corner_radius = 7
-
-        
-        current_x_offset = x
-        if self.health_icon:
-            icon_y = y + (height - self.health_icon.get_height()) // 2
-            surface.blit(self.health_icon, (current_x_offset, icon_y))
-            current_x_offset += self.health_icon.get_width() + icon_spacing
-
-        bar_x = current_x_offset
-        bar_rect_on_surface = pygame.Rect(bar_x, y, width, height)
-
-        
-        bar_area_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        bar_local_rect = bar_area_surface.get_rect()
-
-        
-        pygame.draw.rect(bar_area_surface, self.bar_bg_color, bar_local_rect, border_radius=bar_corner_radius)
-
-        
         fill_width = int(width * health_percent_display)
-        fill_rect_local = pygame.Rect(0, 0, fill_width, height)
-
         health_color_fill = self.health_bar_green
         if health_percent_actual <= 0.6: health_color_fill = self.health_bar_yellow
         if health_percent_actual <= 0.3: health_color_fill = self.health_bar_red
-        pygame.draw.rect(bar_area_surface, health_color_fill, fill_rect_local, border_radius=bar_corner_radius)
 
-        
+        flash_alpha = 0
         if self.health_change_flash_timer > 0:
             progress = (
                                    self.health_change_flash_duration - self.health_change_flash_timer) / self.health_change_flash_duration
-            flash_alpha = int(255 * math.sin(progress * math.pi))  
-
-            if flash_alpha > 0: 
-                flash_color_with_alpha = (self.flash_color[0], self.flash_color[1], self.flash_color[2], flash_alpha)
-
-             
-                flash_surface = pygame.Surface(bar_local_rect.size, pygame.SRCALPHA)
-             
-                pygame.draw.rect(flash_surface, flash_color_with_alpha, flash_surface.get_rect(),
-                                 border_radius=bar_corner_radius)
-
-                
-                bar_area_surface.blit(flash_surface, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            flash_alpha = max(0, int(255 * math.sin(progress * math.pi)))
 
             self.health_change_flash_timer -= delta_time_ms
             if self.health_change_flash_timer < 0: self.health_change_flash_timer = 0
 
-        surface.blit(bar_area_surface, (bar_x, y))  
-        pygame.draw.rect(surface, self.bar_border_color, bar_rect_on_surface, 2, border_radius=bar_corner_radius)
-
-        
         health_text_str = f"{int(current_health)} / {max_health}"
-        health_text_surf = self.hud_font.render(health_text_str, True, self.primary_color)
-        text_x = bar_x + width + text_spacing
-        text_y = y + (height - health_text_surf.get_height()) // 2
-        surface.blit(health_text_surf, (text_x, text_y))
+        self.health_widget.draw(surface, (x, y, width, height, fill_width, health_color_fill, flash_alpha,
+                                          health_text_str),
+                                x, y, width, height, fill_width, health_color_fill, flash_alpha, health_text_str)
 
         
         if health_percent_actual <= 0.25: 
             self.critical_health_pulse_timer += delta_time_ms * 0.008
             pulse_alpha = int(abs(math.sin(self.critical_health_pulse_timer) * 70)) + 30  
-            pulse_color = (self.critical_color[0], self.critical_color[1], self.critical_color[2], pulse_alpha)
-
-            glow_rect = bar_rect_on_surface.inflate(10, 10) 
-            glow_surface = pygame.Surface(glow_rect.size, pygame.SRCALPHA)
-            pygame.draw.rect(glow_surface, pulse_color, glow_surface.get_rect(), border_radius=bar_corner_radius + 5)
+            bar_x = x + (self.health_icon.get_width() + 10 if self.health_icon else 0)
+            glow_rect = pygame.Rect(bar_x, y, width, height).inflate(10, 10)
+            glow_surface = self.critical_glow_surfaces.get((glow_rect.size, pulse_alpha))
+            if glow_surface is None:
+                pulse_color = (self.critical_color[0], self.critical_color[1], self.critical_color[2], pulse_alpha)
+                glow_surface = pygame.Surface(glow_rect.size, pygame.SRCALPHA)
+                pygame.draw.rect(glow_surface, pulse_color, glow_surface.get_rect(), border_radius=7 + 5)
+                self.critical_glow_surfaces[(glow_rect.size, pulse_alpha)] = glow_surface
             surface.blit(glow_surface, glow_rect.topleft)
 
-    def draw_bullet_counter(self, surface, bullets_remaining, max_bullets, x, y, delta_time_ms):
+    def _build_health_bar(self, x, y, width, height, fill_width, health_color_fill, flash_alpha, health_text_str):
         icon_spacing = 10
         text_spacing = 10
+        bar_corner_radius = 7
+        parts = []
+
+        current_x_offset = x
+        if self.health_icon:
+            icon_y = y + (height - self.health_icon.get_height()) // 2
+            parts.append((self.health_icon, (current_x_offset, icon_y)))
+            current_x_offset += self.health_icon.get_width() + icon_spacing
+
+        bar_x = current_x_offset
+        bar_area_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        bar_local_rect = bar_area_surface.get_rect()
+        pygame.draw.rect(bar_area_surface, self.bar_bg_color, bar_local_rect, border_radius=bar_corner_radius)
+        pygame.draw.rect(bar_area_surface, health_color_fill, pygame.Rect(0, 0, fill_width, height),
+                         border_radius=bar_corner_radius)
+
+        if flash_alpha > 0:
+            flash_color_with_alpha = (self.flash_color[0], self.flash_color[1], self.flash_color[2], flash_alpha)
+            flash_surface = pygame.Surface(bar_local_rect.size, pygame.SRCALPHA)
+            pygame.draw.rect(flash_surface, flash_color_with_alpha, flash_surface.get_rect(),
+                             border_radius=bar_corner_radius)
+            bar_area_surface.blit(flash_surface, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
 
-        height_ref = self.bullet_icon.get_height() if self.bullet_icon else 30
+        pygame.draw.rect(bar_area_surface, self.bar_border_color[:3], bar_local_rect, 2, border_radius=bar_corner_radius)
+        parts.append((bar_area_surface, (bar_x, y)))
+
+        health_text_surf = text_cache.render(self.hud_font, health_text_str, self.primary_color)
+        text_y = y + (height - health_text_surf.get_height()) // 2
+        parts.append((health_text_surf, (bar_x + width + text_spacing, text_y)))
+        return _compose(parts)
+
+    def _build_counter(self, icon, text_str, text_color, x, y):
+        icon_spacing = 10
+        height_ref = icon.get_height() if icon else 30
+        parts = []
         current_x_offset = x
 
-        if self.bullet_icon:
-            icon_y = y + (height_ref - self.bullet_icon.get_height()) // 2
-            surface.blit(self.bullet_icon, (current_x_offset, icon_y))
-            current_x_offset += self.bullet_icon.get_width() + icon_spacing
+        if icon:
+            icon_y = y + (height_ref - icon.get_height()) // 2
+            parts.append((icon, (current_x_offset, icon_y)))
+            current_x_offset += icon.get_width() + icon_spacing
 
+        text_surf = text_cache.render(self.hud_font, text_str, text_color)
+        text_y = y + (height_ref - text_surf.get_height()) // 2
+        parts.append((text_surf, (current_x_offset, text_y)))
+        return _compose(parts)
+
+    def draw_bullet_counter(self, surface, bullets_remaining, max_bullets, x, y, delta_time_ms):
         bullet_text_str = f"{bullets_remaining} / {max_bullets}"
 
         text_color = self.primary_color
@@ -236,6 +268,7 @@ class HUD:
         elif is_low_ammo:
             self.low_ammo_pulse_timer += delta_time_ms * 0.01  
             pulse_factor = (math.sin(self.low_ammo_pulse_timer) + 1) / 2  
+            pulse_factor = round(pulse_factor * LOW_AMMO_PULSE_STEPS) / LOW_AMMO_PULSE_STEPS
             
             text_color = (
                 int(self.primary_color[0] * (1 - pulse_factor) + self.warning_color[0] * pulse_factor),
@@ -243,25 +276,13 @@ class HUD:
                 int(self.primary_color[2] * (1 - pulse_factor) + self.warning_color[2] * pulse_factor)
             )
 
-        bullet_text_surf = self.hud_font.render(bullet_text_str, True, text_color)
-        text_y = y + (height_ref - bullet_text_surf.get_height()) // 2
-        surface.blit(bullet_text_surf, (current_x_offset, text_y))
+        self.bullet_widget.draw(surface, (bullet_text_str, text_color, x, y),
+                                self.bullet_icon, bullet_text_str, text_color, x, y)
 
     def draw_checkpoint_counter(self, surface, collected, total, x, y):
-        icon_spacing = 10
-        text_spacing = 10
-        height_ref = self.checkpoint_icon.get_height() if self.checkpoint_icon else 30
-        current_x_offset = x
-
-        if self.checkpoint_icon:
-            icon_y = y + (height_ref - self.checkpoint_icon.get_height()) // 2
-            surface.blit(self.checkpoint_icon, (current_x_offset, icon_y))
-            current_x_offset += self.checkpoint_icon.get_width() + icon_spacing
-
         checkpoint_text_str = f"NODE: {collected} / {total}"
-        checkpoint_text_surf = self.hud_font.render(checkpoint_text_str, True, self.primary_color)
-        text_y = y + (height_ref - checkpoint_text_surf.get_height()) // 2
-        surface.blit(checkpoint_text_surf, (current_x_offset, text_y))
+        self.checkpoint_widget.draw(surface, (checkpoint_text_str, x, y),
+                                    self.checkpoint_icon, checkpoint_text_str, self.primary_color, x, y)
 
     def draw(self, surface, gs_obj, player_obj, config_obj, time_delta_seconds):
         delta_time_ms = int(time_delta_seconds * 1000)
@@ -1,60 +1,44 @@
 # laser.py
 import pygame
 import math
-import os
-import sys
-from config import LASER_SPEED_X, LASER_GRAVITY, WIDTH, HEIGHT
+from config import LASER_SPEED_X, LASER_GRAVITY, WIDTH, HEIGHT, FPS
+import asset_registry
+import pool
 
+LASER_BASE_WIDTH = 15
+LASER_BASE_HEIGHT = 4
 
-class Laser(pygame.sprite.Sprite):
+
+def _build_laser_image():
+    overlay_loaded_image = asset_registry.get_image("laser.png")
+    if overlay_loaded_image:
+        laser_image = pygame.Surface((LASER_BASE_WIDTH, LASER_BASE_HEIGHT), pygame.SRCALPHA)
+        laser_image.fill((255, 0, 0, 255))
+        overlay_rect = overlay_loaded_image.get_rect(center=laser_image.get_rect().center)
+        laser_image.blit(overlay_loaded_image, overlay_rect)
+    else:
+        laser_image = pygame.Surface((LASER_BASE_WIDTH, LASER_BASE_HEIGHT))
+        laser_image.fill((255, 0, 0))
+    return laser_image
+
+
+class Laser(pool.PooledSprite, pygame.sprite.Sprite):
     def __init__(self, start_screen_x, start_world_y, target_rock=None):
         super().__init__()
 
-        
-        base_width = 15
-        base_height = 4
-
-        
-        overlay_loaded_image = None
-        try:
-        
-            script_dir = os.path.dirname(
-                os.path.abspath(sys.argv[0] if hasattr(sys, 'argv') and sys.argv else __file__))
-            assets_dir = os.path.join(script_dir, "assets")
-            if not os.path.isdir(assets_dir):  
-                parent_dir = os.path.dirname(script_dir)
-                assets_dir = os.path.join(parent_dir, "assets")
-
-            image_path = os.path.join(assets_dir, "laser.png")
-
-            if os.path.exists(image_path):
-                overlay_loaded_image = pygame.image.load(image_path).convert_alpha()
-           
-           
-        except Exception as e:
-            print(f"Error loading laser.png for overlay: {e}. Overlay will not be applied.")
+        self.image = asset_registry.get_built("laser_bolt", _build_laser_image)
+        self.rect = self.image.get_rect()
+        self.reset(start_screen_x, start_world_y, target_rock)
 
-      
-        if overlay_loaded_image:
-            self.image = pygame.Surface((base_width, base_height), pygame.SRCALPHA)
-       
-            self.image.fill((255, 0, 0, 255))
-
-       
-            overlay_rect = overlay_loaded_image.get_rect(center=self.image.get_rect().center)
-            self.image.blit(overlay_loaded_image, overlay_rect)
-        else:
-           
-            self.image = pygame.Surface((base_width, base_height))
-            self.image.fill((255, 0, 0))
-        
-
-        self.rect = self.image.get_rect(left=int(start_screen_x), centery=int(start_world_y))
+    def reset(self, start_screen_x, start_world_y, target_rock=None):
+        self.rect.left = int(start_screen_x)
+        self.rect.centery = int(start_world_y)
 
         self.world_x = float(start_screen_x) 
         self.world_y = float(start_world_y)  
 
         self.target_rock = target_rock 
+        self.target_generation = getattr(target_rock, 'pool_generation', 0)
         self.is_homing = target_rock is not None
 
         if self.is_homing and self.target_rock:
@@ -69,34 +53,38 @@ class Laser(pygame.sprite.Sprite):
             self.vx = LASER_SPEED_X
             self.vy = 0  
 
-    def update(self, camera_y_offset): 
+    def blit_item(self, camera_y_offset):
+        return self.image, (self.rect.x, self.rect.y - camera_y_offset)
+
+    def update(self, camera_y_offset, time_delta_seconds=1.0 / FPS):
+        frame_steps = time_delta_seconds * FPS
         if self.is_homing:
-            if self.target_rock and self.target_rock.alive():
+            if pool.is_same_instance(self.target_rock, self.target_generation):
               
                 dx = self.target_rock.rect.centerx - self.world_x
                 dy = self.target_rock.rect.centery - self.world_y
                 distance = math.hypot(dx, dy)
 
              
-                if distance < LASER_SPEED_X * 1.5: 
+                if distance < LASER_SPEED_X * frame_steps * 1.5: 
                     self.world_x = self.target_rock.rect.centerx
                     self.world_y = self.target_rock.rect.centery
                 elif distance > 0: 
                     self.vx = (dx / distance) * LASER_SPEED_X
                     self.vy = (dy / distance) * LASER_SPEED_X
 
-                self.world_x += self.vx
-                self.world_y += self.vy
+                self.world_x += self.vx * frame_steps
+                self.world_y += self.vy * frame_steps
             else: 
                 self.is_homing = False
                
-                self.vy += LASER_GRAVITY
-                self.world_x += self.vx
-                self.world_y += self.vy
+                self.vy += LASER_GRAVITY * frame_steps
+                self.world_x += self.vx * frame_steps
+                self.world_y += self.vy * frame_steps
         else:  
-            self.vy += LASER_GRAVITY
-            self.world_x += self.vx
-            self.world_y += self.vy
+            self.vy += LASER_GRAVITY * frame_steps
+            self.world_x += self.vx * frame_steps
+            self.world_y += self.vy * frame_steps
 
       
         self.rect.x = int(self.world_x)
@@ -2,18 +2,31 @@
 import pygame
 import math
 import random
-import os
-import sys
 import config
 from config import PLAYER_SCREEN_X, WIDTH, \
     HEIGHT
 import game_state as gs
+import numpy as np
 from debris_effect import DebrisEffect
+import asset_registry
+import collision
+import pool
 
 
-class Obstacle(pygame.sprite.Sprite):
-    def __init__(self, screen_spawn_x, terrain_obj, image_asset_path_name=None, is_tutorial_obstacle=False):
+def _build_fallback_image(size, color, flags=pygame.SRCALPHA):
+    fallback = pygame.Surface(size, flags)
+    fallback.fill(color)
+    return fallback
+
+
+class Obstacle(pool.PooledSprite, pygame.sprite.Sprite):
+    def __init__(self, *args, **kwargs):
         super().__init__()
+        self.image = None
+        self.rect = None
+        self.reset(*args, **kwargs)
+
+    def reset(self, screen_spawn_x, terrain_obj, image_asset_path_name=None, is_tutorial_obstacle=False):
         self.image_asset_path_name = image_asset_path_name
         self.is_tutorial_obstacle = is_tutorial_obstacle
         self.obstacle_type = "generic"
@@ -22,52 +35,29 @@ class Obstacle(pygame.sprite.Sprite):
         self.debris_material = "rock"
 
         self.terrain = terrain_obj
-        self.image = None
-        self.rect = None
         self.world_x = float(screen_spawn_x)
 
-     
-        if not isinstance(self, (IceFormation, BrokenSatellite, BugObstacle)): 
-            self._setup_visuals_and_rect(screen_spawn_x, terrain_obj)
+        if isinstance(self, (IceFormation, BrokenSatellite, BugObstacle, CrystalObstacle)):
+            return
+        self._setup_visuals_and_rect(screen_spawn_x, terrain_obj)
 
-        if self.rect:
-            if not isinstance(self, (BrokenSatellite, BugObstacle, CrystalObstacle)):
-                current_terrain_y = self.terrain.height_at(self.world_x + self.rect.width / 2)
-                if self.is_tutorial_obstacle:
-                    tut_x_center = PLAYER_SCREEN_X + WIDTH // 3
-                    
-                    is_falling_tutorial_satellite = isinstance(self, BrokenSatellite) and \
-                                                    hasattr(self, 'is_special_falling_satellite') and \
-                                                    self.is_special_falling_satellite
-                    if not is_falling_tutorial_satellite:
-                        self.world_x = float(tut_x_center - self.rect.width / 2)
-                        self.rect.midbottom = (tut_x_center, self.terrain.height_at(tut_x_center))
-                else:
-                    self.rect.midbottom = (int(self.world_x + self.rect.width / 2), current_terrain_y)
-        elif not self.image:
-            self.image = pygame.Surface((1, 1), pygame.SRCALPHA)
-            self.rect = self.image.get_rect(topleft=(int(self.world_x), terrain_obj.height_at(self.world_x)))
+        if self.is_tutorial_obstacle:
+            tut_x_center = PLAYER_SCREEN_X + WIDTH // 3
+            self.world_x = float(tut_x_center - self.rect.width / 2)
+            self.rect.midbottom = (tut_x_center, self.terrain.height_at(tut_x_center))
+        else:
+            current_terrain_y = self.terrain.height_at(self.world_x + self.rect.width / 2)
+            self.rect.midbottom = (int(self.world_x + self.rect.width / 2), current_terrain_y)
+
+    def _fit_rect(self):
+        if self.rect is None:
+            self.rect = self.image.get_rect()
+        else:
+            self.rect.size = self.image.get_size()
 
     def _load_image_asset(self, target_width, target_height):
         if self.image_asset_path_name:
-            try:
-                main_script_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
-                path = os.path.join(main_script_dir, "assets", self.image_asset_path_name)
-
-                if not os.path.exists(path):
-                    current_file_dir = os.path.dirname(os.path.abspath(__file__))
-                    project_root_dir = os.path.dirname(current_file_dir)
-                    path = os.path.join(project_root_dir, "assets", self.image_asset_path_name)
-                    if not os.path.exists(path) and project_root_dir != main_script_dir:
-                        path = os.path.join(current_file_dir, "assets", self.image_asset_path_name)
-
-                if os.path.exists(path):
-                    loaded_image = pygame.image.load(path).convert_alpha()
-                    return pygame.transform.smoothscale(loaded_image, (target_width, target_height))
-                else:
-                    print(f"Obstacle image not found for: {self.image_asset_path_name} at path {path}")
-            except Exception as e:
-                print(f"Error loading obstacle image '{self.image_asset_path_name}': {e}")
+            return asset_registry.get_image(self.image_asset_path_name, (target_width, target_height))
         return None
 
     def _setup_visuals_and_rect(self, screen_spawn_x, terrain_obj):
@@ -78,11 +68,12 @@ class Obstacle(pygame.sprite.Sprite):
         if loaded_img:
             self.image = loaded_img
         else:
-            self.image = pygame.Surface((width_to_use, height_to_use), pygame.SRCALPHA)
-            self.image.fill((128, 128, 128, 128))
+            self.image = asset_registry.get_built(
+                ("obstacle_fallback", width_to_use, height_to_use),
+                lambda: _build_fallback_image((width_to_use, height_to_use), (128, 128, 128, 128)))
 
         if self.image:
-            self.rect = self.image.get_rect()
+            self._fit_rect()
             initial_y = terrain_obj.height_at(self.world_x + self.rect.width / 2)
             self.rect.midbottom = (int(self.world_x + self.rect.width / 2), initial_y)
 
@@ -106,6 +97,11 @@ class Obstacle(pygame.sprite.Sprite):
         center_y = self.rect.centery if self.rect else self.terrain.height_at(self.world_x)
         return self.debris_material, center_x, center_y, self.obstacle_type
 
+    def blit_item(self, camera_y_offset):
+        if self.image and self.rect:
+            return self.image, (self.rect.x, self.rect.y - camera_y_offset)
+        return None
+
     def draw(self, surface, camera_y_offset):
         if self.image and self.rect:
             obs_screen_y = self.rect.y - camera_y_offset
@@ -113,13 +109,16 @@ class Obstacle(pygame.sprite.Sprite):
 
 
 class IceFormation(Obstacle):
-    def __init__(self, screen_spawn_x, terrain_obj, image_asset_path_name=None,
-                 is_tutorial_obstacle=False):
+    def __init__(self, *args, **kwargs):
+        self.base_image = None
+        self.glint_elements = []
+        super().__init__(*args, **kwargs)
+
+    def reset(self, screen_spawn_x, terrain_obj, image_asset_path_name=None, is_tutorial_obstacle=False):
         self.is_erupting = False
         self.has_erupted = False
         self.current_eruption_height = 0.01
         self.eruption_speed = random.uniform(350, 550)
-        self.base_image = None
         self.spike_overlay_image_base = None
         self.eruption_proximity_range = WIDTH * 0.45
         self.spawn_debris_on_eruption = True
@@ -128,26 +127,15 @@ class IceFormation(Obstacle):
         self.glint_duration = random.randint(80, 200)
         self.glint_active = False
         self.glint_alpha = 0
-        self.glint_elements = []
+        self.glint_elements.clear()
 
-        super().__init__(screen_spawn_x, terrain_obj, image_asset_path_name=None,
-                         is_tutorial_obstacle=is_tutorial_obstacle)
+        super().reset(screen_spawn_x, terrain_obj, image_asset_path_name=None,
+                      is_tutorial_obstacle=is_tutorial_obstacle)
         self.obstacle_type = "ice_formation"
         self.damage_value = 25
         self.debris_material = "ice"
         self.destructible = True
         self._setup_visuals_and_rect(screen_spawn_x, terrain_obj)
-        if self.spike_overlay_image_base:
-            self.image = pygame.Surface((config.ICE_SPIKE_OVERLAY_WIDTH, 1), pygame.SRCALPHA)
-        elif self.base_image:
-            self.image = pygame.Surface((self.base_image.get_width(), 1), pygame.SRCALPHA)
-        else:
-            self.image = pygame.Surface((10, 1), pygame.SRCALPHA)
-
-        if not self.rect:
-            self.rect = self.image.get_rect()
-            initial_y = self.terrain.height_at(self.world_x + (self.rect.width / 2 if self.rect else 0))
-            self.rect.midbottom = (int(self.world_x + (self.rect.width / 2 if self.rect else 0)), initial_y)
         self._update_erupting_image(initial_setup=True)
 
     def _setup_visuals_and_rect(self, screen_spawn_x, terrain_obj):
@@ -156,7 +144,9 @@ class IceFormation(Obstacle):
         formation_visual_width = config.ICE_SPIKE_OVERLAY_WIDTH
         extra_draw_depth = 50
         temp_render_surf_height = self.target_formation_height + extra_draw_depth
-        temp_render_surf = pygame.Surface((formation_visual_width, temp_render_surf_height), pygame.SRCALPHA)
+        temp_render_surf = self.base_image
+        if temp_render_surf is None or temp_render_surf.get_size() != (formation_visual_width, temp_render_surf_height):
+            temp_render_surf = pygame.Surface((formation_visual_width, temp_render_surf_height), pygame.SRCALPHA)
         temp_render_surf.fill((0, 0, 0, 0))
         num_main_spikes = random.randint(4, 7)
         for i in range(num_main_spikes):
@@ -181,32 +171,18 @@ class IceFormation(Obstacle):
             except (ValueError, TypeError) as e:
                 print(f"Error drawing procedural spike for base: {e}")
         self.base_image = temp_render_surf
-        try:
-            main_script_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
-            overlay_path = os.path.join(main_script_dir, "assets", config.ICE_SPIKE_IMAGE_FILENAME)
-            if not os.path.exists(overlay_path):
-                current_file_dir = os.path.dirname(os.path.abspath(__file__))
-                project_root_dir = os.path.dirname(current_file_dir)
-                overlay_path = os.path.join(project_root_dir, "assets", config.ICE_SPIKE_IMAGE_FILENAME)
-                if not os.path.exists(overlay_path) and project_root_dir != main_script_dir:
-                    overlay_path = os.path.join(current_file_dir, "assets", config.ICE_SPIKE_IMAGE_FILENAME)
-            if os.path.exists(overlay_path):
-                loaded_overlay = pygame.image.load(overlay_path).convert_alpha()
-                self.spike_overlay_image_base = pygame.transform.smoothscale(
-                    loaded_overlay, (config.ICE_SPIKE_OVERLAY_WIDTH, config.ICE_SPIKE_OVERLAY_HEIGHT)
-                )
-            else:
-                print(
-                    f"ERROR: Spike overlay image '{config.ICE_SPIKE_IMAGE_FILENAME}' not found at {overlay_path}. Using fallback.")
-                self.spike_overlay_image_base = pygame.Surface(
-                    (config.ICE_SPIKE_OVERLAY_WIDTH, config.ICE_SPIKE_OVERLAY_HEIGHT), pygame.SRCALPHA)
-                self.spike_overlay_image_base.fill((200, 220, 255, 200))
-        except Exception as e:
-            print(f"Error loading spike overlay image '{config.ICE_SPIKE_IMAGE_FILENAME}': {e}")
-            self.spike_overlay_image_base = pygame.Surface(
-                (config.ICE_SPIKE_OVERLAY_WIDTH, config.ICE_SPIKE_OVERLAY_HEIGHT), pygame.SRCALPHA)
-            self.spike_overlay_image_base.fill((200, 220, 255, 180))
-        self.rect = pygame.Rect(0, 0, config.ICE_SPIKE_OVERLAY_WIDTH, config.ICE_SPIKE_OVERLAY_HEIGHT)
+        self.spike_overlay_image_base = asset_registry.get_image(
+            config.ICE_SPIKE_IMAGE_FILENAME, (config.ICE_SPIKE_OVERLAY_WIDTH, config.ICE_SPIKE_OVERLAY_HEIGHT))
+        if not self.spike_overlay_image_base:
+            print(f"ERROR: Spike overlay image '{config.ICE_SPIKE_IMAGE_FILENAME}' unavailable. Using fallback.")
+            self.spike_overlay_image_base = asset_registry.get_built(
+                ("ice_spike_fallback", config.ICE_SPIKE_OVERLAY_WIDTH, config.ICE_SPIKE_OVERLAY_HEIGHT),
+                lambda: _build_fallback_image((config.ICE_SPIKE_OVERLAY_WIDTH, config.ICE_SPIKE_OVERLAY_HEIGHT),
+                                              (200, 220, 255, 200)))
+        if self.rect is None:
+            self.rect = pygame.Rect(0, 0, config.ICE_SPIKE_OVERLAY_WIDTH, config.ICE_SPIKE_OVERLAY_HEIGHT)
+        else:
+            self.rect.size = (config.ICE_SPIKE_OVERLAY_WIDTH, config.ICE_SPIKE_OVERLAY_HEIGHT)
         initial_y_on_terrain = terrain_obj.height_at(self.world_x + self.rect.width / 2)
         self.rect.midbottom = (int(self.world_x + self.rect.width / 2), initial_y_on_terrain)
 
@@ -350,14 +326,36 @@ class IceFormation(Obstacle):
         if game_state_current != gs.TUTORIAL and self.rect and self.rect.right < 0:
             self.kill()
 
+    def collision_mask(self):
+        if not self.image or not self.rect:
+            return None, None
+        source = self.spike_overlay_image_base or self.base_image
+        if source is None:
+            return collision.image_mask(self.image), self.rect.topleft
+        visible_h = self.image.get_height()
+        if visible_h < source.get_height():
+            step = config.COLLISION_MASK_HEIGHT_STEP
+            visible_h = max(step, int(round(visible_h / step)) * step)
+        mask = collision.bottom_slice_mask(source, visible_h)
+        return mask, (self.rect.left, self.rect.bottom - mask.get_size()[1])
+
     def draw(self, surface, camera_y_offset):
         super().draw(surface, camera_y_offset)
 
 
 class BrokenSatellite(Obstacle):
-    def __init__(self, screen_spawn_x, terrain_obj, image_asset_path_name="satellite.png", is_tutorial_obstacle=False,
-                 crash_sound_obj=None, impact_sound_obj=None):
+    flame_colors = [(255, 100, 0), (255, 150, 0), (255, 50, 0), (255, 200, 50), (255, 180, 30), (255, 220, 80)]
+
+    def __init__(self, *args, **kwargs):
         self.smoke_particles = []
+        self.flame_particles = []
+        self.clipped_image = None
+        self.clipped_mask = None
+        super().__init__(*args, **kwargs)
+
+    def reset(self, screen_spawn_x, terrain_obj, image_asset_path_name="satellite.png", is_tutorial_obstacle=False,
+              crash_sound_obj=None, impact_sound_obj=None):
+        self.smoke_particles.clear()
         self.max_smoke_particles = 50
         self.smoke_spawn_interval = 80
         self.last_smoke_spawn_time = 0
@@ -373,11 +371,10 @@ class BrokenSatellite(Obstacle):
         self.fall_duration_secs = 1.4
         self.has_impacted = False
 
-        self.flame_particles = []
+        self.flame_particles.clear()
         self.max_flame_particles = 200
         self.flame_spawn_interval = 10
         self.last_flame_spawn_time = 0
-        self.flame_colors = [(255, 100, 0), (255, 150, 0), (255, 50, 0), (255, 200, 50), (255, 180, 30), (255, 220, 80)]
 
         self.falling_sound_asset = crash_sound_obj
         self.impact_sound_asset = impact_sound_obj
@@ -385,6 +382,9 @@ class BrokenSatellite(Obstacle):
         self.is_falling_sound_playing = False
         self.was_falling_sound_playing_before_pause = False
 
+        self.clip_source_image = None
+        self.clip_profile = None
+
         self.is_special_falling_satellite = True
         self.current_visual_y_offset = self.initial_fall_offset_val
         distance_to_cover = abs(self.initial_fall_offset_val)
@@ -393,10 +393,8 @@ class BrokenSatellite(Obstacle):
         else:
             self.fall_acceleration = 4000
 
-        super().__init__(screen_spawn_x, terrain_obj, image_asset_path_name, is_tutorial_obstacle)
-
-        if not self.image or (self.image and self.image.get_width() <= config.OBSTACLE_SPRITE_WIDTH):
-            self._setup_visuals_and_rect(screen_spawn_x, terrain_obj)
+        super().reset(screen_spawn_x, terrain_obj, image_asset_path_name, is_tutorial_obstacle)
+        self._setup_visuals_and_rect(screen_spawn_x, terrain_obj)
 
         self.horizontal_entry_speed = 50.0
         self.obstacle_type = "satellite_debris"
@@ -485,11 +483,12 @@ class BrokenSatellite(Obstacle):
         if loaded_img:
             self.image = loaded_img
         else:
-            self.image = pygame.Surface((satellite_width, self.satellite_sprite_height), pygame.SRCALPHA)
-            self.image.fill((100, 100, 110, 128))
+            self.image = asset_registry.get_built(
+                ("satellite_fallback", satellite_width, self.satellite_sprite_height),
+                lambda: _build_fallback_image((satellite_width, self.satellite_sprite_height), (100, 100, 110, 128)))
 
         if self.image:
-            self.rect = self.image.get_rect()
+            self._fit_rect()
             terrain_y_for_anchor = terrain_obj.height_at(self.world_x + self.rect.width / 2)
             self.rect.midbottom = (int(self.world_x + self.rect.width / 2),
                                    terrain_y_for_anchor + int(self.current_visual_y_offset))
@@ -592,10 +591,10 @@ class BrokenSatellite(Obstacle):
                 gs.screen_shake_duration = 0.45
                 if effects_creation_group and self.rect:
                     effects_creation_group.add(
-                        DebrisEffect(self.rect.centerx, self.rect.bottom - self.y_sink_offset, "machinery",
+                        pool.acquire(DebrisEffect, self.rect.centerx, self.rect.bottom - self.y_sink_offset, "machinery",
                                      intensity=2.8))
                     effects_creation_group.add(
-                        DebrisEffect(self.rect.centerx, self.rect.bottom - self.y_sink_offset, "snow_puff",
+                        pool.acquire(DebrisEffect, self.rect.centerx, self.rect.bottom - self.y_sink_offset, "snow_puff",
                                      intensity=5.5))
                 self.flame_particles = []
 
@@ -646,6 +645,7 @@ class BrokenSatellite(Obstacle):
             if p['alpha'] > 5 and p['size'] > 2:
                 active_smoke_particles.append(p)
         self.smoke_particles = active_smoke_particles
+        self.get_clipped_image()
 
     def on_destroy(self):
         self._stop_falling_sound()
@@ -700,6 +700,39 @@ class BrokenSatellite(Obstacle):
                     
                     pass
 
+    def get_clipped_image(self):
+        width, height = self.image.get_size()
+        buried_tops = self.terrain.heights_at(self.rect.left + np.arange(width, dtype=np.float64)) - self.rect.top
+        if self.clip_source_image is self.image and self.clip_profile is not None and \
+                np.abs(buried_tops - self.clip_profile).max() <= config.SATELLITE_CLIP_TOLERANCE_PX:
+            return self.clipped_image
+        cut_rows = np.clip(np.ceil(buried_tops), 0, height).astype(np.int32)
+        if width == 0 or cut_rows.min() >= height:
+            clipped = self.image
+        else:
+            clipped = self.image.copy()
+            try:
+                alpha = pygame.surfarray.pixels_alpha(clipped)
+                alpha[np.arange(height, dtype=np.int32)[None, :] >= cut_rows[:, None]] = 0
+                del alpha
+            except ValueError:
+                clipped = self.image
+        self.clip_source_image = self.image
+        self.clip_profile = buried_tops
+        self.clipped_image = clipped
+        self.clipped_mask = None
+        return clipped
+
+    def collision_mask(self):
+        if not self.image or not self.rect:
+            return None, None
+        clipped = self.get_clipped_image()
+        if clipped is self.image:
+            return collision.image_mask(clipped), self.rect.topleft
+        if self.clipped_mask is None:
+            self.clipped_mask = pygame.mask.from_surface(clipped)
+        return self.clipped_mask, self.rect.topleft
+
     def draw_smoke(self, surface, camera_y_offset):
         if not self.rect: return 
         for p in self.smoke_particles:
@@ -732,6 +765,9 @@ class BrokenSatellite(Obstacle):
                 
                 pass
 
+    def blit_item(self, camera_y_offset):
+        return None
+
     def draw(self, surface, camera_y_offset): 
         if not self.image or not self.rect:
             return
@@ -739,54 +775,28 @@ class BrokenSatellite(Obstacle):
        
         self._draw_flame_particles(surface, camera_y_offset)
 
-       
-        temp_satellite_image_surf = self.image.copy()
-        TERRAIN_MASK_STEP = 5
-        Y_BUFFER = 5
-        terrain_points_local_to_sprite = []
-        world_x_start_of_sprite = self.rect.left 
-        world_y_top_of_sprite = self.rect.top 
-
-        for local_x_on_sprite in range(0, temp_satellite_image_surf.get_width(), TERRAIN_MASK_STEP):
-            world_x_current = world_x_start_of_sprite + local_x_on_sprite
-            terrain_world_y = self.terrain.height_at(world_x_current)
-            local_y_on_sprite = terrain_world_y - world_y_top_of_sprite
-            terrain_points_local_to_sprite.append((local_x_on_sprite, local_y_on_sprite))
-
-        if not terrain_points_local_to_sprite or terrain_points_local_to_sprite[-1][0] < temp_satellite_image_surf.get_width() - 1:
-            local_x_on_sprite_last = temp_satellite_image_surf.get_width() - 1
-            if local_x_on_sprite_last >= 0 :
-                world_x_current = world_x_start_of_sprite + local_x_on_sprite_last
-                terrain_world_y = self.terrain.height_at(world_x_current)
-                local_y_on_sprite = terrain_world_y - world_y_top_of_sprite
-                if not terrain_points_local_to_sprite or terrain_points_local_to_sprite[-1][0] < local_x_on_sprite_last:
-                    terrain_points_local_to_sprite.append((local_x_on_sprite_last, local_y_on_sprite))
-        
-      
-        draw_pos_x_sprite = self.rect.x 
-        draw_pos_y_sprite = self.rect.y - camera_y_offset 
+        clipped = self.clipped_image if self.clip_source_image is self.image else self.get_clipped_image()
+        surface.blit(clipped, (self.rect.x, self.rect.y - camera_y_offset))
 
-        if len(terrain_points_local_to_sprite) < 2:
-            surface.blit(self.image, (draw_pos_x_sprite, draw_pos_y_sprite)) 
-        else:
-            erase_polygon_points_on_sprite = list(terrain_points_local_to_sprite)
-            erase_polygon_points_on_sprite.append(
-                (temp_satellite_image_surf.get_width() - 1, temp_satellite_image_surf.get_height() + Y_BUFFER))
-            erase_polygon_points_on_sprite.append((0, temp_satellite_image_surf.get_height() + Y_BUFFER))
-            try:
-                pygame.draw.polygon(temp_satellite_image_surf, (0, 0, 0, 0), erase_polygon_points_on_sprite)
-            except ValueError:
-                 pass 
-            surface.blit(temp_satellite_image_surf, (draw_pos_x_sprite, draw_pos_y_sprite))
-        
       
         self.draw_smoke(surface, camera_y_offset)
 
 
 class BugObstacle(Obstacle):
-    def __init__(self, screen_spawn_x, terrain_obj, is_tutorial_obstacle=False,
-                 spawn_sound=None, die_sound=None):
-        self.frames = []
+    def __init__(self, *args, **kwargs):
+        self.frames = asset_registry.get_frames("bug{}.png", range(1, 3),
+                                                (config.BUG_SPRITE_WIDTH, config.BUG_SPRITE_HEIGHT))
+
+        if not self.frames:
+            print("BugObstacle: No animation frames loaded. Using red square fallback.")
+            self.frames.append(asset_registry.get_built(
+                ("bug_fallback", config.BUG_SPRITE_WIDTH, config.BUG_SPRITE_HEIGHT),
+                lambda: _build_fallback_image((config.BUG_SPRITE_WIDTH, config.BUG_SPRITE_HEIGHT), (255, 0, 0), 0)))
+        self.flipped_frames = [pygame.transform.flip(frame, True, False) for frame in self.frames]
+        super().__init__(*args, **kwargs)
+
+    def reset(self, screen_spawn_x, terrain_obj, is_tutorial_obstacle=False,
+              spawn_sound=None, die_sound=None):
         self.anim_frame_index = 0
         self.anim_timer = 0.0
         self.move_speed = config.BUG_MOVE_SPEED
@@ -796,33 +806,8 @@ class BugObstacle(Obstacle):
         self.die_sound = die_sound
         self.spawn_sound_channel = None
 
-        base_dir_bug = os.path.dirname(os.path.abspath(sys.argv[0] if hasattr(sys, 'argv') and sys.argv else __file__))
-        assets_dir_bug = os.path.join(base_dir_bug, "assets")
-        if not os.path.isdir(assets_dir_bug):
-            parent_dir_bug = os.path.dirname(base_dir_bug)
-            assets_dir_bug = os.path.join(parent_dir_bug, "assets")
-
-        for i in range(1, 3):
-            filename = f"bug{i}.png"
-            path = os.path.join(assets_dir_bug, filename)
-            try:
-                if os.path.exists(path):
-                    img = pygame.image.load(path).convert_alpha()
-                    img_scaled = pygame.transform.smoothscale(img, (config.BUG_SPRITE_WIDTH, config.BUG_SPRITE_HEIGHT))
-                    self.frames.append(img_scaled)
-                else:
-                    print(f"BugObstacle: Image {filename} not found at {path}")
-            except Exception as e:
-                print(f"BugObstacle: Error loading image {filename}: {e}")
-
-        if not self.frames:
-            print("BugObstacle: No animation frames loaded. Using red square fallback.")
-            fallback_img = pygame.Surface((config.BUG_SPRITE_WIDTH, config.BUG_SPRITE_HEIGHT))
-            fallback_img.fill((255, 0, 0))
-            self.frames.append(fallback_img)
-
-        super().__init__(screen_spawn_x, terrain_obj, image_asset_path_name=None,
-                         is_tutorial_obstacle=is_tutorial_obstacle)
+        super().reset(screen_spawn_x, terrain_obj, image_asset_path_name=None,
+                      is_tutorial_obstacle=is_tutorial_obstacle)
 
         self.obstacle_type = "bug"
         self.damage_value = config.BUG_DAMAGE_VALUE
@@ -830,7 +815,7 @@ class BugObstacle(Obstacle):
         self.destructible = True
 
         self.image = self.frames[self.anim_frame_index]
-        self.rect = self.image.get_rect()
+        self._fit_rect()
         initial_y = self.terrain.height_at(self.world_x + self.rect.width / 2)
         self.rect.midbottom = (int(self.world_x + self.rect.width / 2), initial_y)
 
@@ -867,11 +852,10 @@ class BugObstacle(Obstacle):
         if self.anim_timer >= config.BUG_ANIMATION_SPEED:
             self.anim_timer = 0.0
             self.anim_frame_index = (self.anim_frame_index + 1) % len(self.frames)
-            current_image_base = self.frames[self.anim_frame_index]
             if not self.facing_left:
-                self.image = pygame.transform.flip(current_image_base, True, False)
+                self.image = self.flipped_frames[self.anim_frame_index]
             else:
-                self.image = current_image_base
+                self.image = self.frames[self.anim_frame_index]
 
         current_center_x_for_terrain = self.rect.centerx
         y_terrain_base = self.terrain.height_at(current_center_x_for_terrain)
@@ -904,7 +888,7 @@ class BugObstacle(Obstacle):
 
 
 class CrystalObstacle(Obstacle):
-    def __init__(self, screen_spawn_x, terrain_obj, impact_sound_obj=None, destruction_sound_obj=None):
+    def reset(self, screen_spawn_x, terrain_obj, impact_sound_obj=None, destruction_sound_obj=None):
         
         self.is_falling = True
         self.fall_velocity_y = config.CRYSTAL_INITIAL_FALL_VELOCITY
@@ -914,7 +898,7 @@ class CrystalObstacle(Obstacle):
         self.destruction_sound_asset = destruction_sound_obj
         self.target_ground_y = float('inf') 
 
-        super().__init__(screen_spawn_x, terrain_obj)
+        super().reset(screen_spawn_x, terrain_obj)
 
        
         self.obstacle_type = "crystal"
@@ -927,10 +911,12 @@ class CrystalObstacle(Obstacle):
         if loaded_img:
             self.image = loaded_img
         else: 
-            self.image = pygame.Surface((config.CRYSTAL_SPRITE_WIDTH, config.CRYSTAL_SPRITE_HEIGHT), pygame.SRCALPHA)
-            self.image.fill((180, 180, 255, 150)) 
+            self.image = asset_registry.get_built(
+                ("crystal_fallback", config.CRYSTAL_SPRITE_WIDTH, config.CRYSTAL_SPRITE_HEIGHT),
+                lambda: _build_fallback_image((config.CRYSTAL_SPRITE_WIDTH, config.CRYSTAL_SPRITE_HEIGHT),
+                                              (180, 180, 255, 150)))
 
-        self.rect = self.image.get_rect()
+        self._fit_rect()
 
        
         effective_spawn_x_for_ceiling_query = self.world_x + self.rect.width / 2.0
@@ -979,7 +965,7 @@ class CrystalObstacle(Obstacle):
                 
                 if effects_creation_group and self.rect:
                     effects_creation_group.add(
-                        DebrisEffect(self.rect.centerx, self.rect.bottom, self.debris_material, intensity=1.8) 
+                        pool.acquire(DebrisEffect, self.rect.centerx, self.rect.bottom, self.debris_material, intensity=1.8) 
                     )
         
         
@@ -0,0 +1,173 @@
+# particles.py
+import numpy as np
+
+BASE_FIELDS = ('x', 'y', 'vx', 'vy', 'life', 'max_life', 'size', 'start_size',
+               'alpha', 'start_alpha', 'gravity', 'r', 'g', 'b', 'end_r', 'end_g', 'end_b')
+
+SIZE_CONSTANT = "constant"
+SIZE_SQRT_LIFE = "sqrt_life"
+SIZE_HALF_LIFE = "half_life"
+
+
+class ParticleEmitter:
+    def __init__(self, capacity, extra_fields=(), drop_oldest=False, **defaults):
+        self.capacity = int(capacity)
+        self.drop_oldest = drop_oldest
+        self.count = 0
+        self.field_names = BASE_FIELDS + tuple(f for f in extra_fields if f not in BASE_FIELDS)
+        self.arrays = {name: np.zeros(self.capacity, dtype=np.float32) for name in self.field_names}
+        self.defaults = {'life': np.inf, 'max_life': np.inf, 'size': 1.0, 'alpha': 255.0,
+                         'r': 255.0, 'g': 255.0, 'b': 255.0}
+        self.defaults.update(defaults)
+
+    def __len__(self):
+        return self.count
+
+    def __bool__(self):
+        return self.count > 0
+
+    def __getitem__(self, name):
+        return self.arrays[name][:self.count]
+
+    def clear(self):
+        self.count = 0
+
+    def spawn(self, n, color=None, end_color=None, **values):
+        n = int(n)
+        if n <= 0:
+            return 0
+        if n > self.capacity:
+            n = self.capacity
+        free = self.capacity - self.count
+        if n > free:
+            if self.drop_oldest:
+                self._drop_front(n - free)
+            else:
+                n = free
+                if n <= 0:
+                    return 0
+
+        if color is not None:
+            values.setdefault('r', color[0]); values.setdefault('g', color[1]); values.setdefault('b', color[2])
+        if end_color is not None:
+            values.setdefault('end_r', end_color[0]); values.setdefault('end_g', end_color[1])
+            values.setdefault('end_b', end_color[2])
+        if 'max_life' not in values and 'life' in values:
+            values['max_life'] = values['life']
+        if 'start_size' not in values and 'size' in values:
+            values['start_size'] = values['size']
+        if 'start_alpha' not in values and 'alpha' in values:
+            values['start_alpha'] = values['alpha']
+        for name, end_name in (('r', 'end_r'), ('g', 'end_g'), ('b', 'end_b')):
+            if end_name not in values and end_name not in self.defaults:
+                values[end_name] = values.get(name, self.defaults.get(name, 0.0))
+
+        start, stop = self.count, self.count + n
+        for name in self.field_names:
+            if name in values:
+                value = values[name]
+                if isinstance(value, np.ndarray) and value.ndim and len(value) > n:
+                    value = value[:n]
+            elif name in self.defaults:
+                value = self.defaults[name]
+            elif name == 'start_size':
+                value = self.arrays['size'][start:stop]
+            elif name == 'start_alpha':
+                value = self.arrays['alpha'][start:stop]
+            elif name == 'max_life':
+                value = self.arrays['life'][start:stop]
+            else:
+                value = 0.0
+            self.arrays[name][start:stop] = value
+        self.count = stop
+        return n
+
+    def _drop_front(self, k):
+        k = min(k, self.count)
+        if k <= 0:
+            return
+        for arr in self.arrays.values():
+            arr[:self.count - k] = arr[k:self.count]
+        self.count -= k
+
+    def life_ratio(self):
+        life = self['life']
+        max_life = self['max_life']
+        ratio = np.zeros(self.count, dtype=np.float32)
+        np.divide(life, max_life, out=ratio, where=(max_life > 0) & np.isfinite(max_life))
+        return np.clip(ratio, 0.0, 1.0, out=ratio)
+
+    def integrate(self, step=1.0, scroll_dx=0.0, gravity_step=None, drag_x=1.0, drag_y=1.0,
+                  gravity_before_move=False, move_x=True):
+        if self.count == 0:
+            return
+        vx, vy = self['vx'], self['vy']
+        if drag_x != 1.0: vx *= drag_x
+        if drag_y != 1.0: vy *= drag_y
+        g_step = step if gravity_step is None else gravity_step
+        if gravity_before_move:
+            vy += self['gravity'] * g_step
+        if move_x:
+            self['x'][:] += vx * step
+        self['y'][:] += vy * step
+        if not gravity_before_move:
+            vy += self['gravity'] * g_step
+        if scroll_dx:
+            self['x'][:] -= scroll_dx
+
+    def age(self, amount):
+        if self.count:
+            self['life'][:] -= amount
+
+    def decay_alpha(self, amount):
+        if self.count:
+            self['alpha'][:] -= amount
+
+    def fade_by_life(self, power=1.0, ratio=None):
+        if self.count == 0:
+            return
+        if ratio is None: ratio = self.life_ratio()
+        alive = self['life'] > 0
+        alpha = self['alpha']
+        alpha[alive] = (self['start_alpha'] * ratio ** power)[alive]
+
+    def size_by_life(self, mode, ratio=None):
+        if self.count == 0 or mode == SIZE_CONSTANT:
+            return
+        if ratio is None: ratio = self.life_ratio()
+        if mode == SIZE_SQRT_LIFE:
+            self['size'][:] = self['start_size'] * np.sqrt(ratio)
+        elif mode == SIZE_HALF_LIFE:
+            self['size'][:] = self['start_size'] * (0.5 + 0.5 * ratio)
+
+    def compact(self, keep_mask):
+        if self.count == 0:
+            return
+        keep = np.flatnonzero(keep_mask)
+        kept = len(keep)
+        if kept == self.count:
+            return
+        for arr in self.arrays.values():
+            arr[:kept] = arr[:self.count][keep]
+        self.count = kept
+
+    def cull(self, min_alpha=0.0, min_size=None, require_life=False, x_range=None, size_margin=0.0):
+        if self.count == 0:
+            return
+        keep = self['alpha'] > min_alpha
+        if min_size is not None:
+            keep &= self['size'] >= min_size
+        if require_life:
+            keep &= self['life'] > 0
+        if x_range is not None:
+            x = self['x']
+            margin = self['size'] * size_margin
+            keep &= (x > x_range[0] - margin) & (x < x_range[1] + margin)
+        self.compact(keep)
+
+    def colors(self, ratio=None):
+        start = np.stack((self['r'], self['g'], self['b']), axis=1)
+        if ratio is not None:
+            end = np.stack((self['end_r'], self['end_g'], self['end_b']), axis=1)
+            start = start * ratio[:, None] + end * (1.0 - ratio[:, None])
+        return np.clip(start, 0, 255).astype(np.int32)
@@ -6,6 +6,10 @@ import config as cfg
 from config import (PLAYER_SCREEN_X, MAX_BULLETS, GRAVITY,
                     PLAYER_ANIMATION_SPEED, JUMP_VEL, MAX_JUMPS, SLOWDOWN_DURATION)
 import game_state as gs
+import numpy as np
+from particles import ParticleEmitter
+import stamp_cache
+import rotation_cache
 
 PLAYER_SHOOTING_ANIM_SPEED = 0.07
 NUM_FRAMES_FOR_HIT_ANIM_SPEED_CALC = 3
@@ -56,6 +60,7 @@ class Rider(pygame.sprite.Sprite):
         self.smoothed_ground_rotation_angle = 0.0
         self.flip_rotation_speed = 360
         self.original_image = None
+        self.image_angle = 0.0
 
         self.is_landing_assisting = False
         self.landing_assist_threshold_distance = cfg.PLAYER_TARGET_HEIGHT * 1.25
@@ -80,22 +85,23 @@ class Rider(pygame.sprite.Sprite):
                 self.current_frames_set.append(self.original_image)
             self.current_frame_index = 0
 
+        rotation_cache.prewarm(self.idle_frames, -cfg.ROTATION_CACHE_PREWARM_TILT, cfg.ROTATION_CACHE_PREWARM_TILT)
         self.image = self.original_image
         self.rect = self.image.get_rect(centerx=self.x)
         self.y_world = float(cfg.GROUND_Y)
         self.rect.midbottom = (self.x, self.y_world)
 
-        self.trail_points = []
         self.max_trail_points = 90
+        self.trail_points = ParticleEmitter(self.max_trail_points, drop_oldest=True)
         self.trail_distance_accumulated = 0.0
         self.trail_spawn_distance_threshold = 3.0
         self.trail_base_alpha = 250
         self.trail_alpha_decay_rate = 0.7
         self.trail_radius = 5
 
-        self.splash_particles = []
         self.max_splash_particles = 250
         self.splash_particle_gravity = 0.15
+        self.splash_particles = ParticleEmitter(self.max_splash_particles, gravity=self.splash_particle_gravity)
         self.splash_particle_base_alpha = 200
         self.splash_particle_alpha_decay = 2.8
         self.continuous_splash_size_range = (2, 4)
@@ -112,6 +118,7 @@ class Rider(pygame.sprite.Sprite):
             elif len(self.current_frames_set) == 0:
                 self.current_frames_set.append(self.original_image)
             self.current_frame_index = 0
+            safe_idx = 0
         else:
             safe_idx = self.current_frame_index % len(self.current_frames_set)
             self.original_image = self.current_frames_set[safe_idx]
@@ -125,13 +132,13 @@ class Rider(pygame.sprite.Sprite):
             physics_active_for_rotation = False
 
         if self.on_ground and physics_active_for_rotation:
-            applied_angle = self.smoothed_ground_rotation_angle * DEBUG_TILT_AMPLIFIER
-            self.image = pygame.transform.rotate(self.original_image, applied_angle)
+            self.image, applied_angle = rotation_cache.get_rotated(
+                self.current_frames_set, safe_idx, self.smoothed_ground_rotation_angle * DEBUG_TILT_AMPLIFIER)
         elif self.is_flipping and not self.on_ground:
-            applied_angle = self.flip_angle
-            self.image = pygame.transform.rotate(self.original_image, applied_angle)
+            self.image, applied_angle = rotation_cache.get_rotated(self.current_frames_set, safe_idx, self.flip_angle)
         else:
             self.image = self.original_image
+        self.image_angle = applied_angle
 
         new_rect = self.image.get_rect()
         new_rect.centerx = self.x
@@ -143,23 +150,21 @@ class Rider(pygame.sprite.Sprite):
         if not self.rect: return
         spawn_x_base = self.rect.midbottom[0] + location_offset_x
         spawn_y_world_base = self.y_world
-        particle_base_color_snow = cfg.PLAYER_TRAIL_COLOR_SNOW
-        for _ in range(num_particles):
-            if len(self.splash_particles) >= self.max_splash_particles: break
-            current_particle_color = particle_base_color_snow
-            angle = random.uniform(math.pi * 0.8, math.pi * 1.7)
-            if upward_bias < -0.5: angle = random.uniform(math.pi * 0.9, math.pi * 2.1)
-            speed = random.uniform(1.5, 3.0) * intensity_factor
-            initial_vx = math.cos(angle) * speed
-            initial_vy = math.sin(angle) * speed + upward_bias
-            self.splash_particles.append({
-                'screen_x': spawn_x_base + random.uniform(-self.rect.width / 3, self.rect.width / 3),
-                'world_y': spawn_y_world_base + random.uniform(-7, 7),
-                'vx': initial_vx, 'vy': initial_vy,
-                'alpha': self.splash_particle_base_alpha * random.uniform(0.8, 1.1),
-                'size': random.randint(size_range[0], size_range[1]),
-                'color': current_particle_color
-            })
+        n = min(num_particles, self.max_splash_particles - len(self.splash_particles))
+        if n <= 0: return
+        if upward_bias < -0.5:
+            angle = np.random.uniform(math.pi * 0.9, math.pi * 2.1, n)
+        else:
+            angle = np.random.uniform(math.pi * 0.8, math.pi * 1.7, n)
+        speed = np.random.uniform(1.5, 3.0, n) * intensity_factor
+        self.splash_particles.spawn(
+            n,
+            x=spawn_x_base + np.random.uniform(-self.rect.width / 3, self.rect.width / 3, n),
+            y=spawn_y_world_base + np.random.uniform(-7, 7, n),
+            vx=np.cos(angle) * speed, vy=np.sin(angle) * speed + upward_bias,
+            alpha=self.splash_particle_base_alpha * np.random.uniform(0.8, 1.1, n),
+            size=np.random.randint(size_range[0], size_range[1] + 1, n),
+            color=cfg.PLAYER_TRAIL_COLOR_SNOW)
 
     def perform_jump(self):
         if self.jump_count < MAX_JUMPS and not self.is_dying_animating:
@@ -249,9 +254,10 @@ class Rider(pygame.sprite.Sprite):
             apply_physics_this_frame = False
 
         if apply_physics_this_frame:
+            frame_steps = time_delta_seconds * cfg.FPS
             current_gravity = GRAVITY
-            self.vy += current_gravity
-            self.y_world += self.vy
+            self.vy += current_gravity * frame_steps
+            self.y_world += self.vy * frame_steps
 
             if gs.is_level_2_simple_mode and self.rect and terrain_obj:
                 ceiling_y_world = terrain_obj.ceiling_height_at(self.x)
@@ -533,13 +539,9 @@ class Rider(pygame.sprite.Sprite):
 
         self._update_image_and_rect()
 
-        active_trail_points = []
-        for point in self.trail_points:
-            point['screen_x'] -= world_scroll_dx
-            point['alpha'] -= self.trail_alpha_decay_rate
-            if point['screen_x'] > -self.trail_radius * 2 and point['alpha'] > 0:
-                active_trail_points.append(point)
-        self.trail_points = active_trail_points
+        self.trail_points.integrate(0.0, scroll_dx=world_scroll_dx)
+        self.trail_points.decay_alpha(self.trail_alpha_decay_rate)
+        self.trail_points.cull(min_alpha=0, x_range=(-self.trail_radius * 2, float('inf')))
 
         if not self.is_dying_animating and self.on_ground and world_scroll_dx > 0 and game_state_str == gs.PLAYING:
             self.trail_distance_accumulated += world_scroll_dx
@@ -548,39 +550,28 @@ class Rider(pygame.sprite.Sprite):
                 if self.rect:
                     trail_spawn_x = self.rect.midbottom[0]
                     trail_spawn_y_world = self.y_world
-                    trail_particle_color = cfg.PLAYER_TRAIL_COLOR_SNOW
-                    self.trail_points.append({
-                        'screen_x': trail_spawn_x, 'world_y': trail_spawn_y_world,
-                        'alpha': self.trail_base_alpha, 'color': trail_particle_color
-                    })
-                    if len(self.trail_points) > self.max_trail_points: self.trail_points.pop(0)
-                    num_trail_splashes = random.randint(1, 2)
-                    splash_particle_base_color_for_trail_snow = cfg.PLAYER_TRAIL_COLOR_SNOW
-                    for _ in range(num_trail_splashes):
-                        if len(self.splash_particles) < self.max_splash_particles:
-                            current_splash_color = splash_particle_base_color_for_trail_snow
-                            self.splash_particles.append({
-                                'screen_x': trail_spawn_x + random.uniform(-self.trail_radius / 2,
-                                                                           self.trail_radius / 2),
-                                'world_y': trail_spawn_y_world + random.uniform(-2, 2),
-                                'vx': random.uniform(-1.0, -0.3), 'vy': random.uniform(-1.8, -0.6),
-                                'alpha': self.splash_particle_base_alpha * random.uniform(0.6, 0.9),
-                                'size': random.randint(self.continuous_splash_size_range[0],
-                                                       self.continuous_splash_size_range[1]),
-                                'color': current_splash_color
-                            })
-        active_splash_particles = []
-        for p_splash in self.splash_particles:
-            p_splash['screen_x'] += p_splash['vx']
-            p_splash['screen_x'] -= world_scroll_dx
-            p_splash['vy'] += self.splash_particle_gravity
-            p_splash['world_y'] += p_splash['vy']
-            p_splash['alpha'] -= self.splash_particle_alpha_decay
-            if p_splash['alpha'] > 0 and \
-                    p_splash['screen_x'] > -p_splash['size'] * 5 and \
-                    p_splash['world_y'] < self.y_world + cfg.HEIGHT * 0.3:
-                active_splash_particles.append(p_splash)
-        self.splash_particles = active_splash_particles
+                    self.trail_points.spawn(1, x=trail_spawn_x, y=trail_spawn_y_world,
+                                            alpha=self.trail_base_alpha, color=cfg.PLAYER_TRAIL_COLOR_SNOW)
+                    num_trail_splashes = min(random.randint(1, 2),
+                                             self.max_splash_particles - len(self.splash_particles))
+                    if num_trail_splashes > 0:
+                        n = num_trail_splashes
+                        self.splash_particles.spawn(
+                            n,
+                            x=trail_spawn_x + np.random.uniform(-self.trail_radius / 2, self.trail_radius / 2, n),
+                            y=trail_spawn_y_world + np.random.uniform(-2, 2, n),
+                            vx=np.random.uniform(-1.0, -0.3, n), vy=np.random.uniform(-1.8, -0.6, n),
+                            alpha=self.splash_particle_base_alpha * np.random.uniform(0.6, 0.9, n),
+                            size=np.random.randint(self.continuous_splash_size_range[0],
+                                                   self.continuous_splash_size_range[1] + 1, n),
+                            color=cfg.PLAYER_TRAIL_COLOR_SNOW)
+        splash = self.splash_particles
+        splash.integrate(1.0, scroll_dx=world_scroll_dx, gravity_before_move=True)
+        splash.decay_alpha(self.splash_particle_alpha_decay)
+        if splash:
+            splash.compact((splash['alpha'] > 0) &
+                           (splash['x'] > -splash['size'] * 5) &
+                           (splash['y'] < self.y_world + cfg.HEIGHT * 0.3))
 
         self.was_on_ground = self.on_ground
 
@@ -593,29 +584,23 @@ class Rider(pygame.sprite.Sprite):
 
     def draw_trails(self, surface, camera_y_offset):
         if not self.is_active or not self.rect or self.is_hidden: return
-        for point in self.trail_points:
-            current_alpha = max(0, min(255, int(point['alpha'])))
+        if not self.trail_points: return
+        trail = self.trail_points
+        for px, py, alpha, point_color in zip(trail['x'].tolist(), trail['y'].tolist(), trail['alpha'].tolist(),
+                                              trail.colors().tolist()):
+            current_alpha = max(0, min(255, int(alpha)))
             if current_alpha > 0:
-                trail_draw_x, trail_draw_y = point['screen_x'], point['world_y'] - camera_y_offset
-                point_color = point.get('color', cfg.PLAYER_TRAIL_COLOR_SNOW)
-                trail_mark_surface = pygame.Surface((self.trail_radius * 2, self.trail_radius * 2), pygame.SRCALPHA)
-                trail_mark_surface.fill((0, 0, 0, 0))
-                pygame.draw.circle(trail_mark_surface, (point_color[0], point_color[1], point_color[2], current_alpha),
-                                   (self.trail_radius, self.trail_radius), self.trail_radius)
-                surface.blit(trail_mark_surface,
-                             (int(trail_draw_x - self.trail_radius), int(trail_draw_y - self.trail_radius)))
+                stamp_cache.blit_circle(surface, px, py - camera_y_offset, self.trail_radius,
+                                        (point_color[0], point_color[1], point_color[2], current_alpha))
 
     def draw_splash_particles(self, surface, camera_y_offset):
         if not self.is_active or not self.rect or self.is_hidden: return
-        for p_splash in self.splash_particles:
-            current_alpha = max(0, min(255, int(p_splash['alpha'])))
+        if not self.splash_particles: return
+        splash = self.splash_particles
+        for px, py, alpha, size, particle_color in zip(splash['x'].tolist(), splash['y'].tolist(),
+                                                       splash['alpha'].tolist(), splash['size'].tolist(),
+                                                       splash.colors().tolist()):
+            current_alpha = max(0, min(255, int(alpha)))
             if current_alpha > 0:
-                splash_draw_x, splash_draw_y = p_splash['screen_x'], p_splash['world_y'] - camera_y_offset
-                size = p_splash['size']
-                particle_color = p_splash.get('color', cfg.PLAYER_TRAIL_COLOR_SNOW)
-                splash_mark_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                splash_mark_surface.fill((0, 0, 0, 0))
-                pygame.draw.circle(splash_mark_surface,
-                                   (particle_color[0], particle_color[1], particle_color[2], current_alpha),
-                                   (size, size), size)
-                surface.blit(splash_mark_surface, (int(splash_draw_x - size), int(splash_draw_y - size)))
\ No newline at end of file
+                stamp_cache.blit_circle(surface, px, py - camera_y_offset, int(size),
+                                        (particle_color[0], particle_color[1], particle_color[2], current_alpha))
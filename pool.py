@@ -0,0 +1,88 @@
+# pool.py
+import config
+
+_pools = {}
+
+
+class PooledSprite:
+    _pool = None
+    _pool_free = False
+    pool_generation = 0
+
+    def reset(self, *args, **kwargs):
+        raise NotImplementedError(f"{type(self).__name__} must implement reset() to be pooled")
+
+    def kill(self):
+        super().kill()
+        if self._pool is not None and not self._pool_free:
+            self._pool.release(self)
+
+
+class ObjectPool:
+    def __init__(self, cls, max_free=None):
+        if cls.reset is PooledSprite.reset:
+            raise TypeError(f"{cls.__name__} must implement reset() to be pooled")
+        self.cls = cls
+        self.max_free = config.POOL_MAX_FREE_PER_CLASS if max_free is None else max_free
+        self.free = []
+        self.allocated = 0
+        self.in_use = 0
+        self.high_water = 0
+        self.reuses = 0
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            obj = self.free.pop()
+            obj._pool_free = False
+            obj.reset(*args, **kwargs)
+            self.reuses += 1
+        else:
+            obj = self.cls(*args, **kwargs)
+            obj._pool = self
+            self.allocated += 1
+        obj.pool_generation += 1
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return obj
+
+    def release(self, obj):
+        obj._pool_free = True
+        self.in_use = max(0, self.in_use - 1)
+        if len(self.free) < self.max_free:
+            self.free.append(obj)
+
+    def stats(self):
+        return {"allocated": self.allocated, "in_use": self.in_use, "high_water": self.high_water,
+                "free": len(self.free), "reuses": self.reuses}
+
+
+def get_pool(cls):
+    pool = _pools.get(cls)
+    if pool is None:
+        pool = _pools[cls] = ObjectPool(cls)
+    return pool
+
+
+def acquire(cls, *args, **kwargs):
+    return get_pool(cls).acquire(*args, **kwargs)
+
+
+def release_group(group):
+    for sprite in group.sprites():
+        sprite.kill()
+    group.empty()
+
+
+def is_same_instance(sprite, generation):
+    return sprite is not None and sprite.alive() and getattr(sprite, "pool_generation", 0) == generation
+
+
+def stats():
+    return {cls.__name__: pool.stats() for cls, pool in _pools.items()}
+
+
+def report():
+    for name, s in stats().items():
+        print(f"Pool {name}: {s['allocated']} allocated, {s['in_use']} in use, high-water {s['high_water']}, "
+              f"{s['reuses']} reuses")
@@ -1,8 +1,7 @@
 # portal.py
 import pygame
-import os
-import sys
 from config import WIDTH  
+import asset_registry
 
 PORTAL_TARGET_WIDTH = 100
 PORTAL_TARGET_HEIGHT = 150
@@ -19,28 +18,8 @@ class Portal(pygame.sprite.Sprite):
         self.current_frame_index = 0
         self.animation_timer = 0.0
 
-        
-        try:
-        
-            main_script_dir = os.path.dirname(
-                os.path.abspath(sys.argv[0] if hasattr(sys, 'argv') and sys.argv else __file__))
-            assets_dir = os.path.join(main_script_dir, "assets")
-            if not os.path.isdir(assets_dir):
-                parent_dir = os.path.dirname(main_script_dir)
-                assets_dir = os.path.join(parent_dir, "assets")
-
-            for i in range(1, 6): 
-                filename = f"portal{i}.png"
-                image_path = os.path.join(assets_dir, filename)
-                if os.path.exists(image_path):
-                    loaded_image = pygame.image.load(image_path).convert_alpha()
-                    scaled_image = pygame.transform.smoothscale(loaded_image,
-                                                                (PORTAL_TARGET_WIDTH, PORTAL_TARGET_HEIGHT))
-                    self.frames.append(scaled_image)
-                else:
-                    print(f"Warning: Portal image {filename} not found at {image_path}")
-        except Exception as e:
-            print(f"Error loading portal animation frames: {e}")
+        self.frames = asset_registry.get_frames("portal{}.png", range(1, 6),
+                                                (PORTAL_TARGET_WIDTH, PORTAL_TARGET_HEIGHT))
 
         if not self.frames:  
             print("Error: No portal animation frames loaded. Using fallback.")
@@ -0,0 +1,152 @@
+# profiler.py
+import os
+import csv
+import time
+from collections import deque
+import pygame
+import config
+import quality
+
+STAGE_COLORS = [
+    (230, 90, 90), (90, 170, 230), (120, 210, 110), (240, 190, 70), (180, 110, 220), (80, 210, 200),
+    (240, 130, 200), (170, 170, 90), (120, 130, 240), (230, 150, 100), (150, 220, 170), (200, 200, 200),
+]
+
+enabled = False
+_frame_index = 0
+_last_mark = 0.0
+_current = {}
+_stage_order = []
+_stage_colors = {}
+_history = deque(maxlen=config.PROFILER_HISTORY_FRAMES)
+_csv_file = None
+_csv_writer = None
+_csv_path = None
+_font = None
+
+
+def toggle(base_dir):
+    if enabled:
+        stop()
+    else:
+        start(base_dir)
+    return enabled
+
+
+def start(base_dir):
+    global enabled, _csv_file, _csv_writer, _csv_path, _last_mark
+    profile_dir = os.path.join(base_dir, config.PROFILER_CSV_DIR_NAME)
+    try:
+        os.makedirs(profile_dir, exist_ok=True)
+        _csv_path = os.path.join(profile_dir, time.strftime("frame_profile_%Y%m%d_%H%M%S.csv"))
+        _csv_file = open(_csv_path, "w", newline="", encoding="utf-8")
+        _csv_writer = csv.writer(_csv_file)
+        _csv_writer.writerow(["frame", "state", "stage", "ms"])
+        print(f"Profiler: enabled, streaming stage timings to {_csv_path}")
+    except OSError as e:
+        print(f"Profiler: could not open CSV output ({e}). Overlay only.")
+        _csv_file = _csv_writer = None
+    _history.clear()
+    _current.clear()
+    _last_mark = time.perf_counter()
+    enabled = True
+
+
+def stop():
+    global enabled, _csv_file, _csv_writer
+    enabled = False
+    if _csv_file:
+        try:
+            _csv_file.close()
+            print(f"Profiler: disabled, {_frame_index} frames recorded in {_csv_path}")
+        except OSError as e:
+            print(f"Profiler: error closing CSV output: {e}")
+    _csv_file = _csv_writer = None
+    _current.clear()
+
+
+def begin_frame():
+    global _last_mark
+    if not enabled:
+        return
+    _current.clear()
+    _last_mark = time.perf_counter()
+
+
+def mark(stage):
+    global _last_mark
+    if not enabled:
+        return
+    now = time.perf_counter()
+    _current[stage] = _current.get(stage, 0.0) + (now - _last_mark) * 1000.0
+    _last_mark = now
+
+
+def end_frame(state):
+    global _frame_index
+    if not enabled:
+        return
+    for stage in _current:
+        if stage not in _stage_colors:
+            _stage_colors[stage] = STAGE_COLORS[len(_stage_order) % len(STAGE_COLORS)]
+            _stage_order.append(stage)
+    _history.append(dict(_current))
+    if _csv_writer:
+        for stage, ms in _current.items():
+            _csv_writer.writerow([_frame_index, state, stage, f"{ms:.3f}"])
+    _frame_index += 1
+
+
+def draw_overlay(surface):
+    global _font
+    if not enabled or not _history:
+        return
+    if _font is None:
+        _font = pygame.font.Font(None, 18)
+
+    history_len = config.PROFILER_HISTORY_FRAMES
+    graph_h = config.PROFILER_GRAPH_HEIGHT
+    bar_w = config.PROFILER_BAR_WIDTH
+    graph_w = history_len * bar_w
+    px_per_ms = graph_h / config.PROFILER_GRAPH_MAX_MS
+    left = surface.get_width() - graph_w - 10
+    top = surface.get_height() - graph_h - 10
+
+    panel = pygame.Surface((graph_w, graph_h), pygame.SRCALPHA)
+    panel.fill((0, 0, 0, 150))
+    budget_y = graph_h - int(1000.0 / config.FPS * px_per_ms)
+    if budget_y > 0:
+        pygame.draw.line(panel, (255, 255, 255, 120), (0, budget_y), (graph_w, budget_y))
+
+    x = graph_w - len(_history) * bar_w
+    for frame in _history:
+        y = graph_h
+        for stage in _stage_order:
+            ms = frame.get(stage)
+            if not ms:
+                continue
+            h = ms * px_per_ms
+            if h >= 1:
+                panel.fill(_stage_colors[stage], (x, int(y - h), bar_w, int(h)))
+            y -= h
+            if y <= 0:
+                break
+        x += bar_w
+    surface.blit(panel, (left, top))
+
+    recent = list(_history)[-config.FPS:]
+    averages = [(stage, sum(frame.get(stage, 0.0) for frame in recent) / len(recent)) for stage in _stage_order]
+    total = sum(ms for _, ms in averages)
+    line_h = _font.get_linesize()
+    legend_top = top - (len(averages) + 1) * line_h - 4
+    legend_bg = pygame.Surface((graph_w, (len(averages) + 1) * line_h + 4), pygame.SRCALPHA)
+    legend_bg.fill((0, 0, 0, 150))
+    surface.blit(legend_bg, (left, legend_top))
+    header = _font.render(f"frame {total:5.2f} ms (avg of {len(recent)})  quality: {quality.tier_name()}", True,
+                          (255, 255, 255))
+    surface.blit(header, (left + 4, legend_top + 2))
+    for i, (stage, ms) in enumerate(averages):
+        y = legend_top + 2 + (i + 1) * line_h
+        pygame.draw.rect(surface, _stage_colors[stage], (left + 4, y + 3, 10, 10))
+        label = _font.render(f"{stage}: {ms:5.2f} ms", True, (230, 230, 230))
+        surface.blit(label, (left + 20, y))
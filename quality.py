@@ -0,0 +1,79 @@
+# quality.py
+from collections import deque
+import config
+
+tier_index = 0
+pinned = False
+_work_ms = deque(maxlen=config.QUALITY_WINDOW_FRAMES)
+_last_change_ms = 0
+_changes = 0
+
+
+def tier():
+    return config.QUALITY_TIERS[tier_index]
+
+
+def tier_name():
+    return tier()["name"]
+
+
+def budget(name, base_count):
+    return max(0, int(round(base_count * tier().get(name, 1.0))))
+
+
+def flag(name):
+    return bool(tier().get(name, True))
+
+
+def pin(index_or_name):
+    global pinned
+    _set_tier(_tier_lookup(index_or_name), 0, reason="pinned")
+    pinned = True
+
+
+def unpin():
+    global pinned
+    pinned = False
+    _work_ms.clear()
+
+
+def _tier_lookup(index_or_name):
+    if isinstance(index_or_name, str):
+        for i, t in enumerate(config.QUALITY_TIERS):
+            if t["name"] == index_or_name:
+                return i
+        raise ValueError(f"Unknown quality tier '{index_or_name}'")
+    return max(0, min(len(config.QUALITY_TIERS) - 1, int(index_or_name)))
+
+
+def _set_tier(new_index, now_ms, reason=""):
+    global tier_index, _last_change_ms, _changes
+    if new_index == tier_index:
+        return
+    old_name = tier_name()
+    tier_index = new_index
+    _last_change_ms = now_ms
+    _changes += 1
+    _work_ms.clear()
+    print(f"Quality governor: {old_name} -> {tier_name()} ({reason})")
+
+
+def observe(frame_work_ms, now_ms):
+    if pinned or not config.QUALITY_GOVERNOR_ENABLED:
+        return
+    _work_ms.append(frame_work_ms)
+    if len(_work_ms) < _work_ms.maxlen:
+        return
+    window = sorted(_work_ms)
+    slow_ms = window[int(len(window) * config.QUALITY_SLOW_FRAME_PERCENTILE)]
+    since_change = now_ms - _last_change_ms
+    if slow_ms > config.QUALITY_DOWNGRADE_MS and tier_index < len(config.QUALITY_TIERS) - 1 and \
+            since_change >= config.QUALITY_DOWNGRADE_COOLDOWN_MS:
+        _set_tier(tier_index + 1, now_ms, reason=f"p{int(config.QUALITY_SLOW_FRAME_PERCENTILE * 100)} {slow_ms:.1f} ms")
+    elif slow_ms < config.QUALITY_UPGRADE_MS and tier_index > 0 and \
+            since_change >= config.QUALITY_UPGRADE_COOLDOWN_MS:
+        _set_tier(tier_index - 1, now_ms, reason=f"p{int(config.QUALITY_SLOW_FRAME_PERCENTILE * 100)} {slow_ms:.1f} ms")
+
+
+def stats():
+    return {"tier": tier_name(), "tier_index": tier_index, "changes": _changes, "pinned": pinned}
@@ -0,0 +1,168 @@
+# rope_lights.py
+import pygame
+import math
+import numpy as np
+import config
+import quality
+from config import WIDTH, HEIGHT
+
+
+class RopeLightRenderer:
+    def __init__(self):
+        self.sprites = None
+        self.core_sprites = None
+        self.light_radius = config.L2_ROPE_LIGHT_RADIUS * 2.2
+        self.min_brightness = config.L2_ROPE_LIGHT_PULSE_MIN_BRIGHTNESS_FACTOR * 0.4
+        self.max_brightness = 1.0 + config.L2_ROPE_LIGHT_FLICKER_MAGNITUDE * 1.2
+        self.base_glow_alpha = config.L2_ROPE_LIGHT_GLOW_BASE_ALPHA * 1.4
+        self.min_glow_alpha = 25
+        self.max_glow_alpha = max(25, int(self.base_glow_alpha * 1.15))
+        self.glow_radius = int(self.light_radius * config.L2_ROPE_LIGHT_GLOW_RADIUS_FACTOR * 1.2) \
+            if config.L2_ROPE_LIGHT_GLOW_ENABLED else 0
+        self.sprite_half_size = max(self.glow_radius, int(self.light_radius), 1)
+        self.core_half_size = max(int(self.light_radius), 1)
+        self.brightness_levels = max(2, config.L2_ROPE_LIGHT_BRIGHTNESS_LEVELS)
+        self.glow_levels = max(2, config.L2_ROPE_LIGHT_GLOW_LEVELS) if config.L2_ROPE_LIGHT_GLOW_ENABLED else 1
+
+    def _level_value(self, index, levels, low, high):
+        return low + (high - low) * index / (levels - 1) if levels > 1 else high
+
+    def _build_sprite(self, brightness, glow_alpha, with_glow=True):
+        half = self.sprite_half_size if with_glow else self.core_half_size
+        sprite = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+        sprite.fill((0, 0, 0, 0))
+        if with_glow and self.glow_radius > 0:
+            glow_base_tint_r, glow_base_tint_g, glow_base_tint_b = config.L2_ROPE_LIGHT_BASE_COLOR
+            glow_outer_tint_r_factor, glow_outer_tint_g_factor, glow_outer_tint_b_factor = 1.1, 0.95, 0.8
+            for k_glow in range(3, 0, -1):
+                layer_radius = int(self.glow_radius * (k_glow / 3.0))
+                tint_interp = (3 - k_glow) / 2.0
+                eff_tint_r = int(glow_base_tint_r * (1.0 - tint_interp * (1.0 - glow_outer_tint_r_factor)))
+                eff_tint_g = int(glow_base_tint_g * (1.0 - tint_interp * (1.0 - glow_outer_tint_g_factor)))
+                eff_tint_b = int(glow_base_tint_b * (1.0 - tint_interp * (1.0 - glow_outer_tint_b_factor)))
+                layer_color = (min(255, max(0, eff_tint_r) + 15), min(255, max(0, eff_tint_g) + 15),
+                               min(255, max(0, eff_tint_b) + 10))
+                layer_alpha = max(0, min(255, int(glow_alpha * (0.8 * ((4 - k_glow) / 3.0)) ** 1.4)))
+                if layer_radius > 0 and layer_alpha > 5:
+                    layer_surf = pygame.Surface((layer_radius * 2, layer_radius * 2), pygame.SRCALPHA)
+                    pygame.draw.circle(layer_surf, (*layer_color, layer_alpha), (layer_radius, layer_radius),
+                                       layer_radius)
+                    sprite.blit(layer_surf, (half - layer_radius, half - layer_radius))
+
+        r_base, g_base, b_base = config.L2_ROPE_LIGHT_BASE_COLOR
+        main_color = (max(0, min(255, int(r_base * brightness * 1.15))),
+                      max(0, min(255, int(g_base * brightness * 1.15))),
+                      max(0, min(255, int(b_base * brightness * 1.15))))
+        pygame.draw.circle(sprite, main_color, (half, half), int(self.light_radius))
+        core_brightness_factor = brightness * 1.7 + 0.6
+        core_color = (min(255, int(r_base * core_brightness_factor + 120)),
+                      min(255, int(g_base * core_brightness_factor + 120)),
+                      min(255, int(b_base * core_brightness_factor + 100)))
+        pygame.draw.circle(sprite, core_color, (half, half), max(1, int(self.light_radius * 0.35)))
+        return sprite
+
+    def bake(self):
+        self.sprites = []
+        self.core_sprites = []
+        for b_idx in range(self.brightness_levels):
+            brightness = self._level_value(b_idx, self.brightness_levels, self.min_brightness, self.max_brightness)
+            self.core_sprites.append(self._build_sprite(brightness, 0, with_glow=False))
+            row = []
+            for g_idx in range(self.glow_levels):
+                glow_alpha = int(self._level_value(g_idx, self.glow_levels, self.min_glow_alpha, self.max_glow_alpha))
+                row.append(self._build_sprite(brightness, glow_alpha))
+            self.sprites.append(row)
+
+    def _light_positions(self, points):
+        pts = np.asarray(points, dtype=np.float64)
+        p1 = pts[:-1]
+        seg_d = pts[1:] - p1
+        seg_len = np.hypot(seg_d[:, 0], seg_d[:, 1])
+        spacing = max(1.0, float(config.L2_ROPE_LIGHT_SPACING))
+        epsilon = 0.01
+
+        last_k = np.floor((seg_len + epsilon) / spacing)
+        snap_k = np.maximum(1.0, np.floor((seg_len - 0.5 * spacing) / spacing) + 1.0)
+        snapped = snap_k <= last_k
+        counts = np.where(snapped, snap_k, last_k).astype(np.int64) + 1
+        counts[seg_len < spacing] = 1
+        counts[seg_len < 1] = 0
+        if counts.sum() == 0:
+            return None
+
+        seg = np.repeat(np.arange(len(counts)), counts)
+        k = np.arange(len(seg)) - np.repeat(np.cumsum(counts) - counts, counts)
+        dist = k * spacing
+        is_snap = (k > 0) & (k == counts[seg] - 1) & snapped[seg]
+        dist = np.where(is_snap, seg_len[seg], dist)
+        ux = seg_d[seg, 0] / seg_len[seg]
+        uy = seg_d[seg, 1] / seg_len[seg]
+        anchor_x = p1[seg, 0] + dist * ux
+        anchor_y = p1[seg, 1] + dist * uy
+        return anchor_x, anchor_y, seg * 10000 + k
+
+    def draw(self, surface, ceiling_points_on_screen, current_time_ms):
+        if len(ceiling_points_on_screen) < 2: return
+        positions = self._light_positions(ceiling_points_on_screen)
+        if positions is None: return
+        if self.sprites is None: self.bake()
+        anchor_x, anchor_y, light_ids = positions
+
+        time_for_pulse = current_time_ms * config.L2_ROPE_LIGHT_PULSE_SPEED_HZ * 2 * math.pi / 1000.0
+        time_for_flicker = current_time_ms * config.L2_ROPE_LIGHT_FLICKER_SPEED_HZ * 2 * math.pi / 1000.0
+        time_for_sway = current_time_ms * config.L2_ROPE_LIGHT_SWAY_SPEED_HZ * 2 * math.pi / 1000.0
+
+        light_x = anchor_x
+        if config.L2_ROPE_LIGHT_SWAY_ENABLED:
+            sway_phase = np.mod(light_ids * 19, config.L2_ROPE_LIGHT_SWAY_PHASE_OFFSET_MAX_RAD)
+            light_x = anchor_x + np.sin(time_for_sway + sway_phase) * config.L2_ROPE_LIGHT_SWAY_AMPLITUDE_X
+        light_y = anchor_y + config.L2_ROPE_LIGHT_Y_OFFSET
+
+        cull_margin = self.light_radius * 3
+        visible = (light_x > -cull_margin) & (light_x < WIDTH + cull_margin) & \
+                  (light_y > -cull_margin) & (light_y < HEIGHT + cull_margin)
+        if not visible.any(): return
+        anchor_x, anchor_y, light_ids = anchor_x[visible], anchor_y[visible], light_ids[visible]
+        light_x, light_y = light_x[visible], light_y[visible]
+
+        pulse_phase = np.mod(light_ids * 7, config.L2_ROPE_LIGHT_PULSE_PHASE_OFFSET_MAX_RAD)
+        pulse_val = (np.sin(time_for_pulse + pulse_phase) + 1) / 2.0
+        min_factor = config.L2_ROPE_LIGHT_PULSE_MIN_BRIGHTNESS_FACTOR
+        base_brightness = min_factor + pulse_val * (1.0 - min_factor)
+        flicker_phase = np.mod(light_ids * 13, config.L2_ROPE_LIGHT_FLICKER_PHASE_OFFSET_MAX_RAD)
+        flicker_val = (np.sin(time_for_flicker + flicker_phase) + 1) / 2.0
+        brightness = base_brightness + (flicker_val * 2.0 - 1.0) * config.L2_ROPE_LIGHT_FLICKER_MAGNITUDE
+        brightness = np.clip(brightness, self.min_brightness, self.max_brightness)
+        brightness_idx = np.rint((brightness - self.min_brightness) / (self.max_brightness - self.min_brightness) *
+                                 (self.brightness_levels - 1)).astype(np.int64)
+
+        if self.glow_levels > 1:
+            glow_flicker_val = (np.sin(time_for_flicker * 1.15 + flicker_phase + 0.7) + 1) / 2.0
+            glow_flicker_modulation = (glow_flicker_val * 2.0 - 1.0) * config.L2_ROPE_LIGHT_FLICKER_MAGNITUDE * 0.6
+            glow_pulse_factor = (np.sin(time_for_pulse + pulse_phase + math.pi / 2.2) + 1) / 2.0
+            glow_alpha = self.base_glow_alpha * (0.5 + 0.5 * glow_pulse_factor) * (1.0 + glow_flicker_modulation)
+            glow_alpha = np.clip(glow_alpha.astype(np.int64), self.min_glow_alpha, self.max_glow_alpha)
+            glow_range = max(1, self.max_glow_alpha - self.min_glow_alpha)
+            glow_idx = np.rint((glow_alpha - self.min_glow_alpha) / glow_range *
+                               (self.glow_levels - 1)).astype(np.int64)
+        else:
+            glow_idx = np.zeros(len(light_ids), dtype=np.int64)
+
+        draw_x = light_x.astype(np.int64)
+        draw_y = light_y.astype(np.int64)
+        if config.L2_ROPE_LIGHT_SWAY_ENABLED:
+            for ax, ay, lx, ly in zip(anchor_x.astype(np.int64).tolist(), anchor_y.astype(np.int64).tolist(),
+                                      draw_x.tolist(), draw_y.tolist()):
+                pygame.draw.line(surface, config.L2_ROPE_LIGHT_HANGING_LINE_COLOR, (ax, ay), (lx, ly), 1)
+
+        if not quality.flag("rope_glow"):
+            half = self.core_half_size
+            core_sprites = self.core_sprites
+            surface.blits([(core_sprites[b], (x - half, y - half)) for b, x, y in
+                           zip(brightness_idx.tolist(), draw_x.tolist(), draw_y.tolist())], doreturn=False)
+            return
+        half = self.sprite_half_size
+        sprites = self.sprites
+        surface.blits([(sprites[b][g], (x - half, y - half)) for b, g, x, y in
+                       zip(brightness_idx.tolist(), glow_idx.tolist(), draw_x.tolist(), draw_y.tolist())],
+                      doreturn=False)
@@ -0,0 +1,80 @@
+# rotation_cache.py
+import pygame
+from collections import OrderedDict
+import config
+
+_rotated = OrderedDict()
+_bytes = 0
+_hits = 0
+_misses = 0
+_evictions = 0
+
+
+def angle_bucket(angle):
+    step = config.ROTATION_CACHE_ANGLE_STEP
+    return int(round((angle % 360.0) / step)) % int(round(360.0 / step))
+
+
+def bucket_angle(bucket):
+    return bucket * config.ROTATION_CACHE_ANGLE_STEP
+
+
+def _surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def get_rotated(frames, frame_index, angle):
+    global _bytes, _hits, _misses, _evictions
+    source = frames[frame_index]
+    bucket = angle_bucket(angle)
+    if bucket == 0:
+        return source, 0.0
+    key = (source, bucket)
+    rotated = _rotated.get(key)
+    if rotated is not None:
+        _hits += 1
+        _rotated.move_to_end(key)
+        return rotated, bucket_angle(bucket)
+
+    _misses += 1
+    rotated = pygame.transform.rotate(source, bucket_angle(bucket))
+    _rotated[key] = rotated
+    _bytes += _surface_bytes(rotated)
+    while _bytes > config.ROTATION_CACHE_MAX_BYTES and len(_rotated) > 1:
+        _, evicted = _rotated.popitem(last=False)
+        _bytes -= _surface_bytes(evicted)
+        _evictions += 1
+    return rotated, bucket_angle(bucket)
+
+
+def prewarm(frames, min_angle, max_angle):
+    if not frames:
+        return
+    step = config.ROTATION_CACHE_ANGLE_STEP
+    angle = min_angle
+    while angle <= max_angle:
+        for frame_index in range(len(frames)):
+            get_rotated(frames, frame_index, angle)
+        angle += step
+
+
+def hit_rate():
+    lookups = _hits + _misses
+    return _hits / lookups if lookups else 0.0
+
+
+def stats():
+    return {"entries": len(_rotated), "bytes": _bytes, "hits": _hits, "misses": _misses,
+            "evictions": _evictions, "hit_rate": hit_rate()}
+
+
+def report():
+    s = stats()
+    print(f"Rotation cache: {s['entries']} entries ({s['bytes'] / (1024 * 1024):.1f} MB), {s['hits']} hits, "
+          f"{s['misses']} misses, {s['evictions']} evictions, hit rate {s['hit_rate'] * 100:.1f}%")
+
+
+def clear():
+    global _bytes, _hits, _misses, _evictions
+    _rotated.clear()
+    _bytes = _hits = _misses = _evictions = 0
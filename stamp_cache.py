@@ -0,0 +1,73 @@
+# stamp_cache.py
+import pygame
+from collections import OrderedDict
+import config
+
+_stamps = OrderedDict()
+_hits = 0
+_misses = 0
+_evictions = 0
+
+
+def _quantize(value, step):
+    value = max(0, min(255, int(value)))
+    if step <= 1:
+        return value
+    return min(255, (value + step // 2) // step * step)
+
+
+def get_circle(radius, color):
+    global _hits, _misses, _evictions
+    radius = int(radius)
+    if radius <= 0:
+        return None
+    alpha = color[3] if len(color) > 3 else 255
+    rgb_step = config.STAMP_CACHE_COLOR_STEP
+    key = (radius, _quantize(color[0], rgb_step), _quantize(color[1], rgb_step), _quantize(color[2], rgb_step),
+           _quantize(alpha, config.STAMP_CACHE_ALPHA_STEP))
+    stamp = _stamps.get(key)
+    if stamp is not None:
+        _hits += 1
+        _stamps.move_to_end(key)
+        return stamp
+
+    _misses += 1
+    if key[4] <= 0:
+        return None
+    stamp = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    stamp.fill((0, 0, 0, 0))
+    pygame.draw.circle(stamp, key[1:], (radius, radius), radius)
+    _stamps[key] = stamp
+    while len(_stamps) > config.STAMP_CACHE_MAX_ENTRIES:
+        _stamps.popitem(last=False)
+        _evictions += 1
+    return stamp
+
+
+def blit_circle(surface, center_x, center_y, radius, color):
+    stamp = get_circle(radius, color)
+    if stamp is not None:
+        radius = int(radius)
+        surface.blit(stamp, (int(center_x - radius), int(center_y - radius)))
+
+
+def hit_rate():
+    lookups = _hits + _misses
+    return _hits / lookups if lookups else 0.0
+
+
+def stats():
+    return {"entries": len(_stamps), "hits": _hits, "misses": _misses,
+            "evictions": _evictions, "hit_rate": hit_rate()}
+
+
+def report():
+    s = stats()
+    print(f"Stamp cache: {s['entries']} entries, {s['hits']} hits, {s['misses']} misses, "
+          f"{s['evictions']} evictions, hit rate {s['hit_rate'] * 100:.1f}%")
+
+
+def clear():
+    global _hits, _misses, _evictions
+    _stamps.clear()
+    _hits = _misses = _evictions = 0
@@ -8,6 +8,11 @@ from config import (WIDTH, HEIGHT, CHUNK, GROUND_Y, DOWNHILL_SLOPE_FACTOR,
                     FINAL_RAMP_HEIGHT_RISE, TREE_LINE_WORLD_Y_OFFSET)
 import game_state as gs
 import config 
+import numpy as np
+from particles import ParticleEmitter, SIZE_SQRT_LIFE, SIZE_HALF_LIFE
+import stamp_cache
+from rope_lights import RopeLightRenderer
+import quality
 
 LEVEL2_CEILING_Y = 60.0 
 DEFAULT_TERRAIN_COLOR = (235, 235, 240)
@@ -24,23 +29,116 @@ def lerp_color(color1, color2, t):
     return (r, g, b)
 
 
+class TerrainStripCache:
+    def __init__(self, layers, fill_above_color=None):
+        self.layers = layers
+        self.fill_above_color = fill_above_color
+        self.min_offset = min(layer[1] for layer in layers)
+        self.max_offset = max(layer[2] for layer in layers)
+        self.surface = None
+        self.start_chunk_index = None
+        self.y_origin = 0
+
+    def _rasterize_segments(self, edge_ys, first_segment):
+        for k in range(max(0, first_segment), len(edge_ys) - 1):
+            x0 = k * CHUNK
+            x1 = x0 + CHUNK
+            y0 = edge_ys[k] - self.y_origin
+            y1 = edge_ys[k + 1] - self.y_origin
+            if self.fill_above_color is not None:
+                pygame.draw.polygon(self.surface, self.fill_above_color,
+                                    [(x0, y0 + self.min_offset), (x1, y1 + self.min_offset), (x1, 0), (x0, 0)])
+            for color, top_offset, bottom_offset in self.layers:
+                pygame.draw.polygon(self.surface, color, [(x0, y0 + top_offset), (x1, y1 + top_offset),
+                                                          (x1, y1 + bottom_offset), (x0, y0 + bottom_offset)])
+
+    def _rebuild(self, edge_ys, lo, hi):
+        margin = config.L2_TERRAIN_STRIP_Y_MARGIN
+        size = (len(edge_ys) * CHUNK, int(hi - lo) + 2 * margin + 1)
+        if self.surface is None or self.surface.get_size() != size:
+            self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.surface.fill((0, 0, 0, 0))
+        self.y_origin = int(math.floor(lo)) - margin
+        self._rasterize_segments(edge_ys, 0)
+
+    def _scroll(self, edge_ys, shift, lo, hi):
+        width, height = self.surface.get_size()
+        dy = 0
+        if lo < self.y_origin or hi >= self.y_origin + height:
+            new_y_origin = int(math.floor(lo)) - config.L2_TERRAIN_STRIP_Y_MARGIN
+            dy = self.y_origin - new_y_origin
+            self.y_origin = new_y_origin
+        self.surface.scroll(-shift * CHUNK, dy)
+        if dy > 0:
+            top_color = self.fill_above_color if self.fill_above_color is not None else (0, 0, 0, 0)
+            self.surface.fill(top_color, pygame.Rect(0, 0, width, dy))
+        elif dy < 0:
+            self.surface.fill((0, 0, 0, 0), pygame.Rect(0, height + dy, width, -dy))
+        first_new_segment = len(edge_ys) - 1 - shift
+        self.surface.fill((0, 0, 0, 0), pygame.Rect(first_new_segment * CHUNK, 0, width, height))
+        self._rasterize_segments(edge_ys, first_new_segment)
+
+    def draw(self, surface, edge_ys, start_chunk_index, scroll_fractional_offset, camera_y_offset):
+        if len(edge_ys) < 2: return
+        if self.start_chunk_index != start_chunk_index or self.surface is None:
+            lo = min(edge_ys) + self.min_offset
+            hi = max(edge_ys) + self.max_offset
+            shift = start_chunk_index - self.start_chunk_index if self.start_chunk_index is not None else -1
+            if self.surface is None or not (0 < shift < len(edge_ys) - 1) or \
+                    hi - lo >= self.surface.get_height() - 2 * config.L2_TERRAIN_STRIP_Y_MARGIN:
+                self._rebuild(edge_ys, lo, hi)
+            else:
+                self._scroll(edge_ys, shift, lo, hi)
+            self.start_chunk_index = start_chunk_index
+
+        draw_x = int(-scroll_fractional_offset * float(CHUNK))
+        draw_y = self.y_origin - int(camera_y_offset)
+        if self.fill_above_color is not None and draw_y > 0:
+            surface.fill(self.fill_above_color,
+                         pygame.Rect(draw_x, 0, (len(edge_ys) - 1) * CHUNK + 1, draw_y))
+        surface.blit(self.surface, (draw_x, draw_y))
+
+
 class Terrain:
     def __init__(self, is_tutorial=False):
         self.scroll_fractional_offset = 0.0
         self.world_start_chunk_index = 0
+        self.render_scroll_lag = 0.0
         self.num_height_points = WIDTH // CHUNK + 3 
         self.is_tutorial_terrain = is_tutorial
        
-        self.heights = [self._sample(float(i)) for i in range(self.num_height_points)] 
-        self.lava_surface_particles = []
+        self._height_ring = np.array([self._sample(float(i)) for i in range(self.num_height_points)], dtype=np.float64)
+        self._ring_head = 0
+        self._ordered_heights = self._height_ring
+        self._heights_list = None
+        self.lava_surface_particles = ParticleEmitter(config.LAVA_MAX_SURFACE_PARTICLES + config.LAVA_PARTICLES_PER_FRAME_SPAWN)
         self.rock_texture_noise_seed = random.randint(0, 10000)
 
-        self.l2_ground_smoke_particles = []
+        self.l2_ground_smoke_particles = ParticleEmitter(
+            config.L2_GROUND_SMOKE_MAX_PARTICLES + config.L2_GROUND_SMOKE_PARTICLES_PER_SPAWN)
         self.last_l2_smoke_spawn_time = 0
 
-        self.l2_lava_smoke_particles = []
+        self.l2_lava_smoke_particles = ParticleEmitter(
+            config.L2_LAVA_SMOKE_MAX_PARTICLES + config.L2_LAVA_SMOKE_PARTICLES_PER_SPAWN)
         self.last_l2_lava_smoke_spawn_time = 0
 
+        num_strips, platform_thickness = config.LEVEL2_TERRAIN_GRADIENT_STRIPS, float(config.L2_BLACK_PLATFORM_THICKNESS)
+        light_color, dark_color = config.LEVEL2_TERRAIN_GRADIENT_LIGHT_BLUE, config.LEVEL2_TERRAIN_COLOR_OVERRIDE
+        floor_layers, ceiling_layers = [], []
+        for j in range(num_strips):
+            top_offset = (float(j) / float(num_strips)) * platform_thickness
+            bottom_offset = (float(j + 1) / float(num_strips)) * platform_thickness
+            t_floor = float(j) / (float(num_strips) - 1.0) if num_strips > 1 else 0.5
+            t_ceiling = float(j) / (float(num_strips) - 1.0) if num_strips > 1 else 0.0
+            floor_layers.append((lerp_color(light_color, dark_color, t_floor), top_offset, bottom_offset))
+            ceiling_layers.append((lerp_color(light_color, dark_color, t_ceiling), -bottom_offset, -top_offset))
+        self.l2_floor_strip = TerrainStripCache(floor_layers)
+        self.l2_ceiling_strip = TerrainStripCache(ceiling_layers, fill_above_color=config.LEVEL2_TERRAIN_COLOR_OVERRIDE)
+
+        self.rope_lights = RopeLightRenderer()
+        if gs.is_level_2_simple_mode and config.L2_ROPE_LIGHTS_ENABLED and not is_tutorial:
+            self.rope_lights.bake()
+
     def _sample(self, world_chunk_idx_float): 
         if self.is_tutorial_terrain:
             return float(GROUND_Y) 
@@ -49,205 +147,179 @@ class Terrain:
                    50.0 * math.sin(world_chunk_idx_float * 0.035) + \
                    25.0 * math.sin(world_chunk_idx_float * 0.09))
 
-    def update(self, dx_pixels_scrolled):
+    def update(self, dx_pixels_scrolled, time_delta_seconds=None):
         if self.is_tutorial_terrain:
             return
 
         current_time_ms = pygame.time.get_ticks()
        
-        time_delta_seconds = 1.0 / config.FPS if config.FPS > 0 else 1.0/60.0
+        if time_delta_seconds is None:
+            time_delta_seconds = 1.0 / config.FPS if config.FPS > 0 else 1.0/60.0
 
 
         self.scroll_fractional_offset += dx_pixels_scrolled / float(CHUNK) 
         while self.scroll_fractional_offset >= 1.0:
-            self.heights.pop(0)
             self.world_start_chunk_index += 1
-            new_point_world_index = float(self.world_start_chunk_index + len(self.heights)) 
-            self.heights.append(self._sample(new_point_world_index)) 
+            new_point_world_index = float(self.world_start_chunk_index + self.num_height_points - 1)
+            self._height_ring[self._ring_head] = self._sample(new_point_world_index)
+            self._ring_head = (self._ring_head + 1) % self.num_height_points
+            self._ordered_heights = None
+            self._heights_list = None
             self.scroll_fractional_offset -= 1.0
 
       
         if gs.is_level_2_simple_mode and config.LAVA_SURFACE_PARTICLES_ENABLED:
-            active_particles = []
-            if len(self.lava_surface_particles) < config.LAVA_MAX_SURFACE_PARTICLES:
-                for _ in range(config.LAVA_PARTICLES_PER_FRAME_SPAWN):
-                    spawn_screen_x = random.uniform(float(CHUNK), float(WIDTH - CHUNK))
-                    y_platform_top_world = self.height_at(spawn_screen_x) 
-                    base_lava_y_world = y_platform_top_world + config.L2_BLACK_PLATFORM_THICKNESS + config.LAVA_START_OFFSET_BELOW_PLATFORM
-
-                    spawn_world_y = base_lava_y_world + random.uniform(-config.LAVA_WAVE_AMPLITUDE / 2.0,
-                                                                       config.LAVA_WAVE_AMPLITUDE / 2.0)
-                    life = random.uniform(config.LAVA_SURFACE_PARTICLE_LIFE_MS[0],
-                                          config.LAVA_SURFACE_PARTICLE_LIFE_MS[1])
-                    start_size = random.uniform(config.LAVA_SURFACE_PARTICLE_SIZE_RANGE[0],
-                                                config.LAVA_SURFACE_PARTICLE_SIZE_RANGE[1])
-                    self.lava_surface_particles.append({
-                        'x': spawn_screen_x, 'y': spawn_world_y,
-                        'vy': random.uniform(config.LAVA_SURFACE_PARTICLE_RISE_SPEED_MIN,
-                                             config.LAVA_SURFACE_PARTICLE_RISE_SPEED_MAX),
-                        'life_ms': life, 'max_life_ms': life, 'start_size': start_size, 'size': start_size,
-                        'current_color': config.LAVA_SURFACE_PARTICLE_COLOR_START,
-                        'start_color': config.LAVA_SURFACE_PARTICLE_COLOR_START,
-                        'end_color': config.LAVA_SURFACE_PARTICLE_COLOR_END, 'alpha': 255.0
-                    })
-            for p in self.lava_surface_particles:
-                p['x'] -= dx_pixels_scrolled
-                p['y'] += p['vy'] * (60.0 * time_delta_seconds) 
-                p['life_ms'] -= time_delta_seconds * 1000.0
-                if p['life_ms'] > 0 and p['max_life_ms'] > 0:
-                    life_ratio = p['life_ms'] / p['max_life_ms']
-                    p['alpha'] = 255.0 * (life_ratio ** config.LAVA_SURFACE_PARTICLE_FADE_POWER)
-                    r = p['start_color'][0] * life_ratio + p['end_color'][0] * (1.0 - life_ratio)
-                    g = p['start_color'][1] * life_ratio + p['end_color'][1] * (1.0 - life_ratio)
-                    b = p['start_color'][2] * life_ratio + p['end_color'][2] * (1.0 - life_ratio)
-                    p['current_color'] = (int(r), int(g), int(b))
-                    p['size'] = p['start_size'] * (life_ratio ** 0.5)
-                    if p['alpha'] > 10 and p['size'] >= 1 and \
-                       p['x'] > -p['size'] and p['x'] < float(WIDTH) + p['size']:
-                        active_particles.append(p)
-            self.lava_surface_particles = active_particles
+            lava = self.lava_surface_particles
+            if len(lava) < quality.budget("lava", config.LAVA_MAX_SURFACE_PARTICLES):
+                n = config.LAVA_PARTICLES_PER_FRAME_SPAWN
+                spawn_screen_x = np.random.uniform(float(CHUNK), float(WIDTH - CHUNK), n)
+                y_platform_top_world = self.heights_at(spawn_screen_x)
+                base_lava_y_world = y_platform_top_world + config.L2_BLACK_PLATFORM_THICKNESS + config.LAVA_START_OFFSET_BELOW_PLATFORM
+                lava.spawn(n, x=spawn_screen_x,
+                           y=base_lava_y_world + np.random.uniform(-config.LAVA_WAVE_AMPLITUDE / 2.0,
+                                                                   config.LAVA_WAVE_AMPLITUDE / 2.0, n),
+                           vy=np.random.uniform(config.LAVA_SURFACE_PARTICLE_RISE_SPEED_MIN,
+                                                config.LAVA_SURFACE_PARTICLE_RISE_SPEED_MAX, n),
+                           life=np.random.uniform(config.LAVA_SURFACE_PARTICLE_LIFE_MS[0],
+                                                  config.LAVA_SURFACE_PARTICLE_LIFE_MS[1], n),
+                           size=np.random.uniform(config.LAVA_SURFACE_PARTICLE_SIZE_RANGE[0],
+                                                  config.LAVA_SURFACE_PARTICLE_SIZE_RANGE[1], n),
+                           alpha=255.0,
+                           color=config.LAVA_SURFACE_PARTICLE_COLOR_START,
+                           end_color=config.LAVA_SURFACE_PARTICLE_COLOR_END)
+            lava.integrate(60.0 * time_delta_seconds, scroll_dx=dx_pixels_scrolled)
+            lava.age(time_delta_seconds * 1000.0)
+            life_ratio = lava.life_ratio()
+            lava.fade_by_life(config.LAVA_SURFACE_PARTICLE_FADE_POWER, life_ratio)
+            lava.size_by_life(SIZE_SQRT_LIFE, life_ratio)
+            lava.cull(min_alpha=10, min_size=1, require_life=True, x_range=(0.0, float(WIDTH)), size_margin=1.0)
 
       
         if gs.is_level_2_simple_mode and config.L2_GROUND_SMOKE_ENABLED:
             if current_time_ms - self.last_l2_smoke_spawn_time > config.L2_GROUND_SMOKE_SPAWN_INTERVAL_MS:
                 self.last_l2_smoke_spawn_time = current_time_ms
-                if len(self.l2_ground_smoke_particles) < config.L2_GROUND_SMOKE_MAX_PARTICLES:
-                    for _ in range(config.L2_GROUND_SMOKE_PARTICLES_PER_SPAWN):
-                        spawn_screen_x = random.uniform(float(CHUNK), float(WIDTH - CHUNK))
-                        spawn_world_y_platform_top = self.height_at(spawn_screen_x) 
-                        life = random.uniform(config.L2_GROUND_SMOKE_LIFE_MS[0], config.L2_GROUND_SMOKE_LIFE_MS[1])
-                        start_size = random.uniform(config.L2_GROUND_SMOKE_SIZE_RANGE[0], config.L2_GROUND_SMOKE_SIZE_RANGE[1])
-                        self.l2_ground_smoke_particles.append({
-                            'current_screen_x': spawn_screen_x, 'world_y_start': spawn_world_y_platform_top, 'y_offset': 0.0,
-                            'vx_drift': random.uniform(config.L2_GROUND_SMOKE_DRIFT_SPEED_MIN, config.L2_GROUND_SMOKE_DRIFT_SPEED_MAX),
-                            'vy_rise': random.uniform(config.L2_GROUND_SMOKE_RISE_SPEED_MIN, config.L2_GROUND_SMOKE_RISE_SPEED_MAX),
-                            'life_ms': life, 'max_life_ms': life, 'start_size': start_size, 'size': start_size,
-                            'current_color': config.L2_GROUND_SMOKE_COLOR_START[:3],
-                            'alpha': float(config.L2_GROUND_SMOKE_COLOR_START[3]),
-                            'start_alpha': float(config.L2_GROUND_SMOKE_COLOR_START[3])
-                        })
-            active_smoke = []
-            for p in self.l2_ground_smoke_particles:
-                p['current_screen_x'] += p['vx_drift'] * (60.0 * time_delta_seconds)
-                p['current_screen_x'] -= dx_pixels_scrolled
-                p['y_offset'] += p['vy_rise'] * (60.0 * time_delta_seconds)
-                p['life_ms'] -= time_delta_seconds * 1000.0
-                if p['life_ms'] > 0 and p['max_life_ms'] > 0:
-                    life_ratio = p['life_ms'] / p['max_life_ms']
-                    p['alpha'] = p['start_alpha'] * (life_ratio ** config.L2_GROUND_SMOKE_FADE_POWER)
-                    p['size'] = p['start_size'] * (0.5 + 0.5 * life_ratio)
-                    if p['current_screen_x'] < -p['size'] or p['current_screen_x'] > float(WIDTH) + p['size']: p['alpha'] = 0.0
-                    if p['alpha'] > 5 and p['size'] >= 1: active_smoke.append(p)
-            self.l2_ground_smoke_particles = active_smoke
+                if len(self.l2_ground_smoke_particles) < quality.budget("smoke", config.L2_GROUND_SMOKE_MAX_PARTICLES):
+                    n = config.L2_GROUND_SMOKE_PARTICLES_PER_SPAWN
+                    spawn_screen_x = np.random.uniform(float(CHUNK), float(WIDTH - CHUNK), n)
+                    self.l2_ground_smoke_particles.spawn(
+                        n, x=spawn_screen_x, y=self.heights_at(spawn_screen_x),
+                        vx=np.random.uniform(config.L2_GROUND_SMOKE_DRIFT_SPEED_MIN, config.L2_GROUND_SMOKE_DRIFT_SPEED_MAX, n),
+                        vy=np.random.uniform(config.L2_GROUND_SMOKE_RISE_SPEED_MIN, config.L2_GROUND_SMOKE_RISE_SPEED_MAX, n),
+                        life=np.random.uniform(config.L2_GROUND_SMOKE_LIFE_MS[0], config.L2_GROUND_SMOKE_LIFE_MS[1], n),
+                        size=np.random.uniform(config.L2_GROUND_SMOKE_SIZE_RANGE[0], config.L2_GROUND_SMOKE_SIZE_RANGE[1], n),
+                        color=config.L2_GROUND_SMOKE_COLOR_START[:3],
+                        alpha=float(config.L2_GROUND_SMOKE_COLOR_START[3]))
+            self._update_smoke_emitter(self.l2_ground_smoke_particles, dx_pixels_scrolled, time_delta_seconds,
+                                       config.L2_GROUND_SMOKE_FADE_POWER)
 
      
         if gs.is_level_2_simple_mode and config.L2_LAVA_SMOKE_ENABLED:
             if current_time_ms - self.last_l2_lava_smoke_spawn_time > config.L2_LAVA_SMOKE_SPAWN_INTERVAL_MS:
                 self.last_l2_lava_smoke_spawn_time = current_time_ms
                 if len(self.l2_lava_smoke_particles) < config.L2_LAVA_SMOKE_MAX_PARTICLES:
-                    for _ in range(config.L2_LAVA_SMOKE_PARTICLES_PER_SPAWN):
-                        spawn_screen_x = random.uniform(float(CHUNK), float(WIDTH - CHUNK))
-                        spawn_world_y_platform_top = self.height_at(spawn_screen_x) 
-                        spawn_world_y_lava_approx = (spawn_world_y_platform_top +
-                                                     config.L2_BLACK_PLATFORM_THICKNESS +
-                                                     config.LAVA_START_OFFSET_BELOW_PLATFORM +
-                                                     config.L2_LAVA_SMOKE_Y_OFFSET_FROM_LAVA_SURFACE)
-                        life = random.uniform(config.L2_LAVA_SMOKE_LIFE_MS[0], config.L2_LAVA_SMOKE_LIFE_MS[1])
-                        start_size = random.uniform(config.L2_LAVA_SMOKE_SIZE_RANGE[0], config.L2_LAVA_SMOKE_SIZE_RANGE[1])
-                        self.l2_lava_smoke_particles.append({
-                            'current_screen_x': spawn_screen_x, 'world_y_start': spawn_world_y_lava_approx, 'y_offset': 0.0,
-                            'vx_drift': random.uniform(config.L2_LAVA_SMOKE_DRIFT_SPEED_MIN, config.L2_LAVA_SMOKE_DRIFT_SPEED_MAX),
-                            'vy_rise': random.uniform(config.L2_LAVA_SMOKE_RISE_SPEED_MIN, config.L2_LAVA_SMOKE_RISE_SPEED_MAX),
-                            'life_ms': life, 'max_life_ms': life, 'start_size': start_size, 'size': start_size,
-                            'current_color': config.L2_LAVA_SMOKE_COLOR_START[:3],
-                            'alpha': float(config.L2_LAVA_SMOKE_COLOR_START[3]),
-                            'start_alpha': float(config.L2_LAVA_SMOKE_COLOR_START[3])
-                        })
-            active_lava_smoke = []
-            for p in self.l2_lava_smoke_particles:
-                p['current_screen_x'] += p['vx_drift'] * (60.0 * time_delta_seconds)
-                p['current_screen_x'] -= dx_pixels_scrolled
-                p['y_offset'] += p['vy_rise'] * (60.0 * time_delta_seconds)
-                p['life_ms'] -= time_delta_seconds * 1000.0
-                if p['life_ms'] > 0 and p['max_life_ms'] > 0:
-                    life_ratio = p['life_ms'] / p['max_life_ms']
-                    p['alpha'] = p['start_alpha'] * (life_ratio ** config.L2_LAVA_SMOKE_FADE_POWER)
-                    p['size'] = p['start_size'] * (0.5 + 0.5 * life_ratio)
-                    if p['current_screen_x'] < -p['size'] or p['current_screen_x'] > float(WIDTH) + p['size']: p['alpha'] = 0.0
-                    if p['alpha'] > 5 and p['size'] >= 1: active_lava_smoke.append(p)
-            self.l2_lava_smoke_particles = active_lava_smoke
+                    n = config.L2_LAVA_SMOKE_PARTICLES_PER_SPAWN
+                    spawn_screen_x = np.random.uniform(float(CHUNK), float(WIDTH - CHUNK), n)
+                    spawn_world_y_lava_approx = (self.heights_at(spawn_screen_x) +
+                                                 config.L2_BLACK_PLATFORM_THICKNESS +
+                                                 config.LAVA_START_OFFSET_BELOW_PLATFORM +
+                                                 config.L2_LAVA_SMOKE_Y_OFFSET_FROM_LAVA_SURFACE)
+                    self.l2_lava_smoke_particles.spawn(
+                        n, x=spawn_screen_x, y=spawn_world_y_lava_approx,
+                        vx=np.random.uniform(config.L2_LAVA_SMOKE_DRIFT_SPEED_MIN, config.L2_LAVA_SMOKE_DRIFT_SPEED_MAX, n),
+                        vy=np.random.uniform(config.L2_LAVA_SMOKE_RISE_SPEED_MIN, config.L2_LAVA_SMOKE_RISE_SPEED_MAX, n),
+                        life=np.random.uniform(config.L2_LAVA_SMOKE_LIFE_MS[0], config.L2_LAVA_SMOKE_LIFE_MS[1], n),
+                        size=np.random.uniform(config.L2_LAVA_SMOKE_SIZE_RANGE[0], config.L2_LAVA_SMOKE_SIZE_RANGE[1], n),
+                        color=config.L2_LAVA_SMOKE_COLOR_START[:3],
+                        alpha=float(config.L2_LAVA_SMOKE_COLOR_START[3]))
+            self._update_smoke_emitter(self.l2_lava_smoke_particles, dx_pixels_scrolled, time_delta_seconds,
+                                       config.L2_LAVA_SMOKE_FADE_POWER)
+
+    def _update_smoke_emitter(self, smoke, dx_pixels_scrolled, time_delta_seconds, fade_power):
+        smoke.integrate(60.0 * time_delta_seconds, scroll_dx=dx_pixels_scrolled)
+        smoke.age(time_delta_seconds * 1000.0)
+        life_ratio = smoke.life_ratio()
+        smoke.fade_by_life(fade_power, life_ratio)
+        smoke.size_by_life(SIZE_HALF_LIFE, life_ratio)
+        smoke.cull(min_alpha=5, min_size=1, require_life=True, x_range=(0.0, float(WIDTH)), size_margin=1.0)
+
+
+    @property
+    def heights(self):
+        if self._ordered_heights is None:
+            head = self._ring_head
+            self._ordered_heights = np.concatenate((self._height_ring[head:], self._height_ring[:head]))
+        return self._ordered_heights
+
+    def _height_points(self):
+        if self._heights_list is None:
+            self._heights_list = self.heights.tolist()
+        return self._heights_list
+
+    def _ceiling_heights(self, start_chunk_index=None, heights=None):
+        if start_chunk_index is None:
+            start_chunk_index, heights = self.world_start_chunk_index, self.heights
+        heights = np.asarray(heights, dtype=np.float64)
+        world_chunk_idx = start_chunk_index + np.arange(len(heights), dtype=np.float64)
+        return float(LEVEL2_CEILING_Y + GROUND_Y) + 2.0 * world_chunk_idx * DOWNHILL_SLOPE_FACTOR - heights
+
+    def _render_view(self):
+        offset = self.scroll_fractional_offset - self.render_scroll_lag / float(CHUNK)
+        if self.is_tutorial_terrain or offset >= 0.0:
+            return self.world_start_chunk_index, max(0.0, offset), self._height_points()
+        chunks_behind = int(math.ceil(-offset))
+        start_chunk_index = self.world_start_chunk_index - chunks_behind
+        trailing_heights = [self._sample(float(start_chunk_index + k)) for k in range(chunks_behind)]
+        return start_chunk_index, offset + chunks_behind, trailing_heights + self._height_points()[:-chunks_behind]
+
+    def _interpolate(self, values, screen_xs, invalid_value):
+        xs = np.asarray(screen_xs, dtype=np.float64)
+        index_float = xs / float(CHUNK) + self.scroll_fractional_offset
+        finite = np.isfinite(index_float)
+        index_float = np.where(finite, index_float, -1.0)
+        index0 = np.floor(index_float)
+        interpolation_factor = index_float - index0
+        index0 = index0.astype(np.int64)
+        last = len(values) - 1
+        i0 = np.clip(index0, 0, last - 1)
+        result = values[i0] * (1.0 - interpolation_factor) + values[i0 + 1] * interpolation_factor
+        result = np.where(index0 < 0, values[0], result)
+        result = np.where(index0 >= last, values[last], result)
+        if invalid_value is not None:
+            result = np.where(finite, result, invalid_value)
+        return result
+
+    def heights_at(self, screen_xs):
+        if self.is_tutorial_terrain:
+            return np.full(np.shape(screen_xs), float(GROUND_Y))
+        return self._interpolate(self.heights, screen_xs, None)
 
+    def ceiling_heights_at(self, screen_xs):
+        if self.is_tutorial_terrain or not gs.is_level_2_simple_mode:
+            return np.full(np.shape(screen_xs), float(-HEIGHT * 2.0))
+        return self._interpolate(self._ceiling_heights(), screen_xs, float(-HEIGHT * 2.0))
 
     def height_at(self, screen_x_pos_float): 
         if self.is_tutorial_terrain: return float(GROUND_Y)
+        heights = self._height_points()
         index_float = (screen_x_pos_float / float(CHUNK)) + self.scroll_fractional_offset
+        if not math.isfinite(index_float):
+            return float(self.heights_at(screen_x_pos_float))
         index0 = math.floor(index_float)
-        interpolation_factor = index_float - index0 
-
-        if index0 < 0 or index0 + 1 >= len(self.heights):
-            if not self.heights: return float(HEIGHT * 2)
-           
-            safe_idx = max(0, min(index0, len(self.heights) - 1))
-            if index0 < 0 : safe_idx = 0
-            if index0 + 1 >= len(self.heights): safe_idx = len(self.heights) -1
-            return float(self.heights[safe_idx])
-
-        h0 = self.heights[index0]     
-        h1 = self.heights[index0 + 1] 
-        return float(h0 * (1.0 - interpolation_factor) + h1 * interpolation_factor)
+        if index0 < 0: return heights[0]
+        if index0 + 1 >= len(heights): return heights[-1]
+        interpolation_factor = index_float - index0
+        return heights[index0] * (1.0 - interpolation_factor) + heights[index0 + 1] * interpolation_factor
 
     def ceiling_height_at(self, screen_x_pos_float): 
         if self.is_tutorial_terrain or not gs.is_level_2_simple_mode: return float(-HEIGHT * 2.0)
-
-        if not math.isfinite(screen_x_pos_float):
-          
-            return float(-HEIGHT * 2.0)
-
+        if not math.isfinite(screen_x_pos_float): return float(-HEIGHT * 2.0)
+        heights = self._height_points()
         index_float = (screen_x_pos_float / float(CHUNK)) + self.scroll_fractional_offset
-
-        if not math.isfinite(index_float):
-          
-            return float(-HEIGHT * 2.0)
-
-        index0 = math.floor(index_float)
-        interpolation_factor = index_float - index0
-
-        if not math.isfinite(interpolation_factor): 
-            interpolation_factor = 0.0
-
-        if index0 < 0 or index0 + 1 >= len(self.heights):
-            if not self.heights: return float(-HEIGHT * 2.0)
-            
-            idx_to_use = 0
-            if index0 < 0 : idx_to_use = 0
-            elif index0 + 1 >= len(self.heights): idx_to_use = len(self.heights) -1
-            else: 
-                  
-                  idx_to_use = index0
-
-            h_bottom_world = self.heights[idx_to_use] 
-            world_chunk_idx = float(self.world_start_chunk_index + idx_to_use) 
-            base_y_bottom_slope = float(GROUND_Y + world_chunk_idx * DOWNHILL_SLOPE_FACTOR)
-            deviation_bottom = h_bottom_world - base_y_bottom_slope
-            base_y_top_slope = float(LEVEL2_CEILING_Y + world_chunk_idx * DOWNHILL_SLOPE_FACTOR)
-            return float(base_y_top_slope - deviation_bottom)
-
-        h0_bw = self.heights[index0] 
-        h1_bw = self.heights[index0 + 1] 
-        wc_idx0 = float(self.world_start_chunk_index + index0) 
-        wc_idx1 = float(self.world_start_chunk_index + index0 + 1) 
-
-        b_y_bs0 = float(GROUND_Y + wc_idx0 * DOWNHILL_SLOPE_FACTOR)
-        dev0 = h0_bw - b_y_bs0
-        b_y_ts0 = float(LEVEL2_CEILING_Y + wc_idx0 * DOWNHILL_SLOPE_FACTOR)
-        top_w0 = b_y_ts0 - dev0
-
-        b_y_bs1 = float(GROUND_Y + wc_idx1 * DOWNHILL_SLOPE_FACTOR)
-        dev1 = h1_bw - b_y_bs1
-        b_y_ts1 = float(LEVEL2_CEILING_Y + wc_idx1 * DOWNHILL_SLOPE_FACTOR)
-        top_w1 = b_y_ts1 - dev1
-
-        return float(top_w0 * (1.0 - interpolation_factor) + top_w1 * interpolation_factor)
+        index0 = max(0, min(len(heights) - 2, math.floor(index_float)))
+        interpolation_factor = max(0.0, min(1.0, index_float - index0))
+        world_chunk_idx = self.world_start_chunk_index + index0 + interpolation_factor
+        height = heights[index0] * (1.0 - interpolation_factor) + heights[index0 + 1] * interpolation_factor
+        return float(LEVEL2_CEILING_Y + GROUND_Y) + 2.0 * world_chunk_idx * DOWNHILL_SLOPE_FACTOR - height
 
 
     def _draw_distant_mountains(self, surface, camera_y_offset): 
@@ -317,10 +389,10 @@ class Terrain:
         current_time_ms = pygame.time.get_ticks()
         clump_c_min_default, clump_c_max_default = DEFAULT_CLUMP_COLOR_MIN, DEFAULT_CLUMP_COLOR_MAX
 
+        render_start_chunk_index, render_offset, render_heights = self._render_view()
         pts_platform_top_surface_on_screen = []
-        csx_initial = -self.scroll_fractional_offset * float(CHUNK) 
-        for k_idx in range(len(self.heights)):
-            platform_top_y_world = self.heights[k_idx] 
+        csx_initial = -render_offset * float(CHUNK) 
+        for k_idx, platform_top_y_world in enumerate(render_heights):
             screen_x = csx_initial + k_idx * float(CHUNK)
             y_on_screen = platform_top_y_world - camera_y_offset
             pts_platform_top_surface_on_screen.append((screen_x, y_on_screen))
@@ -365,31 +437,23 @@ class Terrain:
                     if len(lava_layer_poly) >= 3:
                         pygame.draw.polygon(surface, pulsed_color, lava_layer_poly)
             if config.LAVA_SURFACE_PARTICLES_ENABLED: 
-                for p in self.lava_surface_particles:
-                    if p['alpha'] > 10 and p['size'] >= 1:
-                        draw_y = p['y'] - camera_y_offset
-                        pygame.draw.circle(surface, (*p['current_color'], int(p['alpha'])), (int(p['x']), int(draw_y)), int(p['size']))
+                lava = self.lava_surface_particles
+                if lava:
+                    lava_colors = lava.colors(lava.life_ratio()).tolist()
+                    for (px, py, alpha, size), color in zip(
+                            zip(lava['x'].tolist(), lava['y'].tolist(), lava['alpha'].tolist(), lava['size'].tolist()),
+                            lava_colors):
+                        if alpha > 10 and size >= 1:
+                            draw_y = py - camera_y_offset
+                            pygame.draw.circle(surface, (*color, int(alpha)), (int(px), int(draw_y)), int(size))
             if config.L2_LAVA_SMOKE_ENABLED: 
-                for p in self.l2_lava_smoke_particles:
-                    if p['alpha'] > 5 and p['size'] >= 1:
-                        draw_x, draw_y = p['current_screen_x'], (p['world_y_start'] + p['y_offset']) - camera_y_offset
-                        s = int(p['size']); smoke_color_with_alpha = (*config.L2_LAVA_SMOKE_COLOR_START[:3], int(p['alpha']))
-                        if s > 0: temp_smoke_surf = pygame.Surface((s*2,s*2),pygame.SRCALPHA); pygame.draw.circle(temp_smoke_surf,smoke_color_with_alpha,(s,s),s); surface.blit(temp_smoke_surf,(draw_x-s,draw_y-s))
+                self._draw_smoke_emitter(surface, self.l2_lava_smoke_particles, camera_y_offset)
 
         
         if len(pts_platform_top_surface_on_screen) >= 2:
             if is_l2_simple:
-                num_strips, platform_thickness = config.LEVEL2_TERRAIN_GRADIENT_STRIPS, float(config.L2_BLACK_PLATFORM_THICKNESS)
-                light_color, dark_color = config.LEVEL2_TERRAIN_GRADIENT_LIGHT_BLUE, config.LEVEL2_TERRAIN_COLOR_OVERRIDE
-                for j in range(num_strips):
-                    t_color = float(j) / (float(num_strips) - 1.0) if num_strips > 1 else 0.5
-                    current_strip_color = lerp_color(light_color, dark_color, t_color)
-                    strip_poly_points = []
-                    for x_coord, y_platform_top_on_screen in pts_platform_top_surface_on_screen:
-                        strip_poly_points.append((x_coord, y_platform_top_on_screen + (float(j)/float(num_strips))*platform_thickness))
-                    for x_coord, y_platform_top_on_screen in reversed(pts_platform_top_surface_on_screen):
-                        strip_poly_points.append((x_coord, y_platform_top_on_screen + (float(j+1)/float(num_strips))*platform_thickness))
-                    if len(strip_poly_points) >= 3: pygame.draw.polygon(surface, current_strip_color, strip_poly_points)
+                self.l2_floor_strip.draw(surface, render_heights, render_start_chunk_index,
+                                         render_offset, camera_y_offset)
             else:
                 platform_poly_for_drawing = list(pts_platform_top_surface_on_screen)
                 current_platform_color = DEFAULT_TERRAIN_COLOR
@@ -399,11 +463,7 @@ class Terrain:
                 pygame.draw.polygon(surface, current_platform_color, platform_poly_for_drawing)
 
         if is_l2_simple and config.L2_GROUND_SMOKE_ENABLED: 
-            for p in self.l2_ground_smoke_particles:
-                if p['alpha'] > 5 and p['size'] >= 1:
-                    draw_x, draw_y = p['current_screen_x'], (p['world_y_start'] + p['y_offset']) - camera_y_offset
-                    s = int(p['size']); smoke_color_with_alpha = (*p['current_color'], int(p['alpha']))
-                    if s > 0: temp_smoke_surf = pygame.Surface((s*2,s*2),pygame.SRCALPHA); pygame.draw.circle(temp_smoke_surf,smoke_color_with_alpha,(s,s),s); surface.blit(temp_smoke_surf,(draw_x-s,draw_y-s))
+            self._draw_smoke_emitter(surface, self.l2_ground_smoke_particles, camera_y_offset)
 
         self._draw_clumps_on_surface(surface, pts_platform_top_surface_on_screen,
                                      clump_c_min_default, clump_c_max_default, False)
@@ -411,144 +471,19 @@ class Terrain:
         
         if is_l2_simple:
             pts_ceiling_bottom_surface_on_screen = []
-            csx_initial_ceil = -self.scroll_fractional_offset * float(CHUNK)
-            for k_idx in range(len(self.heights)):
+            ceiling_bottom_ys_world = self._ceiling_heights(render_start_chunk_index, render_heights).tolist()
+            csx_initial_ceil = -render_offset * float(CHUNK)
+            for k_idx, ceiling_bottom_y_world in enumerate(ceiling_bottom_ys_world):
                 screen_x_for_ceil = csx_initial_ceil + k_idx * float(CHUNK)
-                ceiling_bottom_y_world = self.ceiling_height_at(screen_x_for_ceil)
                 y_on_screen = ceiling_bottom_y_world - camera_y_offset
                 pts_ceiling_bottom_surface_on_screen.append((screen_x_for_ceil, y_on_screen))
 
             if len(pts_ceiling_bottom_surface_on_screen) >= 2:
-                num_strips, ceiling_thickness = config.LEVEL2_TERRAIN_GRADIENT_STRIPS, float(config.L2_BLACK_PLATFORM_THICKNESS)
-                start_color, end_color = config.LEVEL2_TERRAIN_GRADIENT_LIGHT_BLUE, config.LEVEL2_TERRAIN_COLOR_OVERRIDE
-                for j in range(num_strips):
-                    t_color = float(j) / (float(num_strips) - 1.0) if num_strips > 1 else 0.0
-                    current_strip_color = lerp_color(start_color, end_color, t_color)
-                    strip_poly = []
-                    for x,y_ceil_bot in pts_ceiling_bottom_surface_on_screen: strip_poly.append((x, y_ceil_bot - (float(j)/float(num_strips))*ceiling_thickness))
-                    for x,y_ceil_bot in reversed(pts_ceiling_bottom_surface_on_screen): strip_poly.append((x, y_ceil_bot - (float(j+1)/float(num_strips))*ceiling_thickness))
-                    if len(strip_poly) >= 3: pygame.draw.polygon(surface, current_strip_color, strip_poly)
-
-                top_grad_pts = [(x, y_ceil_bot - ceiling_thickness) for x, y_ceil_bot in pts_ceiling_bottom_surface_on_screen]
-                if len(top_grad_pts) >= 2: 
-                    fill_poly_top = list(top_grad_pts); fill_poly_top.append((top_grad_pts[-1][0], -10.0)); fill_poly_top.append((top_grad_pts[0][0], -10.0))
-                    if len(fill_poly_top) >= 3: pygame.draw.polygon(surface, config.LEVEL2_TERRAIN_COLOR_OVERRIDE, fill_poly_top)
-            
-            
+                self.l2_ceiling_strip.draw(surface, ceiling_bottom_ys_world, render_start_chunk_index,
+                                           render_offset, camera_y_offset)
+
                 if config.L2_ROPE_LIGHTS_ENABLED:
-                    time_for_pulse_rope = current_time_ms * config.L2_ROPE_LIGHT_PULSE_SPEED_HZ * 2 * math.pi / 1000.0
-                    time_for_flicker_rope = current_time_ms * config.L2_ROPE_LIGHT_FLICKER_SPEED_HZ * 2 * math.pi / 1000.0
-                    time_for_sway_rope = current_time_ms * config.L2_ROPE_LIGHT_SWAY_SPEED_HZ * 2 * math.pi / 1000.0
-                    for i in range(len(pts_ceiling_bottom_surface_on_screen) - 1):
-                        p1 = pts_ceiling_bottom_surface_on_screen[i]
-                        p2 = pts_ceiling_bottom_surface_on_screen[i + 1]
-                        dx_seg, dy_seg = p2[0] - p1[0], p2[1] - p1[1]
-                        segment_length = math.hypot(dx_seg, dy_seg)
-                        if segment_length < 1: continue
-                        ux_seg, uy_seg = dx_seg / segment_length, dy_seg / segment_length
-                        effective_spacing = max(1.0, float(config.L2_ROPE_LIGHT_SPACING))
-                        j_light_index = 0
-                        current_offset_along_segment = 0.0
-                        epsilon = 0.01
-                        while current_offset_along_segment <= segment_length + epsilon:
-                            dist_along_segment = current_offset_along_segment
-                            if j_light_index > 0 and (segment_length - dist_along_segment) < (
-                                    effective_spacing * 0.5) and (segment_length - dist_along_segment) > -epsilon:
-                                dist_along_segment = segment_length
-                            light_x_on_edge_anchor = p1[0] + dist_along_segment * ux_seg
-                            light_y_on_edge = p1[1] + dist_along_segment * uy_seg
-                            light_unique_id_rope = (i * 10000) + j_light_index
-                            swayed_light_x = light_x_on_edge_anchor
-                            if config.L2_ROPE_LIGHT_SWAY_ENABLED:
-                                sway_phase_offset_rope = (
-                                                                 light_unique_id_rope * 19) % config.L2_ROPE_LIGHT_SWAY_PHASE_OFFSET_MAX_RAD
-                                sway_val_rope = math.sin(time_for_sway_rope + sway_phase_offset_rope)
-                                swayed_light_x += sway_val_rope * config.L2_ROPE_LIGHT_SWAY_AMPLITUDE_X
-                            light_y = light_y_on_edge + config.L2_ROPE_LIGHT_Y_OFFSET
-                            effective_rope_light_radius = config.L2_ROPE_LIGHT_RADIUS * 2.2
-                            if -effective_rope_light_radius * 3 < swayed_light_x < WIDTH + effective_rope_light_radius * 3 and \
-                                    -effective_rope_light_radius * 3 < light_y < HEIGHT + effective_rope_light_radius * 3:
-                                if config.L2_ROPE_LIGHT_SWAY_ENABLED:
-                                    pygame.draw.line(surface, config.L2_ROPE_LIGHT_HANGING_LINE_COLOR,
-                                                     (int(light_x_on_edge_anchor), int(light_y_on_edge)),
-                                                     (int(swayed_light_x), int(light_y)), 1)
-                                pulse_phase_offset_rope = (
-                                                                  light_unique_id_rope * 7) % config.L2_ROPE_LIGHT_PULSE_PHASE_OFFSET_MAX_RAD
-                                pulse_val_rope = (math.sin(time_for_pulse_rope + pulse_phase_offset_rope) + 1) / 2.0
-                                base_brightness_factor = config.L2_ROPE_LIGHT_PULSE_MIN_BRIGHTNESS_FACTOR + \
-                                                         pulse_val_rope * (
-                                                                 1.0 - config.L2_ROPE_LIGHT_PULSE_MIN_BRIGHTNESS_FACTOR)
-                                flicker_phase_offset_rope = (
-                                                                    light_unique_id_rope * 13) % config.L2_ROPE_LIGHT_FLICKER_PHASE_OFFSET_MAX_RAD
-                                flicker_val_rope = (math.sin(
-                                    time_for_flicker_rope + flicker_phase_offset_rope) + 1) / 2.0
-                                flicker_modulation_rope = (
-                                                                  flicker_val_rope * 2.0 - 1.0) * config.L2_ROPE_LIGHT_FLICKER_MAGNITUDE
-                                current_brightness_factor = base_brightness_factor + flicker_modulation_rope
-                                current_brightness_factor = max(config.L2_ROPE_LIGHT_PULSE_MIN_BRIGHTNESS_FACTOR * 0.4,
-                                                                min(1.0 + config.L2_ROPE_LIGHT_FLICKER_MAGNITUDE * 1.2,
-                                                                    current_brightness_factor))
-                                r_base, g_base, b_base = config.L2_ROPE_LIGHT_BASE_COLOR
-                                pulsed_r = max(0, min(255, int(r_base * current_brightness_factor * 1.15)))
-                                pulsed_g = max(0, min(255, int(g_base * current_brightness_factor * 1.15)))
-                                pulsed_b = max(0, min(255, int(b_base * current_brightness_factor * 1.15)))
-                                current_main_light_color = (pulsed_r, pulsed_g, pulsed_b)
-                                if config.L2_ROPE_LIGHT_GLOW_ENABLED:
-                                    effective_glow_radius_rope = int(
-                                        effective_rope_light_radius * config.L2_ROPE_LIGHT_GLOW_RADIUS_FACTOR * 1.2)
-                                    glow_flicker_val_rope = (math.sin(
-                                        time_for_flicker_rope * 1.15 + flicker_phase_offset_rope + 0.7) + 1) / 2.0
-                                    glow_flicker_modulation = (
-                                                                      glow_flicker_val_rope * 2.0 - 1.0) * config.L2_ROPE_LIGHT_FLICKER_MAGNITUDE * 0.6
-                                    glow_pulse_factor = (math.sin(
-                                        time_for_pulse_rope + pulse_phase_offset_rope + math.pi / 2.2) + 1) / 2.0
-                                    base_glow_alpha = config.L2_ROPE_LIGHT_GLOW_BASE_ALPHA * 1.4
-                                    glow_alpha_dynamic = int(base_glow_alpha * (0.5 + 0.5 * glow_pulse_factor) * (
-                                            1.0 + glow_flicker_modulation))
-                                    glow_alpha_dynamic = max(25, min(int(base_glow_alpha * 1.15), glow_alpha_dynamic))
-                                    glow_base_tint_r, glow_base_tint_g, glow_base_tint_b = config.L2_ROPE_LIGHT_BASE_COLOR
-                                    glow_outer_tint_r_factor, glow_outer_tint_g_factor, glow_outer_tint_b_factor = 1.1, 0.95, 0.8
-                                    for k_glow in range(3, 0, -1):
-                                        current_glow_layer_radius = int(effective_glow_radius_rope * (k_glow / 3.0))
-                                        tint_interp = (3 - k_glow) / 2.0
-                                        eff_tint_r = int(
-                                            glow_base_tint_r * (1.0 - tint_interp * (1.0 - glow_outer_tint_r_factor)))
-                                        eff_tint_g = int(
-                                            glow_base_tint_g * (1.0 - tint_interp * (1.0 - glow_outer_tint_g_factor)))
-                                        eff_tint_b = int(
-                                            glow_base_tint_b * (1.0 - tint_interp * (1.0 - glow_outer_tint_b_factor)))
-                                        current_glow_color_rgb_tinted = (min(255, max(0, eff_tint_r) + 15),
-                                                                         min(255, max(0, eff_tint_g) + 15),
-                                                                         min(255, max(0, eff_tint_b) + 10))
-                                        current_glow_layer_alpha = int(
-                                            glow_alpha_dynamic * (0.8 * ((4 - k_glow) / 3.0)) ** 1.4)
-                                        current_glow_layer_alpha = max(0, min(255, current_glow_layer_alpha))
-                                        if current_glow_layer_radius > 0 and current_glow_layer_alpha > 5:
-                                            glow_surf = pygame.Surface(
-                                                (current_glow_layer_radius * 2, current_glow_layer_radius * 2),
-                                                pygame.SRCALPHA)
-                                            pygame.draw.circle(glow_surf, (*current_glow_color_rgb_tinted,
-                                                                           current_glow_layer_alpha),
-                                                               (current_glow_layer_radius, current_glow_layer_radius),
-                                                               current_glow_layer_radius)
-                                            surface.blit(glow_surf, (int(swayed_light_x - current_glow_layer_radius),
-                                                                     int(light_y - current_glow_layer_radius)))
-                                pygame.draw.circle(surface, current_main_light_color,
-                                                   (int(swayed_light_x), int(light_y)),
-                                                   int(effective_rope_light_radius))
-                                core_radius = max(1, int(effective_rope_light_radius * 0.35))
-                                core_brightness_factor = current_brightness_factor * 1.7 + 0.6
-                                core_r = min(255, int(r_base * core_brightness_factor + 120))
-                                core_g = min(255, int(g_base * core_brightness_factor + 120))
-                                core_b = min(255, int(b_base * core_brightness_factor + 100))
-                                core_color = (core_r, core_g, core_b)
-                                pygame.draw.circle(surface, core_color, (int(swayed_light_x), int(light_y)),
-                                                   core_radius)
-                            j_light_index += 1
-                            if effective_spacing <= 0: break
-                            current_offset_along_segment += effective_spacing
-                            if segment_length < effective_spacing and j_light_index == 1: break
-                            if abs(dist_along_segment - segment_length) < epsilon: break
+                    self.rope_lights.draw(surface, pts_ceiling_bottom_surface_on_screen, current_time_ms)
                 time_for_pulse_particle = current_time_ms * config.L2_PARTICLE_LIGHT_PULSE_SPEED_HZ * 2 * math.pi / 1000.0
                 time_for_flicker_particle = current_time_ms * config.L2_PARTICLE_LIGHT_FLICKER_SPEED_HZ * 2 * math.pi / 1000.0
                 for i in range(len(pts_ceiling_bottom_surface_on_screen) - 1):
@@ -637,6 +572,16 @@ class Terrain:
                                         pygame.draw.circle(surface, core_col_particle, (int(px), int(py)),
                                                            core_rad_particle)
 
+    def _draw_smoke_emitter(self, surface, smoke, camera_y_offset):
+        if not smoke: return
+        smoke_colors = smoke.colors().tolist()
+        for (draw_x, py, alpha, size), color in zip(
+                zip(smoke['x'].tolist(), smoke['y'].tolist(), smoke['alpha'].tolist(), smoke['size'].tolist()),
+                smoke_colors):
+            if alpha > 5 and size >= 1:
+                draw_y = py - camera_y_offset
+                stamp_cache.blit_circle(surface, draw_x, draw_y, int(size), (*color, int(alpha)))
+
     def draw_tutorial_snow_platform(self, surface, camera_y_offset): 
         self.draw_snow_platform_and_clumps(surface, camera_y_offset)
 
@@ -681,16 +626,18 @@ class Ramp:
     def draw(self, surface, camera_y_offset):
         y_top_start_screen = self.base_y_at_start - camera_y_offset
         y_top_end_screen = (self.base_y_at_start - self.height_rise) - camera_y_offset 
-        if self.end_x_screen > 0 and self.screen_spawn_x < float(WIDTH):
+        start_x_screen = self.screen_spawn_x + self.terrain.render_scroll_lag
+        end_x_screen = self.end_x_screen + self.terrain.render_scroll_lag
+        if end_x_screen > 0 and start_x_screen < float(WIDTH):
             if self.is_final and self.ramp_overlay_texture:
-                blit_x = self.screen_spawn_x
+                blit_x = start_x_screen
                 blit_y = y_top_end_screen 
                 surface.blit(self.ramp_overlay_texture, (blit_x, blit_y))
             else:
-                p1 = (self.screen_spawn_x, y_top_start_screen)
-                p2 = (self.end_x_screen, y_top_end_screen)
-                p3 = (self.end_x_screen, y_top_end_screen + self.thickness)
-                p4 = (self.screen_spawn_x, y_top_start_screen + self.thickness)
+                p1 = (start_x_screen, y_top_start_screen)
+                p2 = (end_x_screen, y_top_end_screen)
+                p3 = (end_x_screen, y_top_end_screen + self.thickness)
+                p4 = (start_x_screen, y_top_start_screen + self.thickness)
                 pygame.draw.polygon(surface, (180, 180, 190), [p1, p2, p3, p4])
 
     def on_ramp(self, player_x_pos_float):
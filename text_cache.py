@@ -0,0 +1,93 @@
+# text_cache.py
+from collections import OrderedDict
+import config
+
+_texts = OrderedDict()
+_layouts = OrderedDict()
+_hits = 0
+_misses = 0
+_evictions = 0
+
+
+def render(font, text, color, antialias=True):
+    global _hits, _misses, _evictions
+    key = (font, text, tuple(color), antialias)
+    text_surf = _texts.get(key)
+    if text_surf is not None:
+        _hits += 1
+        _texts.move_to_end(key)
+        return text_surf
+
+    _misses += 1
+    text_surf = font.render(text, antialias, color)
+    _texts[key] = text_surf
+    while len(_texts) > config.TEXT_CACHE_MAX_ENTRIES:
+        _texts.popitem(last=False)
+        _evictions += 1
+    return text_surf
+
+
+def _wrap_lines(text, font, max_width):
+    words = text.split(' ')
+    lines = []
+    current_line = ""
+    if not words or words == ['']: return [""]
+
+    for word in words:
+        potential_line = current_line + (" " if current_line else "") + word
+        if font.size(potential_line)[0] <= max_width:
+            current_line = potential_line
+        else:
+            if current_line:
+                lines.append(current_line)
+            current_line = word
+            if font.size(current_line)[0] > max_width:
+                temp_word = ""
+                for char_idx in range(len(current_line)):
+                    if font.size(temp_word + current_line[char_idx] + "..")[0] <= max_width:
+                        temp_word += current_line[char_idx]
+                    else:
+                        break
+                lines.append(temp_word + ".." if temp_word else current_line[:1] + "..")
+                current_line = ""
+
+    if current_line:
+        lines.append(current_line)
+
+    return lines if lines else [""]
+
+
+def wrap(text, font, max_width):
+    key = (text, font, max_width)
+    lines = _layouts.get(key)
+    if lines is not None:
+        _layouts.move_to_end(key)
+        return lines
+    lines = tuple(_wrap_lines(text, font, max_width))
+    _layouts[key] = lines
+    while len(_layouts) > config.TEXT_CACHE_MAX_LAYOUTS:
+        _layouts.popitem(last=False)
+    return lines
+
+
+def hit_rate():
+    lookups = _hits + _misses
+    return _hits / lookups if lookups else 0.0
+
+
+def stats():
+    return {"entries": len(_texts), "layouts": len(_layouts), "hits": _hits, "misses": _misses,
+            "evictions": _evictions, "hit_rate": hit_rate()}
+
+
+def report():
+    s = stats()
+    print(f"Text cache: {s['entries']} entries, {s['layouts']} layouts, {s['hits']} hits, {s['misses']} misses, "
+          f"{s['evictions']} evictions, hit rate {s['hit_rate'] * 100:.1f}%")
+
+
+def clear():
+    global _hits, _misses, _evictions
+    _texts.clear()
+    _layouts.clear()
+    _hits = _misses = _evictions = 0
@@ -1,5 +1,6 @@
 # ui.py
 import pygame
+import text_cache
 
 
 def draw_menu(screen, title_font, font, menu_bg_frames, menu_frame_idx, menu_options, current_menu_idx, WIDTH, HEIGHT):
@@ -11,16 +12,16 @@ def draw_menu(screen, title_font, font, menu_bg_frames, menu_frame_idx, menu_opt
         screen.blit(current_frame_surface, (0, 0))
 
     if title_font:
-        title_text_surf = title_font.render("Zephyr Odyssey", True, (255, 255, 255))
+        title_text_surf = text_cache.render(title_font, "Zephyr Odyssey", (255, 255, 255))
         screen.blit(title_text_surf, ((WIDTH - title_text_surf.get_width()) // 2, HEIGHT // 4))
 
     if font:
         for i, option_text in enumerate(menu_options):
             color = (255, 255, 255) if i == current_menu_idx else (180, 180, 180)
-            text_surf = font.render(option_text, True, color)
+            text_surf = text_cache.render(font, option_text, color)
             screen.blit(text_surf, ((WIDTH - text_surf.get_width()) // 2, HEIGHT // 2 + i * 40))
 
-        hint_text_surf = font.render("Up/Down: Navigate   Enter: Select", True, (180, 180, 180))
+        hint_text_surf = text_cache.render(font, "Up/Down: Navigate   Enter: Select", (180, 180, 180))
         screen.blit(hint_text_surf, ((WIDTH - hint_text_surf.get_width()) // 2, HEIGHT - 60))
 
     pygame.display.flip()
@@ -33,9 +34,9 @@ def draw_controls(screen, font, WIDTH, HEIGHT):
              "F: Shoot Rocks (Aimbot, Limited Ammo)",
              "Activate all checkpoints to win!"]
     for i, line_text in enumerate(lines):
-        text_surf = font.render(line_text, True, (220, 220, 220))
+        text_surf = text_cache.render(font, line_text, (220, 220, 220))
         screen.blit(text_surf, (WIDTH // 4, HEIGHT // 4 + i * 30))
-    back_text_surf = font.render("Enter/Esc: Back", True, (180, 180, 180))
+    back_text_surf = text_cache.render(font, "Enter/Esc: Back", (180, 180, 180))
     screen.blit(back_text_surf, ((WIDTH - back_text_surf.get_width()) // 2, HEIGHT - 60))
     pygame.display.flip()
 
@@ -46,17 +47,17 @@ def draw_settings(screen, font, music_volume_percent_str, WIDTH, HEIGHT):
              f"Volume: {music_volume_percent_str}",
              "←/→ Adjust Volume"]
     for i, line_text in enumerate(lines):
-        text_surf = font.render(line_text, True, (220, 220, 220))
+        text_surf = text_cache.render(font, line_text, (220, 220, 220))
         screen.blit(text_surf, (WIDTH // 4, HEIGHT // 4 + i * 30))
-    back_text_surf = font.render("Enter/Esc: Back", True, (180, 180, 180))
+    back_text_surf = text_cache.render(font, "Enter/Esc: Back", (180, 180, 180))
     screen.blit(back_text_surf, ((WIDTH - back_text_surf.get_width()) // 2, HEIGHT - 60))
     pygame.display.flip()
 
 
 def draw_failed_screen(screen, title_font, font, WIDTH, HEIGHT):
     screen.fill((0, 0, 0))
-    fail_msg1_surf = title_font.render("Level Failed!", True, (255, 0, 0))
-    fail_msg2_surf = font.render("Press Enter to Retry or Q to Quit to Menu", True, (255, 255, 255))
+    fail_msg1_surf = text_cache.render(title_font, "Level Failed!", (255, 0, 0))
+    fail_msg2_surf = text_cache.render(font, "Press Enter to Retry or Q to Quit to Menu", (255, 255, 255))
     screen.blit(fail_msg1_surf, ((WIDTH - fail_msg1_surf.get_width()) // 2, HEIGHT // 2 - 30))
     screen.blit(fail_msg2_surf, ((WIDTH - fail_msg2_surf.get_width()) // 2, HEIGHT // 2 + 30))
     pygame.display.flip()
@@ -70,13 +71,13 @@ def draw_pause_menu(screen, title_font, font, pause_menu_options_list, current_p
     overlay_surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
     overlay_surf.fill((0, 0, 0, 150))
     screen.blit(overlay_surf, (0, 0))
-    paused_title_surf = title_font.render("Paused", True, (255, 255, 255))
+    paused_title_surf = text_cache.render(title_font, "Paused", (255, 255, 255))
     screen.blit(paused_title_surf, ((WIDTH - paused_title_surf.get_width()) // 2, HEIGHT // 4))
     for i, option_text in enumerate(pause_menu_options_list):
         color = (255, 255, 255) if i == current_pause_idx else (180, 180, 180)
-        text_surf = font.render(option_text, True, color)
+        text_surf = text_cache.render(font, option_text, color)
         screen.blit(text_surf, ((WIDTH - text_surf.get_width()) // 2, HEIGHT // 2 - 40 + i * 40))
-    hint_text_surf = font.render("Up/Down: Navigate   Enter: Select", True, (180, 180, 180))
+    hint_text_surf = text_cache.render(font, "Up/Down: Navigate   Enter: Select", (180, 180, 180))
     screen.blit(hint_text_surf, ((WIDTH - hint_text_surf.get_width()) // 2, HEIGHT - 60))
     pygame.display.flip()
 
@@ -91,12 +92,12 @@ def draw_tutorial_ui_elements(screen, tutorial_font, font, player_obj, tutorial_
     else:
         instruction_text = "Tutorial Complete! Starting game..."
     if instruction_text:
-        text_surf = tutorial_font.render(instruction_text, True, (220, 220, 255))
+        text_surf = text_cache.render(tutorial_font, instruction_text, (220, 220, 255))
         text_rect = text_surf.get_rect(center=(WIDTH // 2, HEIGHT // 3))
         screen.blit(text_surf, text_rect)
     if player_obj:
-        bullet_hud_text = font.render(f"Bullets: {player_obj.bullets_remaining}/{MAX_BULLETS_CONST}", True,
-                                      (220, 220, 220))
+        bullet_hud_text = text_cache.render(font, f"Bullets: {player_obj.bullets_remaining}/{MAX_BULLETS_CONST}",
+                                            (220, 220, 220))
         screen.blit(bullet_hud_text, (20, 20))
 
 
@@ -106,7 +107,7 @@ def draw_credits_screen(screen, font, title_font_main_menu, credits_text_list, s
     
     credits_title_text = "CREDITS"
     
-    title_surf = title_font_main_menu.render(credits_title_text, True, (220, 220, 255))
+    title_surf = text_cache.render(title_font_main_menu, credits_title_text, (220, 220, 255))
     title_rect = title_surf.get_rect(center=(WIDTH // 2, 70)) 
     screen.blit(title_surf, title_rect)
 
@@ -114,7 +115,7 @@ def draw_credits_screen(screen, font, title_font_main_menu, credits_text_list, s
     initial_text_y_start_position = HEIGHT + line_height
 
     for i, line_text in enumerate(credits_text_list):
-        text_surf = font.render(line_text, True, (200, 200, 220))
+        text_surf = text_cache.render(font, line_text, (200, 200, 220))
         text_rect = text_surf.get_rect(centerx=WIDTH // 2)
        
         text_rect.centery = int(initial_text_y_start_position + (i * line_height) - scroll_y)
@@ -123,5 +124,5 @@ def draw_credits_screen(screen, font, title_font_main_menu, credits_text_list, s
         if text_rect.bottom > 0 and text_rect.top < HEIGHT:
             screen.blit(text_surf, text_rect)
 
-    hint_text_surf = font.render("Press Enter/Esc to Return to Menu", True, (180, 180, 180))
+    hint_text_surf = text_cache.render(font, "Press Enter/Esc to Return to Menu", (180, 180, 180))
     screen.blit(hint_text_surf, ((WIDTH - hint_text_surf.get_width()) // 2, HEIGHT - 40))
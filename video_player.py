@@ -2,10 +2,135 @@
 import pygame
 import cv2 
 import numpy
+import threading
+import os
+import sys
+import struct
+import shutil
+import hashlib
+from collections import deque
+import config
+import asset_registry
+
+FRAME_CACHE_MAGIC = b"ZFC1"
+FRAME_CACHE_HEADER = struct.Struct("<4sIIId")
+LEVEL_BACKGROUND_VIDEO_FILES = ("background.mp4", "Background2.mp4")
+
+_cache_builds = {}
+_cache_builds_lock = threading.Lock()
+
+
+def get_frame_cache_path(video_path, target_size):
+    try:
+        stat = os.stat(video_path)
+    except OSError:
+        return None
+    key = f"{os.path.abspath(video_path)}|{stat.st_mtime_ns}|{stat.st_size}|{target_size[0]}x{target_size[1]}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    cache_dir = os.path.join(os.path.dirname(os.path.abspath(video_path)), config.VIDEO_FRAME_CACHE_DIR_NAME)
+    base_name = os.path.splitext(os.path.basename(video_path))[0]
+    return os.path.join(cache_dir, f"{base_name}-{target_size[0]}x{target_size[1]}-{digest}.rgb")
+
+
+def build_frame_cache(video_path, target_size, max_bytes=None):
+    cache_path = get_frame_cache_path(video_path, target_size)
+    if cache_path is None:
+        return None
+    if os.path.exists(cache_path):
+        return cache_path
+
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        print(f"Frame cache: could not open {video_path}")
+        return None
+    width, height = int(target_size[0]), int(target_size[1])
+    estimated_bytes = int(cap.get(cv2.CAP_PROP_FRAME_COUNT)) * width * height * 3
+    if max_bytes is not None and estimated_bytes > max_bytes:
+        print(f"Frame cache: skipping {video_path}, needs {estimated_bytes / 1e6:.0f} MB "
+              f"(limit {max_bytes / 1e6:.0f} MB)")
+        cap.release()
+        return None
+    cache_dir = os.path.dirname(cache_path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        free_bytes = shutil.disk_usage(cache_dir).free
+    except OSError as e:
+        print(f"Frame cache: cannot use {cache_dir}: {e}")
+        cap.release()
+        return None
+    if estimated_bytes > free_bytes:
+        print(f"Frame cache: skipping {video_path}, needs {estimated_bytes / 1e6:.0f} MB "
+              f"but only {free_bytes / 1e6:.0f} MB free")
+        cap.release()
+        return None
+    fps = cap.get(cv2.CAP_PROP_FPS)
+
+    temp_path = cache_path + ".tmp"
+    frame_count = 0
+    try:
+        with open(temp_path, "wb") as cache_file:
+            cache_file.write(FRAME_CACHE_HEADER.pack(FRAME_CACHE_MAGIC, width, height, 0, fps))
+            while True:
+                ret, frame_bgr = cap.read()
+                if not ret or frame_bgr is None:
+                    break
+                frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
+                frame_resized = cv2.resize(frame_rgb, (width, height), interpolation=cv2.INTER_LINEAR)
+                cache_file.write(numpy.ascontiguousarray(frame_resized).tobytes())
+                frame_count += 1
+            cache_file.seek(0)
+            cache_file.write(FRAME_CACHE_HEADER.pack(FRAME_CACHE_MAGIC, width, height, frame_count, fps))
+        if frame_count == 0:
+            os.remove(temp_path)
+            print(f"Frame cache: no frames decoded from {video_path}")
+            return None
+        os.replace(temp_path, cache_path)
+        print(f"Frame cache: wrote {frame_count} frames for {video_path} to {cache_path}")
+        return cache_path
+    except (OSError, cv2.error) as e:
+        print(f"Frame cache: error building cache for {video_path}: {e}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return None
+    finally:
+        cap.release()
+
+
+def request_frame_cache(video_path, target_size):
+    cache_path = get_frame_cache_path(video_path, target_size)
+    if cache_path is None:
+        return None
+    if os.path.exists(cache_path):
+        return cache_path
+    with _cache_builds_lock:
+        if cache_path not in _cache_builds:
+            build_thread = threading.Thread(target=build_frame_cache,
+                                            args=(video_path, target_size, config.VIDEO_FRAME_CACHE_MAX_BYTES),
+                                            name=f"FrameCacheBuild-{video_path}", daemon=True)
+            _cache_builds[cache_path] = build_thread
+            build_thread.start()
+            print(f"Frame cache: building cache for {video_path} in the background")
+    return None
+
+
+def open_frame_cache(cache_path, target_size):
+    try:
+        with open(cache_path, "rb") as cache_file:
+            magic, width, height, frame_count, fps = FRAME_CACHE_HEADER.unpack(
+                cache_file.read(FRAME_CACHE_HEADER.size))
+        if magic != FRAME_CACHE_MAGIC or (width, height) != (int(target_size[0]), int(target_size[1])) or \
+                frame_count <= 0:
+            print(f"Frame cache: ignoring invalid cache file {cache_path}")
+            return None
+        return numpy.memmap(cache_path, dtype=numpy.uint8, mode="r", offset=FRAME_CACHE_HEADER.size,
+                            shape=(frame_count, height, width, 3))
+    except (OSError, ValueError, struct.error) as e:
+        print(f"Frame cache: error opening {cache_path}: {e}")
+        return None
 
 
 class VideoPlayer:
-    def __init__(self, video_path, target_size, forced_fps=None):
+    def __init__(self, video_path, target_size, forced_fps=None, decode_ahead=False, frame_cache=False):
         self.video_path = video_path
         self.target_size = target_size
         self.cap = None
@@ -18,6 +143,22 @@ class VideoPlayer:
         
         self.current_decoded_frame_number = -1
 
+        self.decode_ahead = decode_ahead
+        self._decode_thread = None
+        self._decode_cond = threading.Condition()
+        self._ring = deque()
+        self._ring_size = max(1, config.VIDEO_DECODE_AHEAD_FRAMES)
+        self._decode_position = 0
+        self._decode_needs_seek = False
+        self._seek_request = None
+        self._stop_decoding = False
+        self.frames_decoded = 0
+        self.frames_skipped = 0
+        self.underruns = 0
+        self.seeks = 0
+        self._cached_frames = None
+        self.frame_cache = frame_cache
+
         try:
             self.cap = cv2.VideoCapture(self.video_path)
             if not self.cap.isOpened():
@@ -41,6 +182,9 @@ class VideoPlayer:
                     print(
                         f"Video loaded: {self.video_path}, FPS: {self.fps} (FALLBACK, OpenCV reported {reported_fps}), Frames: {self.total_frames}")
 
+            if frame_cache and self.fps > 0 and self._load_frame_cache():
+                return
+
             if self.total_frames > 0 and self.fps > 0:
                 self.is_playing = True
              
@@ -50,6 +194,8 @@ class VideoPlayer:
                     self.current_decoded_frame_number = 0
                     self.current_frame_surface = self._process_bgr_frame(frame_bgr)
                     self.frame_count_for_current_playthrough = 1
+                    if self.decode_ahead:
+                        self._start_decode_thread(1)
                 else:
                     print(f"Warning: Could not read initial frame from {self.video_path}")
                     self.is_playing = False
@@ -77,6 +223,115 @@ class VideoPlayer:
             print(f"OpenCV error during frame processing: {e}")
             return None
 
+    def _load_frame_cache(self):
+        cache_path = request_frame_cache(self.video_path, self.target_size)
+        cached_frames = open_frame_cache(cache_path, self.target_size) if cache_path else None
+        if cached_frames is None:
+            return False
+        self._stop_decode_thread()
+        if self.cap:
+            self.cap.release()
+        self.cap = None
+        self._cached_frames = cached_frames
+        self.total_frames = len(cached_frames)
+        self.is_playing = True
+        self.current_decoded_frame_number = 0
+        self.current_frame_surface = self._cached_frame_surface(0)
+        self.frame_count_for_current_playthrough = 1
+        print(f"Video {self.video_path}: playing {self.total_frames} frames from memory-mapped cache")
+        return True
+
+    def _cached_frame_surface(self, frame_index):
+        return pygame.image.frombuffer(self._cached_frames[frame_index], self.target_size, "RGB")
+
+    def _start_decode_thread(self, start_frame_index):
+        self._stop_decoding = False
+        self._ring.clear()
+        self._seek_request = None
+        self._decode_position = start_frame_index % self.total_frames
+        self._decode_needs_seek = False
+        self._decode_thread = threading.Thread(target=self._decode_loop, name=f"VideoDecode-{self.video_path}",
+                                               daemon=True)
+        self._decode_thread.start()
+
+    def _stop_decode_thread(self):
+        if self._decode_thread is None:
+            return
+        with self._decode_cond:
+            self._stop_decoding = True
+            self._decode_cond.notify_all()
+        self._decode_thread.join()
+        self._decode_thread = None
+        self._ring.clear()
+
+    def _decode_loop(self):
+        cap = self.cap
+        while True:
+            with self._decode_cond:
+                while not self._stop_decoding and self._seek_request is None and len(self._ring) >= self._ring_size:
+                    self._decode_cond.wait()
+                if self._stop_decoding:
+                    return
+                if self._seek_request is not None:
+                    position = self._seek_request
+                    self._seek_request = None
+                    needs_seek = True
+                else:
+                    position = self._decode_position
+                    needs_seek = self._decode_needs_seek
+            try:
+                if needs_seek:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, position)
+                ret, frame_bgr = cap.read()
+                surface = self._process_bgr_frame(frame_bgr) if ret else None
+            except cv2.error as e:
+                print(f"OpenCV error in decode thread for {self.video_path}: {e}")
+                ret, surface = False, None
+
+            with self._decode_cond:
+                if self._stop_decoding:
+                    return
+                if self._seek_request is not None:
+                    continue
+                if ret and surface is not None:
+                    self._ring.append((position, surface))
+                    self.frames_decoded += 1
+                    next_position = position + 1
+                else:
+                    next_position = self.total_frames
+                if next_position >= self.total_frames:
+                    self._decode_position = 0
+                    self._decode_needs_seek = True
+                else:
+                    self._decode_position = next_position
+                    self._decode_needs_seek = False
+                self._decode_cond.notify_all()
+
+    def _take_prefetched_frame(self, target_frame_index):
+        with self._decode_cond:
+            for ring_pos, (frame_index, surface) in enumerate(self._ring):
+                if frame_index == target_frame_index:
+                    for _ in range(ring_pos + 1):
+                        self._ring.popleft()
+                    self.frames_skipped += ring_pos
+                    self._decode_cond.notify_all()
+                    return surface
+
+            self.underruns += 1
+            next_decoded = self._decode_position if self._seek_request is None else self._seek_request
+            frames_until_decoded = (target_frame_index - next_decoded) % self.total_frames
+            if frames_until_decoded >= self._ring_size:
+                self._seek_request = target_frame_index
+                self.seeks += 1
+            self._ring.clear()
+            self._decode_cond.notify_all()
+            return None
+
+    def decode_stats(self):
+        with self._decode_cond:
+            return {"frames_decoded": self.frames_decoded, "frames_skipped": self.frames_skipped,
+                    "underruns": self.underruns, "seeks": self.seeks, "buffered": len(self._ring)}
+
     def get_frame_at_time(self, time_ms):
         if not self.is_valid():
             return self.current_frame_surface
@@ -99,6 +354,18 @@ class VideoPlayer:
                 
                 return self.current_frame_surface
 
+            elif self._cached_frames is not None:
+                self.current_frame_surface = self._cached_frame_surface(target_frame_index)
+                self.current_decoded_frame_number = target_frame_index
+                return self.current_frame_surface
+
+            elif self._decode_thread is not None:
+                surface = self._take_prefetched_frame(target_frame_index)
+                if surface is not None:
+                    self.current_frame_surface = surface
+                    self.current_decoded_frame_number = target_frame_index
+                return self.current_frame_surface
+
             
             elif target_frame_index == self.current_decoded_frame_number + 1:
             
@@ -126,14 +393,23 @@ class VideoPlayer:
         return self.current_frame_surface
 
     def release(self):
+        decode_ahead_active = self._decode_thread is not None
+        self._stop_decode_thread()
         if self.cap:
             self.cap.release()
         self.is_playing = False
         self.cap = None
+        self._cached_frames = None
         print(f"VideoPlayer {self.video_path} released.")
+        if decode_ahead_active:
+            stats = self.decode_stats()
+            print(f"VideoPlayer {self.video_path} decode-ahead: {stats['frames_decoded']} decoded, "
+                  f"{stats['frames_skipped']} skipped, {stats['underruns']} underruns, {stats['seeks']} seeks")
 
     def is_valid(self):
         
+        if self._cached_frames is not None:
+            return self.is_playing and self.total_frames > 0 and self.fps > 0
         return self.cap is not None and self.cap.isOpened() and self.is_playing and self.total_frames > 0 and self.fps > 0
 
     def is_one_playthrough_done(self):
@@ -142,9 +418,21 @@ class VideoPlayer:
         return self.frame_count_for_current_playthrough >= self.total_frames
 
     def reset_playthrough_counter(self):
+        if self.frame_cache and self._cached_frames is None and self.fps > 0 and self._load_frame_cache():
+            return
         self.frame_count_for_current_playthrough = 0
         self.current_decoded_frame_number = -1  
-        if self.cap and self.cap.isOpened():  
+        if self._cached_frames is not None:
+            self.current_decoded_frame_number = 0
+            self.current_frame_surface = self._cached_frame_surface(0)
+            self.frame_count_for_current_playthrough = 1
+        elif self._decode_thread is not None:
+            surface = self._take_prefetched_frame(0)
+            if surface is not None:
+                self.current_decoded_frame_number = 0
+                self.current_frame_surface = surface
+                self.frame_count_for_current_playthrough = 1
+        elif self.cap and self.cap.isOpened():  
             try:
                 self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
                 ret, frame_bgr = self.cap.read()
@@ -167,7 +455,27 @@ class VideoPlayer:
                 self.total_frames = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
               
                 self.reset_playthrough_counter() 
+                if self.decode_ahead and self.current_decoded_frame_number == 0 and self.total_frames > 0:
+                    self._start_decode_thread(1)
             else:
                 print(f"VideoPlayer: Failed to reopen {self.video_path} in reset.")
                 self.is_playing = False
-                self.cap = None 
\ No newline at end of file
+                self.cap = None 
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Pre-transcode level background videos into raw frame caches.")
+    parser.add_argument("videos", nargs="*", help="video files (defaults to the level background videos)")
+    parser.add_argument("--width", type=int, default=config.WIDTH)
+    parser.add_argument("--height", type=int, default=config.HEIGHT)
+    args = parser.parse_args()
+    video_paths = args.videos or [asset_registry.get_asset_path(name) for name in LEVEL_BACKGROUND_VIDEO_FILES]
+    failed = False
+    for path in video_paths:
+        if not os.path.exists(path):
+            print(f"Frame cache: {path} not found")
+            failed = True
+        elif build_frame_cache(path, (args.width, args.height)) is None:
+            failed = True
+    sys.exit(1 if failed else 0)